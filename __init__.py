@@ -16,6 +16,8 @@ bl_info = {
 }
 
 def register():
+    from .logger import LOG
+    LOG.start_writer()
     from . import import_module
     import_module.register()
     from . import preferences
@@ -30,6 +32,8 @@ def unregister():
     operators.unregister()
     preferences.unregister()
     import_module.unregister()
+    from .logger import LOG
+    LOG.stop_writer()
     
 
 if __name__ == "__main__":
@@ -0,0 +1,108 @@
+"""
+Micro-benchmark of the UMI batch planner against the previous implementation, runs with plain CPython.
+
+The legacy functions below reproduce UMI.sort_zipped_list, UMI.get_next_viable_file and UMI.next_batch
+as they were before core.batch_planner, without the operator around them.
+
+usage : python benchmark/bench_batch_planner.py [--files 1000 5000 20000] [--max-batch-size 20] [--max-count 200] [--seed 0]
+"""
+import argparse, random, sys, time
+from os import path
+
+ADDON_ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+sys.path.insert(0, ADDON_ROOT)
+
+from core import plan_batches
+
+def legacy_sort_zipped_list(zipped):
+    sorted_filepaths = []
+    for z in zipped:
+        if len(sorted_filepaths):
+            j = 0
+            for s in sorted_filepaths:
+                if s[0] > z[0]:
+                    j += 1
+                    continue
+                else:
+                    sorted_filepaths.insert(j, z)
+                    break
+            else:
+                sorted_filepaths.insert(j, z)
+        else:
+            sorted_filepaths.insert(0, z)
+
+    return sorted_filepaths
+
+def legacy_plan(files, max_batch_size, max_count, minimize_batch_number):
+    sizes = dict(files)
+    filepaths = [f for f, _ in files]
+    if max_batch_size and minimize_batch_number:
+        filepaths = [f for _, f in legacy_sort_zipped_list([(s, f) for f, s in files])]
+
+    def get_next_viable_file(initial_size, selected_files):
+        for f in filepaths:
+            if minimize_batch_number:
+                if initial_size + sizes[f] > max_batch_size:
+                    if len(selected_files):
+                        continue
+                return f
+            else:
+                return f
+        return None
+
+    batches = []
+    while len(filepaths):
+        current_files = []
+        current_size = 0
+        for _ in range(max_count):
+            if not len(filepaths):
+                break
+            next_file = get_next_viable_file(current_size, current_files)
+            if next_file is not None:
+                next_filesize = sizes[next_file]
+            if next_file is None:
+                if len(current_files):
+                    break
+                next_file = filepaths.pop(0)
+            elif current_size + next_filesize > max_batch_size:
+                if len(current_files):
+                    break
+            current_size += next_filesize
+            filepaths.remove(next_file)
+            current_files.append(next_file)
+        batches.append((tuple(current_files), current_size))
+
+    return batches
+
+def generate_files(count, seed):
+    rng = random.Random(seed)
+    # Mostly small files with a long tail of big ones, as seen in asset libraries
+    return [(f'/assets/file_{i:06d}.fbx', min(rng.lognormvariate(0, 1.2), 200.0)) for i in range(count)]
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+def main():
+    parser = argparse.ArgumentParser(description='UMI batch planner benchmark')
+    parser.add_argument('--files', type=int, nargs='+', default=[1000, 5000, 20000])
+    parser.add_argument('--max-batch-size', type=float, default=20)
+    parser.add_argument('--max-count', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--skip-legacy-above', type=int, default=20000, help='do not run the legacy planner on bigger file counts')
+    args = parser.parse_args()
+
+    for minimize in (False, True):
+        print(f'minimize_batch_number={minimize}')
+        for count in args.files:
+            files = generate_files(count, args.seed)
+            new_duration, new_plan = timed(plan_batches, files, args.max_batch_size, args.max_count, minimize)
+            line = f'  {count:>7} files  planner {new_duration:8.4f}s {len(new_plan):>6} batches'
+            if count <= args.skip_legacy_above:
+                legacy_duration, legacy_batches = timed(legacy_plan, files, args.max_batch_size, args.max_count, minimize)
+                line += f'  |  legacy {legacy_duration:8.4f}s {len(legacy_batches):>6} batches  x{legacy_duration / max(new_duration, 1e-9):.0f}'
+            print(line)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Micro-benchmarks of the bpy-free core, runs with plain CPython and pytest-benchmark (no Blender needed).
+
+usage : python -m pytest benchmark/bench_core.py [--benchmark-sort=mean]
+"""
+import os, sys, shutil, tempfile
+from os import path
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+ADDON_ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+sys.path.insert(0, ADDON_ROOT)
+
+from core import FolderScanner, FormatResolver, MessageStore, NameRegistry, plan_batches, unique_name, unique_name_clean_func
+
+FORMATS = [(f'format_{i:02d}', {'name': f'format_{i:02d}', 'ext': [f'.f{i:02d}a', f'.f{i:02d}b', f'.f{i:02d}c'], 'operator': {'default': {'command': f'bpy.ops.import_scene.format_{i:02d}'}}}) for i in range(30)]
+EXTENSIONS = [ext for _, f in FORMATS for ext in f['ext']]
+
+
+@pytest.fixture(scope='module')
+def folder_tree():
+    root = tempfile.mkdtemp(prefix='umi_bench_')
+    for i in range(20):
+        folder = path.join(root, f'folder_{i:02d}', 'sub')
+        os.makedirs(folder)
+        for j in range(50):
+            with open(path.join(folder, f'file_{j:03d}{EXTENSIONS[j % len(EXTENSIONS)]}'), 'wb') as f:
+                f.write(b'0' * j)
+    yield root
+    shutil.rmtree(root)
+
+
+def test_scan_folder(benchmark, folder_tree):
+    records = benchmark(lambda: list(FolderScanner().scan(folder_tree, set(EXTENSIONS), recursion_depth=2)))
+    assert len(records) == 1000
+
+
+@pytest.mark.parametrize('minimize_batch_number', [False, True])
+def test_plan_batches(benchmark, minimize_batch_number):
+    files = [(f'file_{i}', (i * 7919) % 100 / 10) for i in range(5000)]
+    batches = benchmark(plan_batches, files, 20, 50, minimize_batch_number=minimize_batch_number)
+    assert sum(len(b.filepaths) for b in batches) == len(files)
+
+
+def test_unique_name_dict(benchmark):
+    def allocate():
+        names = {}
+        for i in range(2000):
+            unique_name(i, 'Cube.001', names, clean_func=unique_name_clean_func)
+        return names
+    assert len(set(benchmark(allocate).values())) == 2000
+
+
+def test_unique_name_registry(benchmark):
+    def allocate():
+        registry = NameRegistry()
+        for i in range(2000):
+            registry.unique_name(i, 'Cube.001', clean_func=unique_name_clean_func)
+        return registry
+    assert len(benchmark(allocate).used_names) == 2000
+
+
+def test_format_from_extension(benchmark):
+    resolver = FormatResolver(FORMATS)
+    benchmark(lambda: [resolver.format_from_extension(e) for e in EXTENSIONS])
+
+
+def test_message_store(benchmark):
+    def append():
+        store = MessageStore()
+        for i in range(5000):
+            store.append(f'UMI : INFO - Importing file {i} : ' + 'x' * (i % 400))
+        return store
+    assert benchmark(append).count == 5000
@@ -0,0 +1,93 @@
+"""
+Benchmark of the extension to format resolution, runs with plain CPython (no Blender needed).
+
+Resolves the format of each file of a synthetic selection, the way the file selection and the import do it :
+the previous linear lookup (membership test in the extension list, then a scan of each format extension list)
+against the frozen index of core.FormatResolver.
+
+usage : python benchmark/bench_formats.py [--files 100000] [--formats 20] [--repeat 5]
+"""
+import argparse, sys, time
+from os import path
+
+ADDON_ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+sys.path.insert(0, ADDON_ROOT)
+
+from core import FormatResolver
+
+def create_formats(format_count):
+    # Extension counts similar to the real definitions : a few formats with many extensions, most with one or two
+    formats = []
+    for i in range(format_count):
+        ext_count = 25 if i == 0 else (i % 3) + 1
+        ext = [f'.f{i:02d}{chr(97 + j % 26)}{j // 26}' for j in range(ext_count)]
+        formats.append((f'format_{i:02d}', {'name': f'format_{i:02d}', 'ext': ext, 'operator': {'default': {'command': f'bpy.ops.import_scene.format_{i:02d}', 'module': None}}}))
+    return formats
+
+def create_selection(formats, file_count):
+    extensions = [ext for _, f in formats for ext in f['ext']]
+    # Every 10th file has an upper case extension, as found on shares written by other OSes
+    return [f'file_{i:06d}' + (extensions[(i * 7919) % len(extensions)].upper() if i % 10 == 0 else extensions[(i * 7919) % len(extensions)]) for i in range(file_count)]
+
+class LinearResolver():
+    """
+    Lookup of CompatibleFormats before the index : list membership, then a scan of the formats
+    """
+    def __init__(self, formats):
+        self.formats = formats
+        self.extensions = [ext for _, f in formats for ext in f['ext']]
+
+    def format_from_extension(self, ext):
+        ext = ext.lower()
+        if ext not in self.extensions:
+            return None
+        for _, f in self.formats:
+            if ext in f['ext']:
+                return f
+
+    def operators_from_extension(self, ext):
+        f = self.format_from_extension(ext)
+        return None if f is None else dict(f['operator'])
+
+def resolve(resolver, filenames):
+    # store_formats_to_import and the import plans : format and module table of each file
+    formats = []
+    for filename in filenames:
+        ext = path.splitext(filename)[1]
+        formats.append((resolver.format_from_extension(ext)['name'], resolver.operators_from_extension(ext)))
+    return formats
+
+def run(resolver, filenames, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = resolve(resolver, filenames)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+def main():
+    parser = argparse.ArgumentParser(description='UMI extension to format resolution benchmark')
+    parser.add_argument('--files', type=int, default=100000)
+    parser.add_argument('--formats', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    formats = create_formats(args.formats)
+    filenames = create_selection(formats, args.files)
+    print(f'Selection : {len(filenames)} files, {len(formats)} formats, {sum(len(f["ext"]) for _, f in formats)} extensions')
+
+    start = time.perf_counter()
+    resolver = FormatResolver(formats)
+    print(f'Index built in {(time.perf_counter() - start) * 1000:.3f}ms')
+
+    linear_duration, linear_result = run(LinearResolver(formats), filenames, args.repeat)
+    index_duration, index_result = run(resolver, filenames, args.repeat)
+    identical = [(name, dict(ops)) for name, ops in linear_result] == [(name, dict(ops)) for name, ops in index_result]
+
+    for label, duration in (('linear', linear_duration), ('index', index_duration)):
+        print(f'{label:<7} {duration:.3f}s  {duration / len(filenames) * 1e6:.3f}us/file  x{linear_duration / duration:.1f}')
+    print('same output' if identical else 'DIFFERENT OUTPUT')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+"""
+Import benchmark of UMI, runs inside Blender with the add-on enabled.
+
+A synthetic corpus (see corpus.py) is generated, or an existing folder is used, then each UMI stage is timed :
+scan, selection population, batch planning, import, command batcher and logging.
+The result is appended to a JSON history file, to be compared with compare.py.
+
+usage : blender -b --python benchmark/bench_import.py -- [--corpus FOLDER] [--history benchmark/history.json] [--repeat 1]
+                                                          [--count 10] [--size 16] [--depth 1] [--width 2] [--seed 0] [--formats stl_binary obj ...]
+"""
+import argparse, importlib.util, json, os, shutil, subprocess, sys, tempfile, time
+from os import path
+
+import bpy
+
+BENCHMARK_FOLDER = path.dirname(path.abspath(__file__))
+ADDON_ROOT = path.dirname(BENCHMARK_FOLDER)
+sys.path.insert(0, BENCHMARK_FOLDER)
+
+from corpus import corpus_parser, generate_corpus
+
+DEFAULT_COMMANDS = ['bpy.ops.object.shade_smooth()']
+
+
+def import_addon():
+    # headless/cli.py knows how to find the name the add-on is registered with
+    spec = importlib.util.spec_from_file_location('umi_cli', path.join(ADDON_ROOT, 'headless', 'cli.py'))
+    cli = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(cli)
+    package = cli.find_addon_package()
+    if package is None:
+        print('UMI : Universal Multi Importer is not enabled in the preferences')
+        sys.exit(2)
+    return importlib.import_module(package)
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ADDON_ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_once(addon, corpus, depth, commands):
+    headless = importlib.import_module(f'{addon.__name__}.headless')
+    core = importlib.import_module(f'{addon.__name__}.core')
+    umi_const = importlib.import_module(f'{addon.__name__}.umi_const')
+    LOG = importlib.import_module(f'{addon.__name__}.logger').LOG
+
+    bpy.ops.wm.read_homefile(use_empty=True)
+    LOG.revert_parameters()
+    importer = headless.HeadlessImporter({'folders': [{'path': corpus, 'recursion_depth': depth}], 'commands': commands})
+    stages = {}
+
+    start = time.perf_counter()
+    filepaths = importer.collect_files()
+    stages['scan'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    selection = umi_const.get_umi_settings().umi_file_selection
+    selection.clear()
+    for f in filepaths:
+        item = selection.add()
+        item.name = f
+        item.ext = importer.file_records[f].ext
+    stages['selection'] = time.perf_counter() - start
+    selection.clear()
+
+    start = time.perf_counter()
+    batches = core.plan_batches([(f, importer.file_records[f].size_mb) for f in filepaths], 0, 0)
+    stages['planning'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    root_collection = bpy.context.scene.collection
+    objects = []
+    for batch in batches:
+        for f in batch.filepaths:
+            objects += importer.import_file(importer.file_records[f], root_collection)
+    stages['import'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    importer.command_errors = []
+    importer.post_process(objects)
+    stages['batcher'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for f in filepaths:
+        LOG.info(f'Benchmark log line : {f}')
+    stages['logging'] = time.perf_counter() - start
+
+    formats = {}
+    for r in importer.results:
+        key = f'{r["format"]}/{r["module"]}'
+        formats[key] = formats.get(key, 0) + r['seconds']
+
+    failed = [r['path'] for r in importer.results if r['status'] != core.FileStatus.SUCCEEDED]
+    return stages, formats, len(filepaths), failed
+
+
+def main():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    parser = argparse.ArgumentParser(description='UMI import benchmark', parents=[corpus_parser()])
+    parser.add_argument('--corpus', default=None, help='existing folder to import instead of a generated corpus')
+    parser.add_argument('--history', default=path.join(BENCHMARK_FOLDER, 'history.json'))
+    parser.add_argument('--repeat', type=int, default=1, help='the fastest run of each stage is kept')
+    parser.add_argument('--commands', nargs='*', default=DEFAULT_COMMANDS)
+    args = parser.parse_args(argv)
+
+    addon = import_addon()
+    corpus = args.corpus
+    temp_corpus = None
+    if corpus is None:
+        corpus = temp_corpus = tempfile.mkdtemp(prefix='umi_corpus_')
+        generate_corpus(corpus, args.count, args.size, args.depth, args.width, args.seed, args.formats)
+
+    try:
+        best_stages, best_formats = {}, {}
+        for _ in range(args.repeat):
+            stages, formats, file_count, failed = run_once(addon, corpus, args.depth, args.commands)
+            for k, v in stages.items():
+                best_stages[k] = min(v, best_stages.get(k, v))
+            for k, v in formats.items():
+                best_formats[k] = min(v, best_formats.get(k, v))
+    finally:
+        if temp_corpus is not None:
+            shutil.rmtree(temp_corpus, ignore_errors=True)
+
+    entry = {'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+             'commit': git_commit(),
+             'umi_version': list(addon.bl_info['version']),
+             'blender_version': bpy.app.version_string,
+             'corpus': {'folder': args.corpus, 'count': args.count, 'size': args.size, 'depth': args.depth, 'width': args.width, 'seed': args.seed, 'formats': args.formats},
+             'files': file_count,
+             'failed': failed,
+             'stages': best_stages,
+             'formats': best_formats}
+
+    history = []
+    if path.exists(args.history):
+        with open(args.history, 'r', encoding='utf-8') as f:
+            history = json.load(f)
+    history.append(entry)
+    with open(args.history, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=1)
+
+    for k, v in best_stages.items():
+        print(f'{k:<10} {v:.4f}s')
+    print(f'{file_count} files, {len(failed)} failed - result appended to {args.history}')
+
+
+if __name__ == '__main__':
+    main()
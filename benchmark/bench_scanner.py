@@ -0,0 +1,96 @@
+"""
+Benchmark of the UMI folder scanner, runs with plain CPython (no Blender needed).
+
+A synthetic deep tree is generated on tmpfs (/dev/shm when available) and os.scandir is wrapped
+in a shim adding an artificial latency to each call, to mimic the round-trip of SMB/NFS shares.
+
+usage : python benchmark/bench_scanner.py [--depth 4] [--width 4] [--files 20] [--latency 0.005] [--threads 1 4 8 16]
+"""
+import argparse, os, shutil, sys, tempfile, time
+from os import path
+
+ADDON_ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+sys.path.insert(0, ADDON_ROOT)
+
+from core import FolderScanner
+
+EXTENSIONS = ['.fbx', '.obj', '.stl', '.txt']
+COMPATIBLE_EXTENSIONS = {'.fbx', '.obj', '.stl'}
+
+def create_tree(root, depth, width, files):
+    folder_count = 0
+    folders = [root]
+    for level in range(depth + 1):
+        next_folders = []
+        for folder in folders:
+            folder_count += 1
+            for i in range(files):
+                ext = EXTENSIONS[i % len(EXTENSIONS)]
+                with open(path.join(folder, f'file_{i:04d}{ext}'), 'wb') as f:
+                    f.write(b'0' * (i + 1))
+            if level == depth:
+                continue
+            for i in range(width):
+                subfolder = path.join(folder, f'folder_{i:02d}')
+                os.mkdir(subfolder)
+                next_folders.append(subfolder)
+        folders = next_folders
+
+    return folder_count
+
+class LatencyShim():
+    def __init__(self, latency):
+        self.latency = latency
+        self.original_scandir = os.scandir
+
+    def scandir(self, *args, **kwargs):
+        time.sleep(self.latency)
+        return self.original_scandir(*args, **kwargs)
+
+    def __enter__(self):
+        os.scandir = self.scandir
+        return self
+
+    def __exit__(self, *args):
+        os.scandir = self.original_scandir
+
+def run(root, depth, thread_count, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = [r.path for r in FolderScanner(thread_count=thread_count).scan(root, COMPATIBLE_EXTENSIONS, recursion_depth=depth)]
+        timings.append(time.perf_counter() - start)
+
+    return min(timings), result
+
+def main():
+    parser = argparse.ArgumentParser(description='UMI folder scanner benchmark')
+    parser.add_argument('--depth', type=int, default=4)
+    parser.add_argument('--width', type=int, default=4)
+    parser.add_argument('--files', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.005, help='artificial latency added to each os.scandir call, in seconds')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4, 8, 16])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    tmp_root = '/dev/shm' if path.isdir('/dev/shm') else None
+    root = tempfile.mkdtemp(prefix='umi_bench_scanner_', dir=tmp_root)
+    try:
+        folder_count = create_tree(root, args.depth, args.width, args.files)
+        print(f'Tree : {folder_count} folders, {folder_count * args.files} files in {root}')
+        print(f'Latency per listing : {args.latency * 1000}ms')
+
+        reference = None
+        with LatencyShim(args.latency):
+            for thread_count in args.threads:
+                duration, result = run(root, args.depth, thread_count, args.repeat)
+                if reference is None:
+                    reference = (duration, result)
+                identical = 'same output' if result == reference[1] else 'DIFFERENT OUTPUT'
+                print(f'threads={thread_count:<3} {len(result)} files  {duration:.3f}s  x{reference[0] / duration:.1f}  ({identical})')
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
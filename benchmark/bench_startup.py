@@ -0,0 +1,67 @@
+"""
+Registration benchmark of UMI, runs inside Blender with the add-on enabled.
+
+The add-on is disabled, its modules are dropped from sys.modules, then it is enabled again, with and without the format schema cache :
+cold (cache file deleted, every importer is probed and its properties read) and warm (both are read from the cache).
+
+usage : blender -b --python benchmark/bench_startup.py -- [--repeat 3]
+"""
+import argparse, importlib.util, os, sys, time
+from os import path
+
+import addon_utils
+import bpy
+
+BENCHMARK_FOLDER = path.dirname(path.abspath(__file__))
+ADDON_ROOT = path.dirname(BENCHMARK_FOLDER)
+
+
+def find_package():
+    # headless/cli.py knows how to find the name the add-on is registered with
+    spec = importlib.util.spec_from_file_location('umi_cli', path.join(ADDON_ROOT, 'headless', 'cli.py'))
+    cli = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(cli)
+    package = cli.find_addon_package()
+    if package is None:
+        print('UMI : Universal Multi Importer is not enabled in the preferences')
+        sys.exit(2)
+    return package
+
+
+def purge(package):
+    for name in [m for m in sys.modules if m == package or m.startswith(f'{package}.')]:
+        del sys.modules[name]
+
+
+def enable(package, cold):
+    addon_utils.disable(package, default_set=True)
+    purge(package)
+    if cold:
+        schema_file = path.join(importlib.import_module(f'{package}.umi_const').CACHE_PATH, 'format_schema.json')
+        if path.exists(schema_file):
+            os.remove(schema_file)
+        purge(package)
+
+    start = time.perf_counter()
+    addon_utils.enable(package, default_set=True)
+    return time.perf_counter() - start
+
+
+def main():
+    args = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    parser = argparse.ArgumentParser(description='UMI registration benchmark')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(args)
+
+    package = find_package()
+    results = {'cold': [], 'warm': []}
+    for _ in range(args.repeat):
+        results['cold'].append(enable(package, cold=True))
+        results['warm'].append(enable(package, cold=False))
+
+    for label, timings in results.items():
+        print(f'enable {label:<5} min {min(timings) * 1000:.1f}ms  max {max(timings) * 1000:.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Compare the last import benchmark result with the previous ones, runs with plain CPython.
+
+The baseline of each stage is the median of the previous --window results run on the same corpus.
+A stage is flagged when it is slower than its baseline by more than --threshold percent and --min-seconds.
+The exit code is 1 when a regression is found, so this can gate a release.
+
+usage : python benchmark/compare.py [--history benchmark/history.json] [--window 5] [--threshold 10] [--min-seconds 0.01]
+"""
+import argparse, json, statistics, sys
+from os import path
+
+BENCHMARK_FOLDER = path.dirname(path.abspath(__file__))
+
+
+def compare(history, window, threshold, min_seconds):
+    """[(name, baseline, current, change_percent, regressed)] comparing the last entry of *history* with its baseline"""
+    current = history[-1]
+    previous = [h for h in history[:-1] if h['corpus'] == current['corpus']][-window:]
+    if not len(previous):
+        return []
+
+    rows = []
+    for group in ('stages', 'formats'):
+        for name, seconds in current[group].items():
+            samples = [h[group][name] for h in previous if name in h[group]]
+            if not len(samples):
+                continue
+            baseline = statistics.median(samples)
+            change = (seconds - baseline) * 100 / baseline if baseline > 0 else 0.0
+            regressed = change > threshold and seconds - baseline > min_seconds
+            rows.append((f'{group[:-1]}:{name}', baseline, seconds, change, regressed))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Flag import benchmark regressions')
+    parser.add_argument('--history', default=path.join(BENCHMARK_FOLDER, 'history.json'))
+    parser.add_argument('--window', type=int, default=5)
+    parser.add_argument('--threshold', type=float, default=10.0, help='percent')
+    parser.add_argument('--min-seconds', type=float, default=0.01)
+    args = parser.parse_args()
+
+    with open(args.history, 'r', encoding='utf-8') as f:
+        history = json.load(f)
+
+    rows = compare(history, args.window, args.threshold, args.min_seconds)
+    if not len(rows):
+        print('No previous result on the same corpus to compare with')
+        return 0
+
+    print(f'{"":<28} {"baseline":>10} {"current":>10} {"change":>8}')
+    for name, baseline, current, change, regressed in rows:
+        print(f'{name:<28} {baseline:>9.4f}s {current:>9.4f}s {change:>7.1f}%{"  REGRESSION" if regressed else ""}')
+
+    regressions = [r for r in rows if r[4]]
+    if len(regressions):
+        print(f'{len(regressions)} regression(s) found')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,254 @@
+"""
+Deterministic synthetic asset corpus for the import benchmarks.
+
+Every file is derived from --seed, so two runs with the same arguments produce byte identical corpora.
+Meshes are bumpy grids of --size x --size quads, images are --size x --size pixels (x4).
+Files are spread in a folder tree --depth levels deep, --width folders per level.
+.blend files need Blender : they are only generated when this script runs inside it.
+
+usage : python benchmark/corpus.py OUTPUT [--count 10] [--size 16] [--depth 1] [--width 2] [--seed 0] [--formats stl obj ...]
+    or : blender -b --python benchmark/corpus.py -- OUTPUT ...
+"""
+import argparse, base64, json, math, os, random, struct, sys, zlib
+from os import path
+
+FORMATS = ('stl_binary', 'stl_ascii', 'obj', 'ply_ascii', 'ply_binary', 'gltf', 'glb', 'svg', 'bvh', 'png', 'blend')
+
+
+def grid_mesh(rng, size):
+    """(vertices, triangles) of a size x size quad grid with random heights"""
+    vertices = []
+    for y in range(size + 1):
+        for x in range(size + 1):
+            vertices.append((x / size, y / size, rng.uniform(0, 0.1)))
+    triangles = []
+    for y in range(size):
+        for x in range(size):
+            a = y * (size + 1) + x
+            b, c, d = a + 1, a + size + 1, a + size + 2
+            triangles.append((a, b, d))
+            triangles.append((a, d, c))
+    return vertices, triangles
+
+
+def normal(v0, v1, v2):
+    ux, uy, uz = (v1[i] - v0[i] for i in range(3))
+    vx, vy, vz = (v2[i] - v0[i] for i in range(3))
+    n = (uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx)
+    length = math.sqrt(sum(c * c for c in n)) or 1.0
+    return tuple(c / length for c in n)
+
+
+def write_stl_binary(filepath, rng, size):
+    vertices, triangles = grid_mesh(rng, size)
+    with open(filepath, 'wb') as f:
+        f.write(b'UMI benchmark'.ljust(80, b' '))
+        f.write(struct.pack('<I', len(triangles)))
+        for t in triangles:
+            v = [vertices[i] for i in t]
+            f.write(struct.pack('<12fH', *normal(*v), *v[0], *v[1], *v[2], 0))
+
+
+def write_stl_ascii(filepath, rng, size):
+    vertices, triangles = grid_mesh(rng, size)
+    with open(filepath, 'w', newline='\n') as f:
+        f.write('solid umi\n')
+        for t in triangles:
+            v = [vertices[i] for i in t]
+            f.write('facet normal {:.6f} {:.6f} {:.6f}\n outer loop\n'.format(*normal(*v)))
+            for p in v:
+                f.write('  vertex {:.6f} {:.6f} {:.6f}\n'.format(*p))
+            f.write(' endloop\nendfacet\n')
+        f.write('endsolid umi\n')
+
+
+def write_obj(filepath, rng, size):
+    vertices, triangles = grid_mesh(rng, size)
+    name = path.splitext(path.basename(filepath))[0]
+    with open(path.splitext(filepath)[0] + '.mtl', 'w', newline='\n') as f:
+        f.write(f'newmtl {name}_mat\nKd {rng.random():.4f} {rng.random():.4f} {rng.random():.4f}\n')
+    with open(filepath, 'w', newline='\n') as f:
+        f.write(f'mtllib {name}.mtl\no {name}\n')
+        for v in vertices:
+            f.write('v {:.6f} {:.6f} {:.6f}\n'.format(*v))
+        f.write(f'usemtl {name}_mat\n')
+        for t in triangles:
+            f.write('f {} {} {}\n'.format(*(i + 1 for i in t)))
+
+
+def write_ply(filepath, rng, size, binary):
+    vertices, triangles = grid_mesh(rng, size)
+    header = ['ply', 'format {} 1.0'.format('binary_little_endian' if binary else 'ascii'),
+              f'element vertex {len(vertices)}', 'property float x', 'property float y', 'property float z',
+              f'element face {len(triangles)}', 'property list uchar int vertex_indices', 'end_header']
+    with open(filepath, 'wb') as f:
+        f.write(('\n'.join(header) + '\n').encode('ascii'))
+        if binary:
+            for v in vertices:
+                f.write(struct.pack('<3f', *v))
+            for t in triangles:
+                f.write(struct.pack('<B3i', 3, *t))
+        else:
+            for v in vertices:
+                f.write('{:.6f} {:.6f} {:.6f}\n'.format(*v).encode('ascii'))
+            for t in triangles:
+                f.write('3 {} {} {}\n'.format(*t).encode('ascii'))
+
+
+def gltf_document(rng, size, buffer_uri):
+    vertices, triangles = grid_mesh(rng, size)
+    positions = b''.join(struct.pack('<3f', *v) for v in vertices)
+    indices = b''.join(struct.pack('<3I', *t) for t in triangles)
+    data = positions + indices
+    buffer = {'byteLength': len(data)}
+    if buffer_uri:
+        buffer['uri'] = 'data:application/octet-stream;base64,' + base64.b64encode(data).decode('ascii')
+    document = {
+        'asset': {'version': '2.0', 'generator': 'UMI benchmark'},
+        'scene': 0, 'scenes': [{'nodes': [0]}], 'nodes': [{'mesh': 0}],
+        'materials': [{'pbrMetallicRoughness': {'baseColorFactor': [rng.random(), rng.random(), rng.random(), 1.0]}}],
+        'meshes': [{'primitives': [{'attributes': {'POSITION': 0}, 'indices': 1, 'material': 0}]}],
+        'buffers': [buffer],
+        'bufferViews': [{'buffer': 0, 'byteOffset': 0, 'byteLength': len(positions), 'target': 34962},
+                        {'buffer': 0, 'byteOffset': len(positions), 'byteLength': len(indices), 'target': 34963}],
+        'accessors': [{'bufferView': 0, 'componentType': 5126, 'count': len(vertices), 'type': 'VEC3',
+                       'min': [min(v[i] for v in vertices) for i in range(3)], 'max': [max(v[i] for v in vertices) for i in range(3)]},
+                      {'bufferView': 1, 'componentType': 5125, 'count': len(triangles) * 3, 'type': 'SCALAR'}],
+    }
+    return document, data
+
+
+def write_gltf(filepath, rng, size):
+    document, _ = gltf_document(rng, size, buffer_uri=True)
+    with open(filepath, 'w', newline='\n') as f:
+        json.dump(document, f)
+
+
+def write_glb(filepath, rng, size):
+    document, data = gltf_document(rng, size, buffer_uri=False)
+    json_chunk = json.dumps(document).encode('utf-8')
+    json_chunk += b' ' * (-len(json_chunk) % 4)
+    data += b'\0' * (-len(data) % 4)
+    with open(filepath, 'wb') as f:
+        f.write(struct.pack('<4sII', b'glTF', 2, 12 + 8 + len(json_chunk) + 8 + len(data)))
+        f.write(struct.pack('<I4s', len(json_chunk), b'JSON') + json_chunk)
+        f.write(struct.pack('<I4s', len(data), b'BIN\0') + data)
+
+
+def write_svg(filepath, rng, size):
+    with open(filepath, 'w', newline='\n') as f:
+        f.write('<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100" viewBox="0 0 100 100">\n')
+        for _ in range(size):
+            points = ' '.join(f'{rng.uniform(0, 100):.2f},{rng.uniform(0, 100):.2f}' for _ in range(5))
+            f.write(f'<polygon points="{points}" fill="#{rng.randrange(0x1000000):06x}"/>\n')
+        f.write('</svg>\n')
+
+
+def write_bvh(filepath, rng, size):
+    joints = max(1, size // 4)
+    lines = ['HIERARCHY', 'ROOT root', '{', 'OFFSET 0 0 0', 'CHANNELS 6 Xposition Yposition Zposition Zrotation Xrotation Yrotation']
+    for i in range(joints):
+        lines += [f'JOINT joint_{i}', '{', 'OFFSET 0 1 0', 'CHANNELS 3 Zrotation Xrotation Yrotation']
+    lines += ['End Site', '{', 'OFFSET 0 1 0', '}'] + ['}'] * (joints + 1)
+    frames = size * 2
+    lines += ['MOTION', f'Frames: {frames}', 'Frame Time: 0.041667']
+    for _ in range(frames):
+        lines.append(' '.join(f'{rng.uniform(-10, 10):.3f}' for _ in range(6 + 3 * joints)))
+    with open(filepath, 'w', newline='\n') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def write_png(filepath, rng, size):
+    width = height = size * 4
+    rows = b''.join(b'\0' + bytes(rng.randrange(256) for _ in range(width * 3)) for _ in range(height))
+
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff)
+
+    with open(filepath, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(rows, 6)))
+        f.write(chunk(b'IEND', b''))
+
+
+def write_blend(filepath, rng, size):
+    import bpy
+    vertices, triangles = grid_mesh(rng, size)
+    name = path.splitext(path.basename(filepath))[0]
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(vertices, [], triangles)
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.data.libraries.write(filepath, {obj}, fake_user=True)
+    bpy.data.objects.remove(obj)
+    bpy.data.meshes.remove(mesh)
+
+
+WRITERS = {
+    'stl_binary': ('.stl', write_stl_binary),
+    'stl_ascii': ('.stl', write_stl_ascii),
+    'obj': ('.obj', write_obj),
+    'ply_ascii': ('.ply', lambda f, r, s: write_ply(f, r, s, binary=False)),
+    'ply_binary': ('.ply', lambda f, r, s: write_ply(f, r, s, binary=True)),
+    'gltf': ('.gltf', write_gltf),
+    'glb': ('.glb', write_glb),
+    'svg': ('.svg', write_svg),
+    'bvh': ('.bvh', write_bvh),
+    'png': ('.png', write_png),
+    'blend': ('.blend', write_blend),
+}
+
+
+def has_bpy():
+    try:
+        import bpy
+    except ImportError:
+        return False
+    return True
+
+
+def folder_of(index, depth, width):
+    return [f'folder_{(index // width ** level) % width:02d}' for level in range(depth)]
+
+
+def generate_corpus(output, count=10, size=16, depth=1, width=2, seed=0, formats=FORMATS):
+    """Write *count* files of each format in *output*, and return the list of generated files"""
+    if 'blend' in formats and not has_bpy():
+        print('UMI : .blend files can only be generated inside Blender, skipping them')
+        formats = [f for f in formats if f != 'blend']
+
+    generated = []
+    for format_name in formats:
+        ext, writer = WRITERS[format_name]
+        for i in range(count):
+            folder = path.join(output, *folder_of(i, depth, width))
+            os.makedirs(folder, exist_ok=True)
+            filepath = path.join(folder, f'{format_name}_{i:05d}{ext}')
+            # One random generator per file : adding formats or files doesn't change the existing ones
+            writer(filepath, random.Random(f'{seed}/{format_name}/{i}'), size)
+            generated.append(filepath)
+    return generated
+
+
+def corpus_parser():
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--count', type=int, default=10, help='files per format')
+    parser.add_argument('--size', type=int, default=16, help='mesh resolution and image size factor')
+    parser.add_argument('--depth', type=int, default=1, help='folder levels')
+    parser.add_argument('--width', type=int, default=2, help='folders per level')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--formats', nargs='+', default=list(FORMATS), choices=FORMATS)
+    return parser
+
+
+def main():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else sys.argv[1:]
+    parser = argparse.ArgumentParser(description='Generate a synthetic asset corpus', parents=[corpus_parser()])
+    parser.add_argument('output')
+    args = parser.parse_args(argv)
+    files = generate_corpus(args.output, args.count, args.size, args.depth, args.width, args.seed, args.formats)
+    print(f'{len(files)} files generated in {args.output}')
+
+
+if __name__ == '__main__':
+    main()
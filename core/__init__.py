@@ -0,0 +1,15 @@
+from .file_record import FileRecord, FileRecordStore, FileStatus, stat_file
+from .scan_index import ScanIndex, clear_scan_index
+from .scanner import FolderScanner, list_folder, scan_folder
+from .batch_planner import Batch, plan_batches
+from .import_stats import ImportStats, Throughput, clear_import_stats
+from .frame_scheduler import FrameBudgetScheduler
+from .worker_pool import WorkerPool, split_shards, encode_event, to_json_value, from_json_value, current_rss_mb
+from .import_cache import ImportCache, clear_import_cache, hash_settings
+from .import_profiler import ImportProfiler, FileProfile
+from .unique_name import NameRegistry, unique_name, unique_name_clean_func
+from .format_resolver import FormatResolver
+from .message_store import DEFAULT_LOG_CAPACITY, Message, MessageLevel, MessageStore, insert_str, split_str
+from .log_writer import AsyncLogWriter, BatchedRotatingFileHandler
+from .event_stream import ImportEventStream, ImportMetrics
+from .addon_snapshot import AddonSnapshot
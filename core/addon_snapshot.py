@@ -0,0 +1,45 @@
+class AddonSnapshot():
+    """
+    Names of the installed and enabled add-ons, read once through *list_installed* and *list_enabled*
+    and answered from memory until invalidate() is called.
+    Listing installed add-ons scans every add-on folder on disk, so it is only done again once the snapshot is invalidated.
+    """
+    def __init__(self, list_installed, list_enabled):
+        self.list_installed = list_installed
+        self.list_enabled = list_enabled
+        self._installed = None
+        self._enabled = None
+        self.scan_count = 0
+
+    def invalidate(self, installed=True, enabled=True):
+        if installed:
+            self._installed = None
+        if enabled:
+            self._enabled = None
+
+    @property
+    def installed(self):
+        if self._installed is None:
+            self._installed = frozenset(self.list_installed())
+            self.scan_count += 1
+        return self._installed
+
+    @property
+    def enabled(self):
+        if self._enabled is None:
+            self._enabled = frozenset(self.list_enabled())
+        return self._enabled
+
+    def is_installed(self, name):
+        return name in self.installed
+
+    def is_enabled(self, name):
+        return name in self.enabled
+
+    def all_installed(self, names):
+        installed = self.installed
+        return all(n in installed for n in names if n is not None)
+
+    def all_enabled(self, names):
+        enabled = self.enabled
+        return all(n in enabled for n in names if n is not None)
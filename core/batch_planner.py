@@ -0,0 +1,62 @@
+from bisect import bisect_left, insort
+from collections import namedtuple
+
+# One planned import batch : the files to import together and their total size
+Batch = namedtuple('Batch', ['filepaths', 'size'])
+
+def plan_batches(files, max_batch_size, max_file_count, minimize_batch_number=False):
+    """
+    Split *files* in import batches, and return the whole plan as a tuple of Batch.
+
+    A batch never holds more than *max_file_count* files, and never exceeds *max_batch_size*
+    unless it holds a single file bigger than the limit.
+
+    :arg files: iterable of (filepath, size) pairs, in import order
+    :arg minimize_batch_number: pack files with best-fit decreasing to get as few batches as possible,
+        instead of cutting batches in import order
+    """
+    max_file_count = max(1, max_file_count)
+    if minimize_batch_number:
+        return _plan_best_fit_decreasing(files, max_batch_size, max_file_count)
+    else:
+        return _plan_sequential(files, max_batch_size, max_file_count)
+
+def _plan_sequential(files, max_batch_size, max_file_count):
+    batches = []
+    filepaths = []
+    batch_size = 0
+    for filepath, size in files:
+        if len(filepaths) and (len(filepaths) >= max_file_count or batch_size + size > max_batch_size):
+            batches.append(Batch(tuple(filepaths), batch_size))
+            filepaths = []
+            batch_size = 0
+
+        filepaths.append(filepath)
+        batch_size += size
+
+    if len(filepaths):
+        batches.append(Batch(tuple(filepaths), batch_size))
+
+    return tuple(batches)
+
+def _plan_best_fit_decreasing(files, max_batch_size, max_file_count):
+    bins = []
+    # Batches that can still receive files, as (remaining size, batch index) sorted by remaining size
+    open_bins = []
+    for filepath, size in sorted(files, key=lambda f: f[1], reverse=True):
+        # Tightest open batch where the file fits
+        i = bisect_left(open_bins, (size, -1))
+        if i < len(open_bins):
+            remaining, b = open_bins.pop(i)
+            bins[b][0].append(filepath)
+            bins[b][1] += size
+            remaining -= size
+        else:
+            b = len(bins)
+            bins.append([[filepath], size])
+            remaining = max_batch_size - size
+
+        if remaining >= 0 and len(bins[b][0]) < max_file_count:
+            insort(open_bins, (remaining, b))
+
+    return tuple(Batch(tuple(filepaths), size) for filepaths, size in bins)
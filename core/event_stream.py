@@ -0,0 +1,214 @@
+import json, os, time, uuid
+from .file_record import FileStatus
+
+METRICS_PREFIX = 'umi_import'
+
+class ImportMetrics():
+    """
+    Progress counters of one import session, written in the Prometheus textfile format.
+    """
+    __slots__ = ('session', 'started', 'ended', 'files_total', 'files_done', 'files_failed', 'files_skipped',
+                 'megabytes_total', 'megabytes_done', 'commands_done', 'commands_failed')
+
+    def __init__(self, session):
+        self.session = session
+        self.started = time.time()
+        self.ended = None
+        self.files_total = 0
+        self.files_done = 0
+        self.files_failed = 0
+        self.files_skipped = 0
+        self.megabytes_total = 0.0
+        self.megabytes_done = 0.0
+        self.commands_done = 0
+        self.commands_failed = 0
+
+    @property
+    def elapsed(self):
+        return (self.ended or time.time()) - self.started
+
+    @property
+    def throughput(self):
+        # MB/s
+        elapsed = self.elapsed
+        return self.megabytes_done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self):
+        remaining = max(0.0, self.megabytes_total - self.megabytes_done)
+        if not remaining or self.ended is not None:
+            return 0.0
+        throughput = self.throughput
+        if throughput <= 0:
+            return float('nan')
+        return remaining / throughput
+
+    def samples(self):
+        return (
+            ('running', 'gauge', 'Whether the import session is running', 0 if self.ended is not None else 1),
+            ('start_timestamp_seconds', 'gauge', 'Start time of the import session', self.started),
+            ('elapsed_seconds', 'gauge', 'Duration of the import session', self.elapsed),
+            ('files_total', 'gauge', 'Files to import in the session', self.files_total),
+            ('files_done', 'gauge', 'Files imported, failed or skipped', self.files_done),
+            ('files_failed', 'gauge', 'Files that failed to import', self.files_failed),
+            ('files_skipped', 'gauge', 'Files skipped as already imported', self.files_skipped),
+            ('megabytes_total', 'gauge', 'Size of the files to import', self.megabytes_total),
+            ('megabytes_done', 'gauge', 'Size of the files imported, failed or skipped', self.megabytes_done),
+            ('throughput_megabytes_per_second', 'gauge', 'Average import throughput of the session', self.throughput),
+            ('eta_seconds', 'gauge', 'Estimated time left, from the average throughput', self.eta),
+            ('commands_done', 'gauge', 'Post process commands executed', self.commands_done),
+            ('commands_failed', 'gauge', 'Post process commands that failed', self.commands_failed),
+        )
+
+    def to_prometheus(self):
+        lines = []
+        for name, kind, description, value in self.samples():
+            name = f'{METRICS_PREFIX}_{name}'
+            lines.append(f'# HELP {name} {description}')
+            lines.append(f'# TYPE {name} {kind}')
+            lines.append(f'{name}{{session="{self.session}"}} {format_sample(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+def format_sample(value):
+    if value != value:
+        return 'NaN'
+    if isinstance(value, int):
+        return str(value)
+    return repr(round(float(value), 6))
+
+
+class ImportEventStream():
+    """
+    Append one JSON object per event of an import session to *events_file*,
+    and keep *metrics_file* up to date with the session counters, at most every *metrics_interval* seconds.
+    Either file can be None. Once writing a file fails, *on_error* is called and that file is no longer written,
+    so that a full or disconnected disk doesn't stop the import.
+    """
+    def __init__(self, events_file=None, metrics_file=None, metrics_interval=1.0, flush_interval=1.0, session=None, on_error=None):
+        self.session = session or uuid.uuid4().hex[:12]
+        self.events_file = events_file
+        self.metrics_file = metrics_file
+        self.metrics_interval = metrics_interval
+        self.flush_interval = flush_interval
+        self.on_error = on_error
+        self.metrics = ImportMetrics(self.session)
+        self.last_metrics_write = 0.0
+        self.last_flush = time.monotonic()
+        self._file = None
+        if events_file is not None:
+            os.makedirs(os.path.dirname(events_file) or '.', exist_ok=True)
+            self._file = open(events_file, 'a', encoding='utf-8')
+
+    @property
+    def closed(self):
+        return self.metrics.ended is not None
+
+    def emit(self, event, **fields):
+        if self._file is not None:
+            line = {'time': round(time.time(), 6), 'session': self.session, 'event': event}
+            line.update(fields)
+            try:
+                self._file.write(json.dumps(line, default=str) + '\n')
+                now = time.monotonic()
+                if now - self.last_flush >= self.flush_interval:
+                    self._file.flush()
+                    self.last_flush = now
+            except OSError as e:
+                self.close()
+                self.error(f'Import events not written to {self.events_file} : {e}')
+        self.write_metrics()
+
+    def error(self, message):
+        if self.on_error is not None:
+            self.on_error(message)
+
+    # Session events
+
+    def session_start(self, kind, file_count=0, size_mb=0.0, **fields):
+        self.metrics.files_total = file_count
+        self.metrics.megabytes_total = size_mb
+        self.emit('session_start', kind=kind, file_count=file_count, size_mb=size_mb, **fields)
+        self.write_metrics(force=True)
+
+    def scan_done(self, file_count, size_mb, seconds, interrupted=False):
+        self.emit('scan_done', file_count=file_count, size_mb=size_mb, seconds=seconds, interrupted=interrupted)
+
+    def files_selected(self, file_count, size_mb):
+        self.metrics.files_total = file_count
+        self.metrics.megabytes_total = size_mb
+        self.emit('files_selected', file_count=file_count, size_mb=size_mb)
+
+    def batch_planned(self, batch_count, mode, seconds):
+        self.emit('batch_planned', batch_count=batch_count, mode=mode, seconds=seconds)
+
+    def batch_start(self, number, file_count, size):
+        self.emit('batch_start', number=number, file_count=file_count, size=size)
+
+    def file_start(self, record, **fields):
+        self.emit('file_start', path=record.path, format=record.format_name, module=record.module_name, size_mb=record.size_mb, **fields)
+
+    def file_end(self, record, status, seconds=None, **fields):
+        metrics = self.metrics
+        metrics.files_done += 1
+        metrics.megabytes_done += record.size_mb
+        if status == FileStatus.FAILED:
+            metrics.files_failed += 1
+        elif status == FileStatus.SKIPPED:
+            metrics.files_skipped += 1
+        self.emit('file_end', path=record.path, status=status, seconds=seconds, format=record.format_name, module=record.module_name, size_mb=record.size_mb, **fields)
+
+    def command(self, command, target, success, seconds, error=None):
+        if success:
+            self.metrics.commands_done += 1
+        else:
+            self.metrics.commands_failed += 1
+        self.emit('batcher_command', command=command, target=target, success=success, seconds=seconds, error=error)
+
+    def backup(self, filepath, seconds):
+        self.emit('backup', path=filepath, seconds=seconds)
+
+    def session_end(self, status, **fields):
+        if self.closed:
+            return
+        self.metrics.ended = time.time()
+        metrics = self.metrics
+        self.emit('session_end', status=status, seconds=metrics.elapsed, files_done=metrics.files_done, files_failed=metrics.files_failed,
+                  files_skipped=metrics.files_skipped, megabytes_done=metrics.megabytes_done, **fields)
+        self.write_metrics(force=True)
+        self.close()
+
+    # Output
+
+    def write_metrics(self, force=False):
+        if self.metrics_file is None:
+            return
+        now = time.monotonic()
+        if not force and now - self.last_metrics_write < self.metrics_interval:
+            return
+        self.last_metrics_write = now
+
+        # The file is replaced atomically, so collectors never read a partial file
+        temp_file = f'{self.metrics_file}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.metrics_file) or '.', exist_ok=True)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(self.metrics.to_prometheus())
+            os.replace(temp_file, self.metrics_file)
+        except OSError as e:
+            metrics_file = self.metrics_file
+            self.metrics_file = None
+            self.error(f'Import metrics not written to {metrics_file} : {e}')
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+            self.last_flush = time.monotonic()
+
+    def close(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
@@ -0,0 +1,73 @@
+import os
+from os import path
+
+class FileStatus():
+    PENDING = 'Pending'
+    IMPORTING = 'Importing'
+    SUCCEEDED = 'Succeeded'
+    FAILED = 'Failed'
+    SKIPPED = 'Skipped'
+
+class FileRecord():
+    __slots__ = ('path', 'name', 'ext', 'size', 'mtime', 'format_name', 'module_name', 'status')
+
+    def __init__(self, filepath, size, mtime):
+        self.path = filepath
+        self.name = path.basename(filepath)
+        self.ext = path.splitext(self.name)[1].lower()
+        self.size = size
+        self.mtime = mtime
+        self.format_name = None
+        self.module_name = None
+        self.status = FileStatus.PENDING
+
+    @property
+    def size_mb(self):
+        return self.size / (1024 * 1024)
+
+    def __repr__(self):
+        return f'FileRecord({self.path!r}, size={self.size}, status={self.status})'
+
+def stat_file(filepath):
+    file_stats = os.stat(filepath)
+    return FileRecord(filepath, file_stats.st_size, file_stats.st_mtime)
+
+class FileRecordStore():
+    """
+    Per-session table of FileRecord keyed by path.
+    Each file is stat-ed once, when scanned or first requested, then every stage reads the stored record.
+    """
+    def __init__(self):
+        self._records = {}
+
+    def add(self, record):
+        self._records[record.path] = record
+        return record
+
+    def get(self, filepath):
+        record = self._records.get(filepath)
+        if record is None:
+            record = self.add(stat_file(filepath))
+
+        return record
+
+    def total_size(self, filepaths):
+        return sum(self.get(f).size for f in filepaths) / (1024 * 1024)
+
+    def with_status(self, status):
+        return [r for r in self._records.values() if r.status == status]
+
+    def clear(self):
+        self._records.clear()
+
+    def __getitem__(self, filepath):
+        return self.get(filepath)
+
+    def __contains__(self, filepath):
+        return filepath in self._records
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records.values())
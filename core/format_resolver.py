@@ -0,0 +1,44 @@
+from types import MappingProxyType
+
+class FormatResolver():
+    """
+    Extension to format lookup over format definitions : (format_key, {'name', 'ext', 'operator', ...}) pairs.
+    The index is built once and frozen : lowercase extension -> (format definition, read-only module table).
+    The first format declaring an extension wins.
+    """
+    def __init__(self, formats):
+        self.formats = tuple(formats)
+        extensions = []
+        index = {}
+        for _, definition in self.formats:
+            if not isinstance(definition, dict):
+                continue
+            operators = MappingProxyType(definition['operator'])
+            for ext in definition['ext']:
+                extensions.append(ext)
+                index.setdefault(ext.lower(), (definition, operators))
+
+        self.extensions = tuple(extensions)
+        self.extension_set = frozenset(index.keys())
+        self._index = MappingProxyType(index)
+
+    def _lookup(self, ext):
+        # Extensions are nearly always lowercase already : only lower them on a miss
+        entry = self._index.get(ext)
+        if entry is None:
+            entry = self._index.get(ext.lower())
+        return entry
+
+    def is_supported(self, ext):
+        return self._lookup(ext) is not None
+
+    def format_from_extension(self, ext):
+        entry = self._lookup(ext)
+        return None if entry is None else entry[0]
+
+    def operators_from_extension(self, ext):
+        """
+        Read-only module table of the format of *ext* : module name -> operator definition
+        """
+        entry = self._lookup(ext)
+        return None if entry is None else entry[1]
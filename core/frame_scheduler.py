@@ -0,0 +1,53 @@
+import time
+
+class FrameBudgetScheduler():
+    """
+    Decide how much work a modal timer tick can do without freezing the interface.
+
+    A tick keeps taking work while the time spent, plus the expected cost of the next item, fits in *time_budget*.
+    At least one item is processed per tick, so progress is guaranteed even when a single item exceeds the budget.
+    The timer interval follows the observed tick duration : short ticks are chained quickly to keep throughput high,
+    long ticks leave more time to the event loop between them.
+    """
+    def __init__(self, time_budget=0.05, min_interval=0.01, max_interval=0.25, smoothing=0.3):
+        self.time_budget = time_budget
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.smoothing = smoothing
+        self.item_cost = None
+        self.tick_cost = None
+        self.tick_start = 0.0
+        self.item_start = 0.0
+        self.items_in_tick = 0
+
+    def _smooth(self, average, value):
+        if average is None:
+            return value
+        return average + self.smoothing * (value - average)
+
+    def start_tick(self):
+        self.tick_start = time.perf_counter()
+        self.items_in_tick = 0
+
+    def start_item(self):
+        self.item_start = time.perf_counter()
+
+    def end_item(self):
+        self.item_cost = self._smooth(self.item_cost, time.perf_counter() - self.item_start)
+        self.items_in_tick += 1
+
+    def end_tick(self):
+        self.tick_cost = self._smooth(self.tick_cost, time.perf_counter() - self.tick_start)
+
+    @property
+    def has_time_left(self):
+        if self.items_in_tick == 0:
+            return True
+        elapsed = time.perf_counter() - self.tick_start
+        return elapsed + (self.item_cost or 0.0) <= self.time_budget
+
+    @property
+    def interval(self):
+        if self.tick_cost is None:
+            return self.min_interval
+        return min(self.max_interval, max(self.min_interval, self.tick_cost * 0.5))
@@ -0,0 +1,136 @@
+import hashlib, json, os, shutil, time
+from os import path
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def hash_file_content(filepath):
+    digest = hashlib.sha1()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def hash_settings(settings):
+    return hashlib.sha1(json.dumps(settings, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+class CacheEntry():
+    __slots__ = ('size', 'last_used')
+
+    def __init__(self, size=0, last_used=0.0):
+        self.size = size
+        self.last_used = last_used
+
+    def to_dict(self):
+        return {s: getattr(self, s) for s in self.__slots__}
+
+class ImportCache():
+    """
+    Results of previous imports stored as .blend files, keyed by source file identity, format, module and import settings.
+    The source identity is either its content hash, or its path, size and modification time.
+    The least recently used entries are removed once the cache is above *max_size_mb*.
+    """
+    VERSION = 1
+
+    def __init__(self, cache_folder, max_size_mb, hash_content=False):
+        self.cache_folder = cache_folder
+        self.max_size = max_size_mb * 1024 * 1024
+        self.hash_content = hash_content
+        self.index_path = path.join(cache_folder, 'index.json')
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+        self.stored_size = 0
+        self.load()
+
+    def load(self):
+        self.entries = {}
+        if not path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get('version') != self.VERSION:
+            return
+        entries = data.get('entries', {})
+        if not isinstance(entries, dict):
+            return
+        for k, v in entries.items():
+            # Entries from a hand edited or older index are dropped, their files are evicted with the others
+            if not isinstance(v, dict):
+                continue
+            try:
+                self.entries[k] = CacheEntry(**v)
+            except TypeError:
+                continue
+
+    def save(self):
+        os.makedirs(self.cache_folder, exist_ok=True)
+        data = {'version': self.VERSION, 'entries': {k: v.to_dict() for k, v in self.entries.items()}}
+        temp_path = self.index_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_path, self.index_path)
+
+    def key(self, record, format_name, module_name, settings_hash):
+        if self.hash_content:
+            source = hash_file_content(record.path)
+        else:
+            # Stat the file again : the record may come from the scan index, stale for files rewritten in place
+            file_stats = os.stat(record.path)
+            source = f'{record.path}|{file_stats.st_size}|{file_stats.st_mtime}'
+        return hashlib.sha1(f'{source}|{format_name}|{module_name}|{settings_hash}'.encode('utf-8')).hexdigest()
+
+    def entry_path(self, key):
+        return path.join(self.cache_folder, key[:2], f'{key}.blend')
+
+    def lookup(self, key):
+        """Path of the cached result of *key*, or None on a miss"""
+        entry = self.entries.get(key)
+        if entry is not None and path.exists(self.entry_path(key)):
+            entry.last_used = time.time()
+            self.hits += 1
+            return self.entry_path(key)
+
+        self.entries.pop(key, None)
+        self.misses += 1
+        return None
+
+    def prepare(self, key):
+        """Path where the result of *key* has to be written before calling add()"""
+        entry_path = self.entry_path(key)
+        os.makedirs(path.dirname(entry_path), exist_ok=True)
+        return entry_path
+
+    def add(self, key):
+        size = path.getsize(self.entry_path(key))
+        self.entries[key] = CacheEntry(size=size, last_used=time.time())
+        self.stored += 1
+        self.stored_size += size
+        self.evict()
+
+    @property
+    def total_size(self):
+        return sum(e.size for e in self.entries.values())
+
+    def evict(self):
+        total_size = self.total_size
+        if total_size <= self.max_size:
+            return
+        for key in sorted(self.entries.keys(), key=lambda k: self.entries[k].last_used):
+            total_size -= self.entries.pop(key).size
+            try:
+                os.remove(self.entry_path(key))
+            except OSError:
+                pass
+            if total_size <= self.max_size:
+                return
+
+def clear_import_cache(cache_folder):
+    if path.isdir(cache_folder):
+        shutil.rmtree(cache_folder)
+        return True
+
+    return False
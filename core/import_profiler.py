@@ -0,0 +1,110 @@
+import csv, json, math
+from .worker_pool import current_rss_mb
+
+class FileProfile():
+    """
+    Instrumentation record of one imported file. Durations are in seconds, memory in MB, None when it can't be measured.
+    """
+    __slots__ = ('path', 'name', 'format_name', 'module_name', 'succeeded', 'size_mb',
+                 'total_seconds', 'importer_seconds', 'relink_seconds', 'post_process_seconds',
+                 'rss_before_mb', 'rss_after_mb', 'objects', 'meshes', 'vertices', 'materials')
+
+    def __init__(self, record):
+        self.path = record.path
+        self.name = record.name
+        self.format_name = record.format_name
+        self.module_name = record.module_name
+        self.succeeded = False
+        self.size_mb = record.size_mb
+        self.total_seconds = 0.0
+        self.importer_seconds = 0.0
+        self.relink_seconds = 0.0
+        self.post_process_seconds = 0.0
+        self.rss_before_mb = current_rss_mb()
+        self.rss_after_mb = None
+        self.objects = 0
+        self.meshes = 0
+        self.vertices = 0
+        self.materials = 0
+
+    @property
+    def umi_seconds(self):
+        return max(0.0, self.total_seconds - self.importer_seconds - self.relink_seconds)
+
+    def to_dict(self):
+        d = {s: getattr(self, s) for s in self.__slots__}
+        d['umi_seconds'] = self.umi_seconds
+        return d
+
+def percentile(sorted_values, p):
+    # Nearest rank percentile of an already sorted list
+    if not len(sorted_values):
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+class ImportProfiler():
+    """
+    Collect a FileProfile per imported file, write them as CSV or JSONL, and aggregate them per format/module.
+    """
+    FIELDS = FileProfile.__slots__ + ('umi_seconds',)
+
+    def __init__(self):
+        self.profiles = []
+
+    def start_file(self, record):
+        profile = FileProfile(record)
+        self.profiles.append(profile)
+        return profile
+
+    def end_file(self, profile, record, succeeded, total_seconds):
+        profile.format_name = record.format_name
+        profile.module_name = record.module_name
+        profile.succeeded = bool(succeeded)
+        profile.total_seconds = total_seconds
+        profile.rss_after_mb = current_rss_mb()
+
+    def add_post_process(self, profiles, seconds):
+        # A batch is post-processed at once : its duration is shared between the files according to their object count
+        object_count = sum(p.objects for p in profiles)
+        for p in profiles:
+            share = p.objects / object_count if object_count else 1 / len(profiles)
+            p.post_process_seconds += seconds * share
+
+    def write_csv(self, filepath):
+        with open(filepath, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=self.FIELDS)
+            writer.writeheader()
+            for p in self.profiles:
+                writer.writerow(p.to_dict())
+
+    def write_jsonl(self, filepath):
+        with open(filepath, 'w', encoding='utf-8') as f:
+            for p in self.profiles:
+                f.write(json.dumps(p.to_dict()) + '\n')
+
+    def aggregates(self):
+        """{(format, module): {count, failed, p50_seconds, p95_seconds, p50_seconds_per_mb, p95_seconds_per_mb, total_seconds}}"""
+        groups = {}
+        for p in self.profiles:
+            groups.setdefault((p.format_name, p.module_name), []).append(p)
+
+        aggregates = {}
+        for key, profiles in groups.items():
+            seconds = sorted(p.total_seconds for p in profiles)
+            seconds_per_mb = sorted(p.total_seconds / p.size_mb for p in profiles if p.size_mb > 0)
+            aggregates[key] = {'count': len(profiles),
+                               'failed': len([p for p in profiles if not p.succeeded]),
+                               'total_seconds': sum(seconds),
+                               'p50_seconds': percentile(seconds, 50),
+                               'p95_seconds': percentile(seconds, 95),
+                               'p50_seconds_per_mb': percentile(seconds_per_mb, 50),
+                               'p95_seconds_per_mb': percentile(seconds_per_mb, 95)}
+        return aggregates
+
+    def summary_lines(self):
+        lines = []
+        aggregates = self.aggregates()
+        for (format_name, module_name), a in sorted(aggregates.items(), key=lambda i: i[1]['total_seconds'], reverse=True):
+            lines.append(f'{format_name}/{module_name} : {a["count"]} file(s) | {round(a["total_seconds"], 2)}s | p50 {round(a["p50_seconds"], 3)}s - p95 {round(a["p95_seconds"], 3)}s | p50 {round(a["p50_seconds_per_mb"], 3)}s/MB - p95 {round(a["p95_seconds_per_mb"], 3)}s/MB')
+        return lines
@@ -0,0 +1,129 @@
+import json, os
+from os import path
+
+DEFAULT_SECONDS_PER_MB = 0.5
+DEFAULT_SECONDS_PER_FILE = 0.05
+
+class Throughput():
+    """
+    Import duration model of one format/module : seconds = seconds_per_file + seconds_per_mb * size_mb
+    Fitted by least squares on the recorded imports. Older samples slowly fade out with *decay*,
+    so the model follows importer or hardware changes.
+    """
+    __slots__ = ('count', 'sum_mb', 'sum_seconds', 'sum_mb2', 'sum_mb_seconds')
+
+    def __init__(self, count=0, sum_mb=0.0, sum_seconds=0.0, sum_mb2=0.0, sum_mb_seconds=0.0):
+        self.count = count
+        self.sum_mb = sum_mb
+        self.sum_seconds = sum_seconds
+        self.sum_mb2 = sum_mb2
+        self.sum_mb_seconds = sum_mb_seconds
+
+    def add(self, size_mb, seconds, decay=1.0):
+        self.count = self.count * decay + 1
+        self.sum_mb = self.sum_mb * decay + size_mb
+        self.sum_seconds = self.sum_seconds * decay + seconds
+        self.sum_mb2 = self.sum_mb2 * decay + size_mb * size_mb
+        self.sum_mb_seconds = self.sum_mb_seconds * decay + size_mb * seconds
+
+    @property
+    def coefficients(self):
+        """(seconds_per_file, seconds_per_mb)"""
+        denominator = self.count * self.sum_mb2 - self.sum_mb * self.sum_mb
+        if self.count >= 2 and denominator > 1e-9:
+            seconds_per_mb = (self.count * self.sum_mb_seconds - self.sum_mb * self.sum_seconds) / denominator
+            seconds_per_file = (self.sum_seconds - seconds_per_mb * self.sum_mb) / self.count
+            if seconds_per_mb >= 0 and seconds_per_file >= 0:
+                return seconds_per_file, seconds_per_mb
+
+        # Not enough spread in the samples : proportional model
+        if self.sum_mb > 1e-9:
+            return 0.0, self.sum_seconds / self.sum_mb
+
+        return self.sum_seconds / self.count, 0.0
+
+    def predict(self, size_mb):
+        seconds_per_file, seconds_per_mb = self.coefficients
+        return seconds_per_file + seconds_per_mb * size_mb
+
+    def to_dict(self):
+        return {s: getattr(self, s) for s in self.__slots__}
+
+class ImportStats():
+    """
+    Per format/module import throughput learned from past sessions, stored in a local JSON file.
+    """
+    VERSION = 1
+
+    def __init__(self, stats_path, decay=0.98):
+        self.stats_path = stats_path
+        self.decay = decay
+        self.throughputs = {}
+        self.changed = False
+        self.load()
+
+    @staticmethod
+    def key(format_name, module_name):
+        return f'{format_name}/{module_name}'
+
+    def load(self):
+        self.throughputs = {}
+        if not path.exists(self.stats_path):
+            return
+        try:
+            with open(self.stats_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get('version') != self.VERSION:
+            return
+        try:
+            for k, v in data.get('throughputs', {}).items():
+                self.throughputs[k] = Throughput(**v)
+        except (TypeError, KeyError, AttributeError):
+            # Truncated, hand edited or older stats file : learn again from scratch
+            self.throughputs = {}
+
+    def save(self):
+        stats_folder = path.dirname(self.stats_path)
+        if stats_folder:
+            os.makedirs(stats_folder, exist_ok=True)
+        data = {'version': self.VERSION, 'throughputs': {k: v.to_dict() for k, v in self.throughputs.items()}}
+        temp_path = self.stats_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1)
+        os.replace(temp_path, self.stats_path)
+        self.changed = False
+
+    def save_changes(self):
+        """Save only when an import was recorded since the last load or save"""
+        if self.changed:
+            self.save()
+
+    def record(self, format_name, module_name, size_mb, seconds):
+        key = self.key(format_name, module_name)
+        throughput = self.throughputs.get(key)
+        if throughput is None:
+            throughput = self.throughputs[key] = Throughput()
+        throughput.add(size_mb, seconds, decay=self.decay)
+        self.changed = True
+
+    def predict(self, format_name, module_name, size_mb):
+        """Predicted import duration in seconds, falling back on the average of every known format"""
+        throughput = self.throughputs.get(self.key(format_name, module_name))
+        if throughput is not None and throughput.count > 0:
+            return throughput.predict(size_mb)
+
+        total_mb = sum(t.sum_mb for t in self.throughputs.values())
+        total_seconds = sum(t.sum_seconds for t in self.throughputs.values())
+        if total_mb > 1e-9:
+            return DEFAULT_SECONDS_PER_FILE + total_seconds / total_mb * size_mb
+
+        return DEFAULT_SECONDS_PER_FILE + DEFAULT_SECONDS_PER_MB * size_mb
+
+def clear_import_stats(stats_path):
+    if path.exists(stats_path):
+        os.remove(stats_path)
+        return True
+
+    return False
@@ -0,0 +1,146 @@
+import logging, os, queue, time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+DEFAULT_LOG_FORMAT = '%(asctime)s - %(levelname)s :    %(message)s'
+DEFAULT_TIME_FORMAT = '%m/%d/%Y %I:%M:%S %p'
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+DEFAULT_ROTATE_INTERVAL = 24 * 60 * 60
+
+class BatchedRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that flushes every *flush_count* records or *flush_interval* seconds
+    instead of after each record. Files roll over above *max_bytes* or once they are older than *rotate_interval* seconds.
+    """
+    def __init__(self, filename, max_bytes=DEFAULT_MAX_BYTES, backup_count=DEFAULT_BACKUP_COUNT, rotate_interval=DEFAULT_ROTATE_INTERVAL, flush_count=64, flush_interval=0.5, encoding='utf-8'):
+        super(BatchedRotatingFileHandler, self).__init__(filename, mode='a', maxBytes=max_bytes, backupCount=backup_count, encoding=encoding, delay=True)
+        self.rotate_interval = rotate_interval
+        self.flush_count = flush_count
+        self.flush_interval = flush_interval
+        self.pending = 0
+        self.last_flush = time.monotonic()
+        self.rollover_at = self.compute_rollover(self.baseFilename)
+
+    def compute_rollover(self, filename):
+        if not self.rotate_interval:
+            return None
+        try:
+            opened = os.path.getmtime(filename)
+        except OSError:
+            opened = time.time()
+        return opened + self.rotate_interval
+
+    def shouldRollover(self, record):
+        if self.rollover_at is not None and time.time() >= self.rollover_at:
+            return True
+        return super(BatchedRotatingFileHandler, self).shouldRollover(record)
+
+    def doRollover(self):
+        super(BatchedRotatingFileHandler, self).doRollover()
+        self.pending = 0
+        self.last_flush = time.monotonic()
+        if self.rotate_interval:
+            self.rollover_at = time.time() + self.rotate_interval
+
+    def flush(self):
+        # Called by StreamHandler.emit after each record : only flush when the batch is due
+        self.pending += 1
+        if self.pending >= self.flush_count or time.monotonic() - self.last_flush >= self.flush_interval:
+            self.force_flush()
+
+    def force_flush(self):
+        self.acquire()
+        try:
+            if self.stream is not None and hasattr(self.stream, 'flush'):
+                self.stream.flush()
+            self.pending = 0
+            self.last_flush = time.monotonic()
+        finally:
+            self.release()
+
+
+class RecordQueueHandler(QueueHandler):
+    def prepare(self, record):
+        # The records are formatted by the file handler, on the listener thread
+        return record
+
+
+class BatchedQueueListener(QueueListener):
+    def dequeue(self, block):
+        # Flush the pending records while the queue stays empty
+        while True:
+            try:
+                return self.queue.get(block, timeout=self.flush_interval)
+            except queue.Empty:
+                for handler in self.handlers:
+                    if getattr(handler, 'pending', 0):
+                        handler.force_flush()
+
+    @property
+    def flush_interval(self):
+        return min([getattr(h, 'flush_interval', 1.0) for h in self.handlers] or [1.0])
+
+
+class AsyncLogWriter():
+    """
+    Write the records of the *name* logger to *log_file* on a background thread.
+    An existing non empty log file is rolled over when the writer starts, so each session starts a new file.
+    """
+    def __init__(self, log_file, name='UMI', max_bytes=DEFAULT_MAX_BYTES, backup_count=DEFAULT_BACKUP_COUNT, rotate_interval=DEFAULT_ROTATE_INTERVAL, log_format=DEFAULT_LOG_FORMAT, time_format=DEFAULT_TIME_FORMAT):
+        self.log_file = log_file
+        self.queue = queue.Queue()
+        self.file_handler = BatchedRotatingFileHandler(log_file, max_bytes=max_bytes, backup_count=backup_count, rotate_interval=rotate_interval)
+        self.file_handler.setFormatter(logging.Formatter(log_format, datefmt=time_format))
+        self.listener = BatchedQueueListener(self.queue, self.file_handler)
+
+        self.logger = logging.getLogger(name)
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+
+    @property
+    def running(self):
+        return self.listener._thread is not None
+
+    def start(self):
+        # A previous writer for the same logger, left by an add-on reload
+        for handler in list(self.logger.handlers):
+            if isinstance(handler, RecordQueueHandler):
+                handler.writer.stop()
+
+        if os.path.isfile(self.log_file) and os.path.getsize(self.log_file):
+            self.file_handler.doRollover()
+
+        handler = RecordQueueHandler(self.queue)
+        handler.writer = self
+        self.logger.addHandler(handler)
+        self.handler = handler
+        self.listener.start()
+
+    def configure(self, max_bytes=None, backup_count=None, rotate_interval=None):
+        self.file_handler.acquire()
+        try:
+            if max_bytes is not None:
+                self.file_handler.maxBytes = max_bytes
+            if backup_count is not None:
+                self.file_handler.backupCount = backup_count
+            if rotate_interval is not None and rotate_interval != self.file_handler.rotate_interval:
+                self.file_handler.rotate_interval = rotate_interval
+                self.file_handler.rollover_at = self.file_handler.compute_rollover(self.file_handler.baseFilename)
+        finally:
+            self.file_handler.release()
+
+    def flush(self):
+        """
+        Block until every queued record is written to disk
+        """
+        if self.running:
+            self.queue.join()
+        self.file_handler.force_flush()
+
+    def stop(self):
+        if self.running:
+            self.listener.stop()
+        self.file_handler.force_flush()
+        self.file_handler.close()
+        if getattr(self, 'handler', None) in self.logger.handlers:
+            self.logger.removeHandler(self.handler)
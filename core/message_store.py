@@ -0,0 +1,71 @@
+from collections import deque
+
+DEFAULT_LOG_CAPACITY = 10000
+
+class MessageLevel():
+    # Colors are resolved from the level when the log is drawn
+    INFO = 'INFO'
+    SUCCESS = 'SUCCESS'
+    WARNING = 'WARNING'
+    ERROR = 'ERROR'
+    DEBUG = 'DEBUG'
+    IMPORT = 'IMPORT'
+    COMMAND = 'COMMAND'
+    CANCELLED = 'CANCELLED'
+
+# From https://stackoverflow.com/questions/30919275/inserting-period-after-every-3-chars-in-a-string
+def insert_str(my_str, each=50, char='\n'):
+    my_str = str(my_str)
+    return char.join(my_str[i:i+each] for i in range(0, len(my_str), each))
+
+# from https://stackoverflow.com/questions/9475241/split-string-every-nth-character
+def split_str(string, each=150):
+    return [string[i:i+each] for i in range(0, len(string), each)]
+
+class Message():
+    __slots__ = ('level', 'message')
+
+    def __init__(self, level, message):
+        self.level = level
+        self.message = message
+
+class MessageStore():
+    """
+    Lines displayed by the log overlay, in a ring buffer keeping the last *capacity* lines.
+    Long messages are split in lines of *line_length* characters.
+    """
+    def __init__(self, capacity=DEFAULT_LOG_CAPACITY, line_length=150):
+        self._messages = deque(maxlen=capacity)
+        self.count = 0
+        self.line_length = line_length
+
+    @property
+    def capacity(self):
+        return self._messages.maxlen
+
+    @property
+    def messages(self):
+        return self._messages
+
+    def append(self, message, level=MessageLevel.INFO):
+        if len(message) <= self.line_length:
+            # empty messages are logged to file only, as with split_str
+            if message:
+                self._messages.append(Message(level, message))
+        else:
+            for s in split_str(message, self.line_length):
+                self._messages.append(Message(level, s))
+
+        self.count += 1
+
+    def __len__(self):
+        return len(self._messages)
+
+    def __getitem__(self, item):
+        return self._messages[item]
+
+    def __iter__(self):
+        return iter(self._messages)
+
+    def __reversed__(self):
+        return reversed(self._messages)
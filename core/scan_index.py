@@ -0,0 +1,139 @@
+import os, sqlite3, threading
+from os import path
+from .file_record import FileRecord
+
+class ScanIndex():
+    """
+    Persistent SQLite index of scanned folders, used by FolderScanner to make rescans incremental.
+
+    Every folder is stored with its mtime and its full listing (files with size and mtime, and subfolders).
+    When a folder mtime did not change since the last scan, its listing is read from the index instead of the disk.
+    Each folder is still stat-ed once per scan, so changes deep in the hierarchy are detected.
+    A folder mtime only changes when entries are added, removed or renamed : a file rewritten in place
+    keeps its previous size in the index until its folder changes or the index is cleared.
+    """
+    SCHEMA_VERSION = 1
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        self.reused_folders = 0
+        self.scanned_folders = 0
+        self._lock = threading.Lock()
+
+        index_folder = path.dirname(index_path)
+        if index_folder:
+            os.makedirs(index_folder, exist_ok=True)
+
+        self._connection = sqlite3.connect(index_path, check_same_thread=False)
+        self._create_tables()
+
+    def _create_tables(self):
+        cursor = self._connection.cursor()
+        version = cursor.execute('PRAGMA user_version').fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            cursor.execute('DROP TABLE IF EXISTS folders')
+            cursor.execute('DROP TABLE IF EXISTS entries')
+            cursor.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+
+        cursor.execute('CREATE TABLE IF NOT EXISTS folders (path TEXT PRIMARY KEY, mtime INTEGER NOT NULL)')
+        cursor.execute('CREATE TABLE IF NOT EXISTS entries (folder TEXT NOT NULL, name TEXT NOT NULL, is_dir INTEGER NOT NULL, size INTEGER, mtime REAL)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS entries_folder ON entries (folder)')
+        self._connection.commit()
+
+    def list_folder(self, folder_path, extensions, list_subfolders=False):
+        """
+        Same contract as scanner.list_folder, reading the listing from the index when *folder_path* did not change.
+
+        :return: (records, subfolders, errors)
+        """
+        try:
+            folder_mtime = os.stat(folder_path).st_mtime_ns
+        except OSError as e:
+            return [], [], [e]
+
+        with self._lock:
+            row = self._connection.execute('SELECT mtime FROM folders WHERE path = ?', (folder_path,)).fetchone()
+            if row is not None and row[0] == folder_mtime:
+                self.reused_folders += 1
+                entries = self._connection.execute('SELECT name, is_dir, size, mtime FROM entries WHERE folder = ? ORDER BY rowid', (folder_path,)).fetchall()
+                return self._filter(folder_path, entries, extensions, list_subfolders) + ([],)
+
+        entries, errors = self._scandir(folder_path)
+
+        with self._lock:
+            self.scanned_folders += 1
+            if len(errors):
+                # An incomplete listing is not stored : fixing permissions doesn't change the folder mtime
+                self._connection.execute('DELETE FROM folders WHERE path = ?', (folder_path,))
+            else:
+                self._store(folder_path, folder_mtime, entries)
+
+        return self._filter(folder_path, entries, extensions, list_subfolders) + (errors,)
+
+    def _scandir(self, folder_path):
+        entries = []
+        errors = []
+        try:
+            scanner = os.scandir(folder_path)
+        except OSError as e:
+            return entries, [e]
+
+        with scanner:
+            for entry in scanner:
+                try:
+                    if entry.is_file():
+                        file_stats = entry.stat()
+                        entries.append((entry.name, 0, file_stats.st_size, file_stats.st_mtime))
+                    elif entry.is_dir():
+                        entries.append((entry.name, 1, None, None))
+                except OSError as e:
+                    errors.append(e)
+
+        return entries, errors
+
+    def _filter(self, folder_path, entries, extensions, list_subfolders):
+        records = []
+        subfolders = []
+        for name, is_dir, size, mtime in entries:
+            if is_dir:
+                if list_subfolders:
+                    subfolders.append(path.join(folder_path, name))
+            elif path.splitext(name)[1].lower() in extensions:
+                records.append(FileRecord(path.join(folder_path, name), size, mtime))
+
+        return records, subfolders
+
+    def _store(self, folder_path, folder_mtime, entries):
+        cursor = self._connection.cursor()
+
+        # Forget the subfolders that disappeared since the last scan, with their whole hierarchy
+        previous = {r[0] for r in cursor.execute('SELECT name FROM entries WHERE folder = ? AND is_dir = 1', (folder_path,))}
+        current = {e[0] for e in entries if e[1]}
+        for name in previous - current:
+            removed = path.join(folder_path, name)
+            # Escaped after adding the separator, which is a backslash on Windows
+            pattern = (removed + os.sep).replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            cursor.execute("DELETE FROM folders WHERE path = ? OR path LIKE ? ESCAPE '\\'", (removed, pattern))
+            cursor.execute("DELETE FROM entries WHERE folder = ? OR folder LIKE ? ESCAPE '\\'", (removed, pattern))
+
+        cursor.execute('DELETE FROM entries WHERE folder = ?', (folder_path,))
+        cursor.executemany('INSERT INTO entries VALUES (?, ?, ?, ?, ?)', [(folder_path,) + e for e in entries])
+        cursor.execute('INSERT OR REPLACE INTO folders VALUES (?, ?)', (folder_path, folder_mtime))
+
+    def close(self):
+        with self._lock:
+            self._connection.commit()
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def clear_scan_index(index_path):
+    if path.exists(index_path):
+        os.remove(index_path)
+        return True
+
+    return False
@@ -0,0 +1,129 @@
+import os
+import threading
+from os import path
+from concurrent.futures import ThreadPoolExecutor
+from .file_record import FileRecord
+
+def list_folder(folder_path, extensions, list_subfolders=False):
+    """
+    List *folder_path* once with os.scandir.
+
+    Entry types come from the DirEntry cache, so only compatible files are stat-ed, once.
+    Errors are returned instead of raised so they can be reported from the calling thread.
+
+    :return: (records, subfolders, errors)
+    """
+    records = []
+    subfolders = []
+    errors = []
+    try:
+        scanner = os.scandir(folder_path)
+    except OSError as e:
+        errors.append(e)
+        return records, subfolders, errors
+
+    with scanner:
+        for entry in scanner:
+            try:
+                if entry.is_file():
+                    if path.splitext(entry.name)[1].lower() not in extensions:
+                        continue
+                    file_stats = entry.stat()
+                    records.append(FileRecord(entry.path, file_stats.st_size, file_stats.st_mtime))
+                elif list_subfolders and entry.is_dir():
+                    subfolders.append(entry.path)
+            except OSError as e:
+                errors.append(e)
+
+    return records, subfolders, errors
+
+class FolderScanner():
+    """
+    Walk a folder hierarchy and yield a FileRecord for every compatible file found.
+
+    With thread_count > 1, sibling folders are listed concurrently by a bounded thread pool,
+    which hides the round-trip latency of network storage.
+    Both modes yield the same files in the same order : the files of a folder, then each subfolder in listing order.
+    The scan can be stopped from another place with cancel().
+    When a ScanIndex is given, folders that did not change since the previous scan are read from it.
+    """
+    def __init__(self, thread_count=1, index=None):
+        self.thread_count = max(1, thread_count)
+        self.index = index
+        self._list_folder = list_folder if index is None else index.list_folder
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def scan(self, folder_path, extensions, recursion_depth=0, on_error=None, yield_folders=False):
+        """
+        :arg extensions: lowercase extensions to keep, including the leading dot
+        :arg recursion_depth: how many subfolder levels are scanned, 0 scans only *folder_path*
+        :arg on_error: optional callable receiving the OSError raised by an unreadable entry
+        :arg yield_folders: also yield None after each folder, so that callers with a time budget
+            get control back while walking folders without compatible files
+        """
+        if self.thread_count > 1:
+            yield from self._scan_parallel(folder_path, extensions, recursion_depth, on_error, yield_folders)
+        else:
+            yield from self._scan(folder_path, extensions, recursion_depth, on_error, yield_folders)
+
+    def _report(self, errors, on_error):
+        if on_error is None:
+            return
+        for e in errors:
+            on_error(e)
+
+    def _scan(self, folder_path, extensions, recursion_depth, on_error, yield_folders):
+        records, subfolders, errors = self._list_folder(folder_path, extensions, recursion_depth > 0)
+        self._report(errors, on_error)
+        yield from records
+        if yield_folders:
+            yield None
+
+        for subfolder in subfolders:
+            if self.cancelled:
+                return
+            yield from self._scan(subfolder, extensions, recursion_depth - 1, on_error, yield_folders)
+
+    def _scan_parallel(self, folder_path, extensions, recursion_depth, on_error, yield_folders):
+        executor = ThreadPoolExecutor(max_workers=self.thread_count, thread_name_prefix='UMI_Scanner')
+        try:
+            root = executor.submit(self._list_task, executor, folder_path, extensions, recursion_depth)
+            yield from self._walk(root, on_error, yield_folders)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _list_task(self, executor, folder_path, extensions, recursion_depth):
+        records, subfolders, errors = self._list_folder(folder_path, extensions, recursion_depth > 0)
+
+        # Subfolders are queued as soon as they are known, the walk consumes them later in listing order
+        children = []
+        if not self.cancelled:
+            try:
+                children = [executor.submit(self._list_task, executor, s, extensions, recursion_depth - 1) for s in subfolders]
+            except RuntimeError:
+                # executor already shut down
+                pass
+
+        return records, children, errors
+
+    def _walk(self, future, on_error, yield_folders):
+        records, children, errors = future.result()
+        self._report(errors, on_error)
+        yield from records
+        if yield_folders:
+            yield None
+
+        for child in children:
+            if self.cancelled:
+                return
+            yield from self._walk(child, on_error, yield_folders)
+
+def scan_folder(folder_path, extensions, recursion_depth=0, on_error=None):
+    return FolderScanner().scan(folder_path, extensions, recursion_depth=recursion_depth, on_error=on_error)
@@ -0,0 +1,104 @@
+import re
+
+NUMBER_SUFFIX_PATTERN = re.compile(r'(\.[0-9]{3})$', re.IGNORECASE)
+
+def unique_name_clean_func(name):
+    match = NUMBER_SUFFIX_PATTERN.search(name)
+    if match is not None:
+        return name.replace(match.group(1), ''), True
+    else:
+        return name, False
+
+# a modified version of bpy_extras.io_utils
+def unique_name(key, name, name_dict, name_max=-1, clean_func=None, sep=".", register=True, used_names=None, counters=None):
+    """
+    Helper function for storing unique names which may have special characters
+    stripped and restricted to a maximum length.
+
+    :arg key: unique item this name belongs to, name_dict[key] will be reused
+    when available.
+    This can be the object, mesh, material, etc instance itself.
+    :type key: any hashable object associated with the *name*.
+    :arg name: The name used to create a unique value in *name_dict*.
+    :type name: string
+    :arg name_dict: This is used to cache namespace to ensure no collisions
+    occur, this should be an empty dict initially and only modified by this
+    function.
+    :type name_dict: dict
+    :arg clean_func: Function to call on *name* before creating a unique value.
+    :type clean_func: function
+    :arg sep: Separator to use when between the name and a number when a
+    duplicate name is found.
+    :type sep: string
+    :arg used_names: set of the values of *name_dict*, kept up to date by this function.
+    Avoids rebuilding it on each call when many names are allocated in the same *name_dict*.
+    :type used_names: set
+    :arg counters: next number to try per base name, kept up to date by this function.
+    Only valid when names are never removed from *name_dict*.
+    :type counters: dict
+    """
+    name_new = name_dict.get(key)
+    if name_new is None:
+        count = 1
+        has_number = False
+        if used_names is None:
+            used_names = set(name_dict.values())
+
+        if clean_func is None:
+            name_new = name_new_orig = name
+        else:
+            name_new, has_number = clean_func(name)
+            name_new_orig = name_new
+        if has_number or name_new in used_names:
+            if counters is not None:
+                count = counters.get((name_new_orig, sep, name_max), 1)
+            if name_max == -1:
+                while name_new in used_names:
+                    name_new = "%s%s%03d" % (
+                        name_new_orig,
+                        sep,
+                        count,
+                    )
+                    count += 1
+            else:
+                name_new = name_new[:name_max]
+                while name_new in used_names:
+                    count_str = "%03d" % count
+                    name_new = "%.*s%s%s" % (
+                        name_max - (len(count_str) + 1),
+                        name_new_orig,
+                        sep,
+                        count_str,
+                    )
+                    count += 1
+
+            if counters is not None and register:
+                counters[(name_new_orig, sep, name_max)] = count
+
+        if register:
+            name_dict[key] = name_new
+            used_names.add(name_new)
+
+    return name_new
+
+class NameRegistry():
+    """
+    name_dict of unique_name() with the set of its values, for allocating many names in constant time each.
+    """
+    def __init__(self):
+        self.names = {}
+        self.used_names = set()
+        self.counters = {}
+
+    def unique_name(self, key, name, name_max=-1, clean_func=None, sep=".", register=True):
+        return unique_name(key, name, self.names, name_max=name_max, clean_func=clean_func, sep=sep, register=register, used_names=self.used_names, counters=self.counters)
+
+    def register(self, key, name):
+        previous = self.names.get(key)
+        self.names[key] = name
+        self.used_names.add(name)
+        if previous is not None and previous != name:
+            if previous not in self.names.values():
+                self.used_names.discard(previous)
+            # The counters skip numbers that were used : the freed name must be found again
+            self.counters.clear()
@@ -0,0 +1,214 @@
+import json
+import os
+import queue
+import subprocess
+import threading
+from collections import deque
+
+EVENT_PREFIX = 'UMI_WORKER '
+
+
+def to_json_value(value):
+    # Enum flag properties are sets, which json can't store
+    if isinstance(value, set):
+        return {'__set__': sorted(value)}
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+def from_json_value(value):
+    if isinstance(value, dict) and '__set__' in value:
+        return set(value['__set__'])
+    return value
+
+
+def encode_event(event, **data):
+    data['event'] = event
+    return EVENT_PREFIX + json.dumps(data)
+
+
+def decode_event(line):
+    if not line.startswith(EVENT_PREFIX):
+        return None
+    try:
+        return json.loads(line[len(EVENT_PREFIX):])
+    except ValueError:
+        return None
+
+
+def current_rss_mb():
+    """
+    Resident memory of the current process in MB, from /proc on Linux or psutil when it is installed.
+    None when it can't be measured : the peak resident memory would look like a valid value.
+    """
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+def split_shards(batches, shard_count):
+    """
+    Distribute the batches between *shard_count* shards, largest batch first to the least loaded shard.
+    Each shard is a list of filepaths, keeping the batches order inside a shard.
+    """
+    loads = [0.0] * shard_count
+    shards = [[] for _ in range(shard_count)]
+    for index in sorted(range(len(batches)), key=lambda i: batches[i].size, reverse=True):
+        shard = loads.index(min(loads))
+        shards[shard].append(index)
+        loads[shard] += batches[index].size
+
+    return [[f for i in sorted(s) for f in batches[i].filepaths] for s in shards if len(s)]
+
+
+class ImportWorker():
+    """
+    One long-lived background process, receiving jobs as JSON lines on its stdin.
+    Its output is read on a thread, and the lines following the worker protocol are pushed to *events* as dicts.
+    """
+    def __init__(self, index, command, events):
+        self.index = index
+        self.command = command
+        self.events = events
+        self.process = None
+        self.job = None
+        self.retiring = False
+        self.output_tail = []
+        self._reader = None
+
+    def start(self):
+        self.process = subprocess.Popen(self.command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, stdin=subprocess.PIPE, text=True, errors='replace', bufsize=1)
+        self._reader = threading.Thread(target=self._read_output, daemon=True)
+        self._reader.start()
+
+    def _read_output(self):
+        for line in self.process.stdout:
+            event = decode_event(line.rstrip('\n'))
+            if event is None:
+                # Keep the last lines of Blender output to explain a crash
+                self.output_tail = (self.output_tail + [line.rstrip()])[-20:]
+                continue
+            event['worker'] = self.index
+            self.events.put(event)
+        self.process.wait()
+        self.events.put({'event': 'exited', 'worker': self.index, 'returncode': self.process.returncode, 'output': self.output_tail})
+
+    def send(self, message):
+        try:
+            self.process.stdin.write(json.dumps(message) + '\n')
+            self.process.stdin.flush()
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def submit(self, job):
+        self.job = job['job']
+        if not self.send(job):
+            self.job = None
+            return False
+        return True
+
+    @property
+    def running(self):
+        return self.process is not None and self.process.poll() is None
+
+    def stop(self):
+        if self.running:
+            self.send({'command': 'quit'})
+
+    def terminate(self):
+        if self.running:
+            self.process.kill()
+
+
+class WorkerPool():
+    """
+    Keep up to *size* workers alive between import sessions, so that Blender startup is only paid once.
+    Jobs are queued and sent to idle workers, spawning new ones when needed.
+    A worker exits by itself when it has to be recycled : it is replaced on the next job.
+    """
+    def __init__(self, command, size):
+        self.command = command
+        self.size = size
+        self.events = queue.Queue()
+        self.workers = []
+        self.queued = deque()
+        self._worker_count = 0
+
+    def submit(self, jobs):
+        self.queued.extend(jobs)
+        self._dispatch()
+
+    def _dispatch(self):
+        while len(self.queued):
+            # Exited workers are only removed once their exit event is polled, to report their job
+            worker = next((w for w in self.workers if w.job is None and not w.retiring and w.running), None)
+            if worker is None:
+                if len(self.workers) >= self.size:
+                    return
+                worker = ImportWorker(self._worker_count, self.command, self.events)
+                self._worker_count += 1
+                worker.start()
+                self.workers.append(worker)
+            if not worker.submit(self.queued[0]):
+                worker.terminate()
+                return
+            self.queued.popleft()
+
+    def _worker(self, index):
+        return next((w for w in self.workers if w.index == index), None)
+
+    def poll_events(self):
+        events = []
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            worker = self._worker(event['worker'])
+            if event['event'] == 'recycled' and worker is not None:
+                # Sent before job_done, so that no job is given to a worker about to exit
+                worker.retiring = True
+            elif event['event'] == 'job_done' and worker is not None:
+                worker.job = None
+            elif event['event'] == 'exited':
+                # A job still running on an exited worker is lost
+                event['job'] = worker.job if worker is not None else None
+                if worker is not None:
+                    worker.job = None
+                    self.workers.remove(worker)
+            events.append(event)
+
+        if len(events):
+            self._dispatch()
+        return events
+
+    @property
+    def finished(self):
+        return not len(self.queued) and all(w.job is None for w in self.workers)
+
+    def cancel(self):
+        # Idle workers stay alive for the next session, busy ones can only be stopped by killing them
+        self.queued.clear()
+        for w in self.workers:
+            if w.job is not None:
+                w.terminate()
+
+    def shutdown(self):
+        self.queued.clear()
+        for w in self.workers:
+            w.stop()
+        for w in self.workers:
+            try:
+                w.process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                w.terminate()
+        self.workers = []
@@ -0,0 +1 @@
+from .headless_import import HeadlessImporter, ManifestError, load_manifest, run_manifest, EXIT_SUCCESS, EXIT_IMPORT_FAILED, EXIT_INVALID_MANIFEST
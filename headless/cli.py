@@ -0,0 +1,45 @@
+# Command line entry point of the headless import :
+#   blender --background --python headless/cli.py -- manifest.json [--report report.json]
+# The add-on has to be enabled in the preferences used by this Blender. The process exits with the code of run_manifest().
+import bpy
+import importlib
+import os
+import sys
+import traceback
+
+
+def find_addon_package():
+    addon_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for name in bpy.context.preferences.addons.keys():
+        module = sys.modules.get(name)
+        if module is not None and os.path.dirname(os.path.abspath(module.__file__)) == addon_folder:
+            return name
+    return None
+
+
+def main():
+    args = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    if not len(args):
+        print('UMI : usage : blender --background --python cli.py -- manifest.json [--report report.json]')
+        sys.exit(2)
+
+    report_path = None
+    if '--report' in args:
+        report_path = os.path.abspath(args[args.index('--report') + 1])
+
+    package = find_addon_package()
+    if package is None:
+        print('UMI : Universal Multi Importer is not enabled in the preferences')
+        sys.exit(2)
+
+    headless = importlib.import_module(f'{package}.headless')
+    try:
+        exit_code = headless.run_manifest(os.path.abspath(args[0]), report_path=report_path)
+    except Exception:
+        traceback.print_exc()
+        exit_code = headless.EXIT_IMPORT_FAILED
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__':
+    main()
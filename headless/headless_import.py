@@ -0,0 +1,240 @@
+import bpy
+import json
+import os
+import time
+from os import path
+from ..core import FolderScanner, FileRecordStore, FileStatus, plan_batches, stat_file
+from ..import_module.import_plan import ImportPlans
+from ..import_module.datablock_tracker import DatablockTracker
+from ..preferences.formats import COMPATIBLE_FORMATS, get_format_handler, get_current_format_handler
+from ..umi_const import get_umi_settings
+from ..logger import LOG
+
+REPORT_VERSION = 1
+
+EXIT_SUCCESS = 0
+EXIT_IMPORT_FAILED = 1
+EXIT_INVALID_MANIFEST = 2
+
+
+class ManifestError(Exception):
+    pass
+
+
+def load_manifest(manifest_path):
+    """
+    Read a JSON or TOML manifest. Relative paths in it are resolved from the manifest folder.
+    """
+    try:
+        if path.splitext(manifest_path)[1].lower() == '.toml':
+            try:
+                import tomllib
+            except ImportError:
+                raise ManifestError('TOML manifests need Python 3.11 or newer, use a JSON manifest instead')
+            with open(manifest_path, 'rb') as f:
+                manifest = tomllib.load(f)
+        else:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ManifestError(f'Unable to read manifest {manifest_path} : {e}')
+
+    if not isinstance(manifest, dict):
+        raise ManifestError('The manifest must be a JSON object or a TOML table')
+    manifest.setdefault('base_folder', path.dirname(path.abspath(manifest_path)))
+    return manifest
+
+
+class HeadlessImporter():
+    """
+    Run the UMI pipeline synchronously, without any UI : scan -> plan -> import -> post-process.
+
+    Manifest keys, all optional except one of files/folders :
+        files : list of files to import
+        folders : list of folders, or of {"path", "recursion_depth"} tables
+        extensions : extensions to import from folders, every compatible extension by default
+        settings : per format import settings, {"fbx": {"module": "default", "global_scale": 0.01}}
+        max_batch_size, max_file_count, minimize_batch_number : batch planning, as in the import dialog
+        create_collection_per_file : link the objects of each file in its own collection, true by default
+        commands : commands run on every imported object after each batch, as in the command batcher
+        output : .blend file saved once everything is imported
+        report : JSON file receiving the result of each file
+    """
+    def __init__(self, manifest):
+        self.manifest = manifest
+        self.base_folder = manifest.get('base_folder', os.getcwd())
+        self.umi_settings = get_umi_settings()
+        self.file_records = FileRecordStore()
+        self.datablocks = DatablockTracker()
+        self.module_names = {}
+        self.import_plans = ImportPlans(get_format_handler, self.get_import_module_name)
+        self.results = []
+
+    def resolve(self, filepath):
+        return path.normpath(path.join(self.base_folder, path.expanduser(filepath)))
+
+    def get_import_module_name(self, format_name):
+        if format_name in self.module_names:
+            return self.module_names[format_name]
+        return get_current_format_handler(format_name).module_name
+
+    def apply_settings(self):
+        for format_name, settings in self.manifest.get('settings', {}).items():
+            if getattr(COMPATIBLE_FORMATS, format_name, None) is None:
+                raise ManifestError(f'Unknown format "{format_name}" in settings')
+            settings = dict(settings)
+            if 'module' in settings:
+                module_name = settings.pop('module').lower()
+                if module_name not in getattr(COMPATIBLE_FORMATS, format_name)['operator']:
+                    raise ManifestError(f'Unknown import module "{module_name}" for format "{format_name}"')
+                self.module_names[format_name] = module_name
+            format_settings = get_format_handler(format_name, self.get_import_module_name(format_name)).format_settings
+            for k, v in settings.items():
+                try:
+                    setattr(format_settings, k, set(v) if isinstance(v, list) and isinstance(getattr(format_settings, k, None), set) else v)
+                except (AttributeError, TypeError, ValueError) as e:
+                    raise ManifestError(f'Invalid setting "{k}" for format "{format_name}" : {e}')
+
+    def collect_files(self):
+        extensions = frozenset(e.lower() for e in self.manifest.get('extensions', COMPATIBLE_FORMATS.extensions))
+        filepaths = []
+        for f in self.manifest.get('files', []):
+            filepath = self.resolve(f)
+            if not path.isfile(filepath):
+                raise ManifestError(f'File not found : {filepath}')
+            if path.splitext(filepath)[1].lower() not in COMPATIBLE_FORMATS.extension_set:
+                raise ManifestError(f'Unsupported file format : {filepath}')
+            self.file_records.add(stat_file(filepath))
+            filepaths.append(filepath)
+
+        scanner = FolderScanner()
+        for folder in self.manifest.get('folders', []):
+            if isinstance(folder, str):
+                folder = {'path': folder}
+            folder_path = self.resolve(folder['path'])
+            if not path.isdir(folder_path):
+                raise ManifestError(f'Folder not found : {folder_path}')
+            for record in scanner.scan(folder_path, extensions, recursion_depth=folder.get('recursion_depth', 0), on_error=LOG.warning):
+                self.file_records.add(record)
+                filepaths.append(record.path)
+
+        if not len(filepaths):
+            raise ManifestError('No file to import')
+        return filepaths
+
+    def import_file(self, record, root_collection):
+        view_layer = bpy.context.view_layer
+        import_col = root_collection
+        if self.manifest.get('create_collection_per_file', True):
+            import_col = bpy.data.collections.new(name=record.name)
+            root_collection.children.link(import_col)
+            for layer_col in view_layer.layer_collection.children:
+                if layer_col.collection == import_col:
+                    view_layer.active_layer_collection = layer_col
+                    break
+
+        result = {'path': record.path, 'status': FileStatus.FAILED, 'format': None, 'module': None, 'seconds': 0, 'objects': 0, 'error': None}
+        self.results.append(result)
+        self.datablocks.mark()
+        start = time.perf_counter()
+        try:
+            plan = self.import_plans.get(record.ext)
+            result['format'] = record.format_name = plan.format_name
+            result['module'] = record.module_name = plan.module_name
+            succeeded = 'FINISHED' in plan(record.path)
+        except Exception as e:
+            succeeded = False
+            result['error'] = str(e)
+        result['seconds'] = time.perf_counter() - start
+
+        new_objects = self.datablocks.new('objects')
+        for o in new_objects:
+            if import_col not in o.users_collection:
+                previous_cols = list(o.users_collection)
+                import_col.objects.link(o)
+                for c in previous_cols:
+                    c.objects.unlink(o)
+
+        record.status = result['status'] = FileStatus.SUCCEEDED if succeeded else FileStatus.FAILED
+        result['objects'] = len(new_objects)
+        if succeeded:
+            LOG.success(f'Imported {record.path} in {round(result["seconds"], 2)}s')
+        else:
+            LOG.error(f'Failed to import {record.path} : {result["error"]}')
+        return new_objects
+
+    def post_process(self, objects):
+        for command in self.manifest.get('commands', []):
+            for o in objects:
+                try:
+                    with bpy.context.temp_override(selected_objects=[o], active_object=o, object=o):
+                        exec(command, {'bpy': bpy})
+                except Exception as e:
+                    message = f'{o.name} : Command "{command}" is not valid - {e}'
+                    LOG.error(message)
+                    self.command_errors.append(message)
+
+    def run(self):
+        start = time.perf_counter()
+        self.command_errors = []
+        self.apply_settings()
+        filepaths = self.collect_files()
+        files = [(f, self.file_records[f].size_mb) for f in filepaths]
+        batches = plan_batches(files, self.manifest.get('max_batch_size', 0), self.manifest.get('max_file_count', 0), minimize_batch_number=self.manifest.get('minimize_batch_number', False))
+        LOG.info(f'{len(filepaths)} file(s) to import in {len(batches)} batch(es)')
+
+        root_collection = bpy.context.scene.collection
+        for i, batch in enumerate(batches):
+            LOG.info(f'Batch {i + 1}/{len(batches)} : {len(batch.filepaths)} file(s)')
+            batch_objects = []
+            for f in batch.filepaths:
+                batch_objects += self.import_file(self.file_records[f], root_collection)
+            self.post_process(batch_objects)
+
+        output = self.manifest.get('output')
+        if output:
+            bpy.ops.wm.save_as_mainfile(filepath=self.resolve(output), check_existing=False)
+
+        return self.report(time.perf_counter() - start)
+
+    def report(self, duration):
+        failed = [r for r in self.results if r['status'] == FileStatus.FAILED]
+        return {'version': REPORT_VERSION,
+                'succeeded': len(self.results) - len(failed),
+                'failed': len(failed),
+                'command_errors': self.command_errors,
+                'duration': duration,
+                'output': self.resolve(self.manifest['output']) if self.manifest.get('output') else None,
+                'files': self.results}
+
+
+def write_report(report, report_path):
+    report_folder = path.dirname(report_path)
+    if report_folder:
+        os.makedirs(report_folder, exist_ok=True)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=1)
+
+
+def run_manifest(manifest_path, report_path=None):
+    """
+    Import everything listed in a manifest and write the report. Returns the process exit code :
+    0 when every file is imported, 1 when a file or a command failed, 2 when the manifest is invalid.
+    """
+    try:
+        manifest = load_manifest(manifest_path)
+        report_path = report_path or manifest.get('report')
+        if report_path:
+            report_path = path.join(manifest['base_folder'], report_path)
+        report = HeadlessImporter(manifest).run()
+    except ManifestError as e:
+        LOG.error(str(e))
+        report = {'version': REPORT_VERSION, 'error': str(e)}
+        if report_path:
+            write_report(report, report_path)
+        return EXIT_INVALID_MANIFEST
+
+    if report_path:
+        write_report(report, report_path)
+    LOG.info(f'Completed with {report["succeeded"]} success(es) and {report["failed"]} failure(s) in {round(report["duration"], 2)}s')
+    return EXIT_IMPORT_FAILED if report['failed'] or len(report['command_errors']) else EXIT_SUCCESS
@@ -1,6 +1,6 @@
-from . import blend_format
+from . import blend_format, worker_service, event_service
 
-modules = (blend_format, )
+modules = (blend_format, worker_service, event_service)
 
 def register():
     for m in modules:
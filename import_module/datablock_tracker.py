@@ -0,0 +1,41 @@
+import bpy
+
+# Each tracked collection is read twice per imported file : only track what is used
+TRACKED_COLLECTIONS = ('objects',)
+PROFILED_COLLECTIONS = ('objects', 'meshes', 'materials')
+
+
+class DatablockTracker():
+    """
+    Find the datablocks created since the last call to mark().
+
+    Blender gives every ID a session_uid from an increasing counter, so a datablock is new when its uid is above the
+    highest uid seen at mark time : mark() stores one integer per collection instead of a set of pointers.
+    Both mark() and new() still go over every datablock of the collection, there is no API listing only the new ones.
+    Without session_uid, a set of pointers is stored at mark time instead.
+    """
+    def __init__(self, collections=TRACKED_COLLECTIONS):
+        self.collections = collections
+        self.use_session_uid = 'session_uid' in bpy.types.ID.bl_rna.properties
+        self._high_water = {}
+        self._pointers = {}
+
+    def _max_uid(self, datablocks, default=0):
+        return max((d.session_uid for d in datablocks), default=default)
+
+    def mark(self):
+        for name in self.collections:
+            if not self.use_session_uid:
+                self._pointers[name] = {d.as_pointer() for d in getattr(bpy.data, name)}
+            else:
+                # Datablocks created since the previous file (commands, user edits between ticks) must not count as imported
+                self._high_water[name] = self._max_uid(getattr(bpy.data, name))
+
+    def new(self, name):
+        datablocks = getattr(bpy.data, name)
+        if not self.use_session_uid:
+            pointers = self._pointers[name]
+            return [d for d in datablocks if d.as_pointer() not in pointers]
+
+        high_water = self._high_water[name]
+        return [d for d in datablocks if d.session_uid > high_water]
@@ -0,0 +1,44 @@
+from ..core import ImportEventStream
+from ..umi_const import get_umi_performance
+from ..logger import LOG
+
+_event_stream = None
+
+
+def start_event_stream(kind, **fields):
+    """
+    Start the event stream of a new import session, if enabled in the preferences. The previous session is ended first.
+    """
+    global _event_stream
+    end_event_stream('interrupted')
+
+    performance = get_umi_performance()
+    if not performance.write_import_events:
+        return None
+
+    try:
+        _event_stream = ImportEventStream(performance.import_events_file, performance.import_metrics_file, metrics_interval=performance.import_metrics_interval, on_error=LOG.warning)
+        _event_stream.session_start(kind, **fields)
+    except OSError as e:
+        LOG.warning(f'Import events not written : {e}')
+        _event_stream = None
+
+    return _event_stream
+
+
+def get_event_stream():
+    return _event_stream
+
+
+def end_event_stream(status, **fields):
+    global _event_stream
+    if _event_stream is not None:
+        _event_stream.session_end(status, **fields)
+    _event_stream = None
+
+
+def register():
+    pass
+
+def unregister():
+    end_event_stream('interrupted')
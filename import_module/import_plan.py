@@ -0,0 +1,90 @@
+import bpy
+import time
+from ..preferences.formats import COMPATIBLE_FORMATS
+from ..preferences.formats.format_compatible import resolve_operator
+from ..core import to_json_value, hash_settings
+
+
+def to_operator_value(value):
+    if isinstance(value, (bool, int, float, str, set)):
+        return value
+    if isinstance(value, bpy.types.bpy_prop_collection):
+        return [{'name': item.name} for item in value]
+    # bpy_prop_array and mathutils types
+    return tuple(value)
+
+
+class ImportPlan():
+    """
+    Operator and arguments used to import every file of one format with one module.
+    Built once per import session : each file only substitutes its path in the arguments.
+    """
+    def __init__(self, format_name, module_name, command, format_handler):
+        self.format_name = format_name
+        self.module_name = module_name
+        self.command = command
+        self.operator = resolve_operator(command)
+        self.use_files = format_name == 'image' and module_name in ['plane']
+        self.kwargs = {}
+        for k in format_handler.format_settings_dict.keys():
+            value = to_operator_value(getattr(format_handler.format_settings, k))
+            if isinstance(value, list) and not len(value):
+                continue
+            self.kwargs[k] = value
+        self.settings_hash = hash_settings(self.to_dict()['kwargs'])
+        self.import_time = 0
+        self.import_count = 0
+
+    def to_dict(self):
+        # JSON safe description used by the background import workers
+        return {'command': self.command, 'use_files': self.use_files, 'kwargs': {k: to_json_value(v) for k, v in self.kwargs.items()}}
+
+    def arguments(self, filepath):
+        kwargs = dict(self.kwargs)
+        if self.use_files:
+            kwargs['files'] = [{'name': filepath}]
+        else:
+            kwargs['filepath'] = filepath
+        return kwargs
+
+    def __call__(self, filepath):
+        kwargs = self.arguments(filepath)
+        start = time.perf_counter()
+        try:
+            return self.operator(**kwargs)
+        finally:
+            self.import_time += time.perf_counter() - start
+            self.import_count += 1
+
+
+class ImportPlans():
+    """
+    Import plans of a session, with the extension to format lookup cached.
+    """
+    def __init__(self, get_format_handler, get_module_name):
+        self.get_format_handler = get_format_handler
+        self.get_module_name = get_module_name
+        self._format_names = {}
+        self._plans = {}
+
+    def format_name(self, ext):
+        if ext not in self._format_names:
+            self._format_names[ext] = COMPATIBLE_FORMATS.get_format_from_extension(ext)['name']
+        return self._format_names[ext]
+
+    def get(self, ext):
+        format_name = self.format_name(ext)
+        module_name = self.get_module_name(format_name)
+        key = (format_name, module_name)
+        if key not in self._plans:
+            command = COMPATIBLE_FORMATS.get_operator_name_from_extension(ext)[module_name]['command']
+            self._plans[key] = ImportPlan(format_name, module_name, command, self.get_format_handler(format_name, module_name))
+        return self._plans[key]
+
+    @property
+    def import_time(self):
+        return sum(p.import_time for p in self._plans.values())
+
+    def clear(self):
+        self._format_names.clear()
+        self._plans.clear()
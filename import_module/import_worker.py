@@ -0,0 +1,120 @@
+# Entry point of the background Blender processes used by the parallel import :
+#   blender --background --python import_worker.py -- [memory_limit_mb]
+# The worker stays alive and reads jobs as JSON lines on its stdin. For each job, it imports the files in their own
+# collection and saves the result to the .blend file set in the job, then waits for the next one.
+# It exits on a "quit" command, when stdin is closed, or when it has to be recycled.
+import bpy
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.worker_pool import encode_event, from_json_value, current_rss_mb
+
+current_job = None
+
+
+def emit(event, **data):
+    print(encode_event(event, job=current_job, **data), flush=True)
+
+
+def set_memory_limit(limit_mb):
+    if not limit_mb:
+        return
+    try:
+        import resource
+    except ImportError:
+        emit('warning', message='Worker memory limit is not supported on this platform')
+        return
+    limit = limit_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def resolve_operator(command):
+    category, name = command.split('.')[-2:]
+    return getattr(getattr(bpy.ops, category), name)
+
+
+def find_layer_collection(layer_collection, collection):
+    if layer_collection.collection == collection:
+        return layer_collection
+    for child in layer_collection.children:
+        found = find_layer_collection(child, collection)
+        if found is not None:
+            return found
+
+
+def import_file(filepath, plan, view_layer):
+    # Same name as the collections of in-process imports, skip_already_imported_files relies on it
+    name = os.path.basename(filepath)
+    collection = bpy.data.collections.new(name=name)
+    bpy.context.scene.collection.children.link(collection)
+    view_layer.active_layer_collection = find_layer_collection(view_layer.layer_collection, collection)
+
+    kwargs = {k: from_json_value(v) for k, v in plan['kwargs'].items()}
+    if plan['use_files']:
+        kwargs['files'] = [{'name': filepath}]
+    else:
+        kwargs['filepath'] = filepath
+
+    emit('started', file=filepath)
+    start = time.perf_counter()
+    error = None
+    try:
+        success = 'FINISHED' in resolve_operator(plan['command'])(**kwargs)
+    except Exception as e:
+        success = False
+        error = str(e)
+
+    emit('imported', file=filepath, success=success, seconds=time.perf_counter() - start, collection=collection.name, error=error)
+
+
+def run_job(job):
+    # Start each job from an empty file, the previous results are already saved
+    bpy.ops.wm.read_homefile(use_empty=True)
+    view_layer = bpy.context.view_layer
+
+    for filepath in job['files']:
+        ext = os.path.splitext(filepath)[1].lower()
+        import_file(filepath, job['plans'][ext], view_layer)
+
+    bpy.ops.wm.save_as_mainfile(filepath=job['output'], check_existing=False)
+
+
+def main():
+    global current_job
+    args = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    set_memory_limit(int(args[0]) if len(args) else 0)
+    emit('ready')
+
+    imported_count = 0
+    for line in sys.stdin:
+        job = json.loads(line)
+        if job.get('command') == 'quit':
+            break
+
+        current_job = job['job']
+        run_job(job)
+        imported_count += len(job['files'])
+        rss = current_rss_mb()
+
+        # Importers can leak memory : start from a fresh process once a limit is reached.
+        # Recycling is announced before the end of the job, so that the pool doesn't send another job
+        recycle_reason = None
+        if job['recycle_files'] and imported_count >= job['recycle_files']:
+            recycle_reason = f'{imported_count} files imported'
+        elif job['recycle_memory'] and rss is not None and rss >= job['recycle_memory']:
+            recycle_reason = f'{round(rss)}MB of memory used'
+
+        if recycle_reason is not None:
+            emit('recycled', reason=recycle_reason)
+        emit('job_done', output=job['output'], rss=rss)
+        current_job = None
+
+        if recycle_reason is not None:
+            break
+
+
+if __name__ == '__main__':
+    main()
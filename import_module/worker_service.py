@@ -0,0 +1,41 @@
+import bpy
+from os import path
+from ..core import WorkerPool
+from ..umi_const import ADDON_FOLDER_PATH
+
+WORKER_SCRIPT = path.join(ADDON_FOLDER_PATH, 'import_module', 'import_worker.py')
+
+_worker_pool = None
+_worker_pool_config = None
+
+
+def get_worker_pool(worker_count, memory_limit):
+    """
+    Return the background worker pool shared by the import sessions, restarting it if its configuration changed.
+    """
+    global _worker_pool, _worker_pool_config
+    config = (worker_count, memory_limit)
+    if _worker_pool is not None and _worker_pool_config != config:
+        shutdown_worker_pool()
+
+    if _worker_pool is None:
+        command = [bpy.app.binary_path, '--background', '--python-exit-code', '1', '--python', WORKER_SCRIPT, '--', str(memory_limit)]
+        _worker_pool = WorkerPool(command, worker_count)
+        _worker_pool_config = config
+
+    return _worker_pool
+
+
+def shutdown_worker_pool():
+    global _worker_pool, _worker_pool_config
+    if _worker_pool is not None:
+        _worker_pool.shutdown()
+    _worker_pool = None
+    _worker_pool_config = None
+
+
+def register():
+    pass
+
+def unregister():
+    shutdown_worker_pool()
@@ -1,7 +1,34 @@
 import bpy
 import blf
-from .logger_base import Logger, SCROLL_OFFSET_INCREMENT
+import math, time
+from .logger_base import Logger, LoggerColors, SCROLL_OFFSET_INCREMENT
+from ..core import MessageLevel
 from ..blender_version import BVERSION
+from ..umi_const import get_umi_performance
+
+FIRST_LINE_POSITION = 30
+DEFAULT_DRAW_BUDGET = 0.004
+# Number of lines drawn between two checks of the draw time budget
+BUDGET_CHECK_LINES = 16
+
+def level_colors():
+    default_color = LoggerColors.DEFAULT_COLOR()
+    return {MessageLevel.INFO: default_color,
+            MessageLevel.SUCCESS: LoggerColors.SUCCESS_COLOR(),
+            MessageLevel.WARNING: LoggerColors.WARNING_COLOR(),
+            MessageLevel.ERROR: LoggerColors.ERROR_COLOR(),
+            MessageLevel.DEBUG: tuple(c * 0.2 for c in default_color),
+            MessageLevel.IMPORT: LoggerColors.IMPORT_COLOR(),
+            MessageLevel.COMMAND: LoggerColors.COMMAND_COLOR(),
+            MessageLevel.CANCELLED: LoggerColors.CANCELLED_COLOR()}
+
+
+def get_log_draw_budget():
+    try:
+        return get_umi_performance().log_draw_budget / 1000
+    except Exception:
+        return DEFAULT_DRAW_BUDGET
+
 
 class LoggerProgress(Logger):
     def __init__(self, log_name='ROOT'):
@@ -11,20 +38,64 @@ class LoggerProgress(Logger):
         self.scroll_offset = 0
         self.completed = False
         self.show_log = True
+
+        # Geometry of the region the log is drawn in, only recomputed when it is resized
+        self.region_size = None
+        self.esc_offset = 1500
+        self.visible_lines = 100
+
+        self.draw_budget = DEFAULT_DRAW_BUDGET
+        self.clear_draw_stats()
         
     def revert_parameters(self):
         super(LoggerProgress, self).revert_parameters()
         self.scroll_offset = 0
         self.completed = False
+        self.draw_budget = get_log_draw_budget()
+        self.clear_draw_stats()
     
+    def clear_draw_stats(self):
+        self.draw_count = 0
+        self.draw_time = 0
+        self.max_draw_time = 0
+        self.over_budget_count = 0
+
     def scroll(self, up=True, multiplier=1.0):
         sign = -1.0 if up else 1.0
         self.scroll_offset += sign * SCROLL_OFFSET_INCREMENT * multiplier
 
+    @property
+    def line_width(self):
+        return self.fontsize + 3
+
+    def update_region_geometry(self, context):
+        region = context.region
+        area = context.area
+        if region is None or area is None:
+            return
+
+        size = (area.width, region.height)
+        if size == self.region_size:
+            return
+        
+        self.region_size = size
+        self.esc_offset = area.width - 85
+        self.visible_lines = math.ceil(region.height / self.line_width) + 1
+
+    def visible_range(self):
+        """
+        Return the range of message indices, counted from the most recent one, that are inside the region
+        """
+        line_width = self.line_width
+        first = max(0, math.floor((-self.scroll_offset - FIRST_LINE_POSITION) / line_width))
+        last = min(len(self.messages), first + self.visible_lines + 1)
+        return first, last
+
     def draw_callback_px(self, context):
         if not self.show_log and not self.completed:
             return
         
+        start = time.perf_counter()
         font_id = 0  # XXX, need to find out how best to get this.
 
         # draw some text
@@ -32,29 +103,34 @@ class LoggerProgress(Logger):
             blf.size(font_id, self.fontsize)
         else:
             blf.size(font_id, self.fontsize, 72)
-        pos = 30
-        line_width = self.fontsize + 3
-        
-        for m in reversed(self.messages):
-            blf.color(font_id, m.color.r, m.color.g, m.color.b, 0.8)
-            blf.position(font_id, self.fontsize, pos + self.scroll_offset, 0)
+        line_width = self.line_width
+        colors = level_colors()
+        default_color = colors[MessageLevel.INFO]
+
+        self.update_region_geometry(context)
+
+        # Only draw the lines inside the region, from the bottom up
+        messages = self.messages
+        message_count = len(messages)
+        first, last = self.visible_range()
+        pos = FIRST_LINE_POSITION + first * line_width + self.scroll_offset
+        deadline = start + self.draw_budget
+        over_budget = False
+        for i in range(first, last):
+            if (i - first) % BUDGET_CHECK_LINES == BUDGET_CHECK_LINES - 1 and time.perf_counter() > deadline:
+                over_budget = True
+                break
+            m = messages[message_count - 1 - i]
+            color = colors.get(m.level, default_color)
+            blf.color(font_id, color[0], color[1], color[2], 0.8)
+            blf.position(font_id, self.fontsize, pos, 0)
             blf.draw(font_id, m.message)
             pos += line_width
-        
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                self.view3d = area
-                break
-        else:
-            self.view3d = None
 
-        if self.view3d is None:
-            offset = 1500
-        else:
-            offset = self.view3d.width - 85
+        offset = self.esc_offset
 
         # [ESC]
-        blf.color(font_id, self.color.r,self.color.g,self.color.b, 0.5)
+        blf.color(font_id, default_color[0], default_color[1], default_color[2], 0.5)
         blf.position(font_id, offset - self.message_offset, self.fontsize, 0)
         blf.draw(font_id, self.esc_message)
         
@@ -67,6 +143,22 @@ class LoggerProgress(Logger):
             blf.position(font_id, offset -250, self.fontsize + line_width, 0)
             blf.draw(font_id, message)
 
+        draw_time = time.perf_counter() - start
+        self.draw_count += 1
+        self.draw_time += draw_time
+        self.max_draw_time = max(self.max_draw_time, draw_time)
+        if over_budget:
+            self.over_budget_count += 1
+
+    def draw_stats(self):
+        if not self.draw_count:
+            return None
+        
+        stats = f'Log drawing : {self.draw_count} frame(s) | average {round(self.draw_time / self.draw_count * 1000, 3)}ms | max {round(self.max_draw_time * 1000, 3)}ms'
+        if self.over_budget_count:
+            stats += f' | {self.over_budget_count} frame(s) over the {round(self.draw_budget * 1000, 1)}ms budget'
+        return stats
+
     def init_progress_importer(self, file_name):
 
         pretty = self.pretty(file_name)
@@ -86,6 +178,9 @@ class LoggerProgress(Logger):
             stats += f' | {batch_count} batche(s)'
         
         self.info(stats)
+        draw_stats = self.draw_stats()
+        if draw_stats is not None:
+            self.debug(draw_stats)
         if show_successes:
             for s in self.successes:
                 self.success(f'{s}')
@@ -1,2 +1,2 @@
-from .logger_base import Logger, MessageColored
+from .logger_base import Logger
 from .logger_const import LoggerColors, SCROLL_OFFSET_INCREMENT, MessageType
\ No newline at end of file
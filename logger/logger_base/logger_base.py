@@ -1,11 +1,12 @@
 import bpy, os, logging, tempfile, time
 from os import path
-from mathutils import Color
 from .logger_const import LoggerColors, MessageType
+from ...core import MessageStore, MessageLevel, AsyncLogWriter, DEFAULT_LOG_CAPACITY
+from ...umi_const import get_umi_performance
 
 def get_log_file():
 
-    log_file = "UMI_" + time.strftime(f"%Y%m%d") + ".log"
+    log_file = "UMI.log"
     log_file = path.join(tempfile.gettempdir(), log_file)
     
     print('UMI : Log file path :', log_file)
@@ -13,47 +14,20 @@ def get_log_file():
     return log_file
 
 
-def color_mult(c1, c2):
-    return Color((c1.r * c2.r, c1.g * c2.g, c1.b * c2.b))
+def get_log_capacity():
+    try:
+        return get_umi_performance().log_capacity
+    except Exception:
+        return DEFAULT_LOG_CAPACITY
 
-# From https://stackoverflow.com/questions/30919275/inserting-period-after-every-3-chars-in-a-string
-def insert_str(my_str, each=50, char='\n'):
-    my_str = str(my_str)
-    return char.join(my_str[i:i+each] for i in range(0, len(my_str), each))
 
-# from https://stackoverflow.com/questions/9475241/split-string-every-nth-character
-def split_str(string, each=150):
-    return [string[i:i+each] for i in range(0, len(string), each)]
+def get_log_rotation():
+    try:
+        performance = get_umi_performance()
+        return {'max_bytes': performance.log_max_size * 1024 * 1024, 'backup_count': performance.log_backup_count}
+    except Exception:
+        return {}
 
-class Message():
-    def __init__(self, message='', color=Color((1,1,1))):
-        self.message = message
-        self.color = color
-
-
-class MessageColored():
-    def __init__(self):
-        self._messages = []
-        self.count = 0
-
-    @property
-    def messages(self):
-        return self._messages
-
-    def append(self, message:str, color:Color=Color((1,1,1))):
-        splitted = split_str(message)
-        for s in splitted:
-            self._messages.append(Message(message=s, color=color))
-
-        self.count += 1
-
-    def __len__(self):
-        return len(self._messages)
-    
-    def __getitem__(self, item):
-        return self._messages[item]
-    
-    
 
 class Logger():
     def __init__(self, log_name='ROOT'):
@@ -61,17 +35,17 @@ class Logger():
 
         self.log_file = get_log_file()
         self.timeformat = '%m/%d/%Y %I:%M:%S %p'
-        self.set_basic_config()
+        self.start_writer()
 
         self.successes = []
         self.failures = []
         self.warnings = []
-        self.messages = MessageColored()
+        self.messages = MessageStore()
         self.message_types = []
 
         self._pretty = '---------------------'
+        self._prefixes = {level: f'{self.log_name} : {level} - ' for level in ('INFO', 'SUCCESS', 'DEBUG', 'WARNING', 'ERROR')}
 
-        self.color = Color(LoggerColors.DEFAULT_COLOR())
         self.fontsize = 12
     
     def revert_parameters(self):
@@ -79,61 +53,63 @@ class Logger():
         self.failures = []
         self.warnings = []
         self.message_types = []
-        self.messages = MessageColored()
+        self.messages = MessageStore(capacity=get_log_capacity())
+        self.writer.configure(**get_log_rotation())
 
 
-    def info(self, message, skip_prefix=False, color=None):
-        self.color = Color(LoggerColors.DEFAULT_COLOR())
+    def info(self, message, skip_prefix=False, level=MessageLevel.INFO):
         message = str(message)
-        self.set_basic_config()
         if not skip_prefix:
-            message = '{} : INFO - '.format(self.log_name) + message
+            message = self._prefixes['INFO'] + message
         
-        if color is not None:
-            self.messages.append(message=message, color=Color(color))
-        else:
-            self.messages.append(message=message, color=Color(LoggerColors.DEFAULT_COLOR()))
-            
-        logging.info(message)
+        self.messages.append(message, level=level)
+        self.logger.info(message)
     
     def success(self, message, skip_prefix=False, show_message=True):
         message = str(message)
-        self.set_basic_config()
         if not skip_prefix:
-            message = '{} : SUCCESS - '.format(self.log_name) + message
+            message = self._prefixes['SUCCESS'] + message
             
-        self.messages.append(message=message, color=Color(LoggerColors.SUCCESS_COLOR()))
+        self.messages.append(message, level=MessageLevel.SUCCESS)
         
         if show_message :
-            logging.info(message)
+            self.logger.info(message)
 
     def debug(self, message, skip_prefix=False):
         message = str(message)
-        self.set_basic_config()
         if not skip_prefix:
-            message = '{} : DEBUG - '.format(self.log_name) + message
-        self.messages.append(message=message, color=self.color * 0.2)
-        logging.debug(message)
+            message = self._prefixes['DEBUG'] + message
+        self.messages.append(message, level=MessageLevel.DEBUG)
+        self.logger.debug(message)
 
     def warning(self, message, skip_prefix=False):
         message = str(message)
-        self.set_basic_config()
         if not skip_prefix:
-            message = '{} : WARNING - '.format(self.log_name) + message
-        self.messages.append(message=message, color= Color(LoggerColors.WARNING_COLOR()))
-        logging.warning(message)
+            message = self._prefixes['WARNING'] + message
+        self.messages.append(message, level=MessageLevel.WARNING)
+        self.logger.warning(message)
 
     def error(self, message, skip_prefix=False):
         message = str(message)
-        self.set_basic_config()
         if not skip_prefix:
-            message = '{} : ERROR - '.format(self.log_name) + message
-        self.messages.append(message=message, color= Color(LoggerColors.ERROR_COLOR()))
-        logging.error(message)
-
-    def set_basic_config(self):
+            message = self._prefixes['ERROR'] + message
+        self.messages.append(message, level=MessageLevel.ERROR)
+        self.logger.error(message)
+
+    def start_writer(self):
+        if getattr(self, 'writer', None) is not None and self.writer.running:
+            return
+        # The log file is written on a background thread, so slow disks don't stall the import
         self.format = '%(asctime)s - %(levelname)s :    %(message)s'
-        logging.basicConfig(filename=self.log_file, level=logging.DEBUG, datefmt=self.timeformat, filemode='w', format=self.format)
+        self.writer = AsyncLogWriter(self.log_file, name=self.log_name, log_format=self.format, time_format=self.timeformat)
+        self.writer.start()
+        self.logger = self.writer.logger
+
+    def flush(self):
+        self.writer.flush()
+
+    def stop_writer(self):
+        self.writer.stop()
 
     def store_success(self, success):
         success = str(success)
@@ -151,7 +127,7 @@ class Logger():
         self.message_types.append(MessageType.WARNING)
 
     def clear_message(self):
-        self.messages = MessageColored()
+        self.messages = MessageStore(capacity=get_log_capacity())
     
     def clear_success(self):
         self.successes = []
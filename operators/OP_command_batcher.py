@@ -1,8 +1,10 @@
 import bpy
 import time, math
 from ..preferences.formats.properties import PG_Operator
-from ..logger import LOG, LoggerColors
+from ..logger import LOG
+from ..core import MessageLevel
 from ..umi_const import get_umi_settings
+from ..import_module.event_service import start_event_stream, get_event_stream, end_event_stream
 
 def draw_command_batcher(self, context, layout):
     col = layout.column()
@@ -68,6 +70,7 @@ class CommandBatcher(bpy.types.Operator):
     
     finished = False
     current_command = None
+    events = None
     progress = 0
     processing = False
     process_complete = False
@@ -99,14 +102,14 @@ class CommandBatcher(bpy.types.Operator):
     def log_end_text(self):
         LOG.info('-----------------------------------')
         if self.canceled:
-            LOG.info('Batch Process cancelled !', color=LoggerColors.CANCELLED_COLOR())
+            LOG.info('Batch Process cancelled !', level=MessageLevel.CANCELLED)
         else:
             if False in self.process_succeeded:
-                LOG.info('Batch Process completed with errors !', color=LoggerColors.ERROR_COLOR())
+                LOG.info('Batch Process completed with errors !', level=MessageLevel.ERROR)
                 LOG.esc_message = '[Esc] to Hide'
                 LOG.message_offset = 4
             else:
-                LOG.info('Batch Process completed successfully !', color=LoggerColors.SUCCESS_COLOR())
+                LOG.info('Batch Process completed successfully !', level=MessageLevel.SUCCESS)
                 LOG.esc_message = '[Esc] to Hide'
                 LOG.message_offset = 4
         LOG.info('Click [ESC] to hide this text ...')
@@ -127,6 +130,9 @@ class CommandBatcher(bpy.types.Operator):
     def finish(self, context, canceled=False):
         if not self.importer_mode:
             bpy.types.SpaceView3D.draw_handler_remove(self._handle, 'WINDOW')
+            end_event_stream('cancelled' if canceled else ('failed' if False in self.process_succeeded else 'succeeded'))
+        self.events = None
+        LOG.flush()
         self.revert_parameters(context)
         bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
         self.umi_settings.umi_batcher_is_processing = False
@@ -222,11 +228,12 @@ class CommandBatcher(bpy.types.Operator):
                 self.current_object_to_process = None
 
             else:
+                command_start = time.perf_counter()
                 try: # Executing command
                     self.progress += 100 / self.number_of_operations_to_perform
                     self.current_operation_number += 1
                     
-                    LOG.info(f'Executing command {self.current_operation_number}/{self.number_of_operations_to_perform} - {round(self.progress,2)}% : "{self.current_command}"', color=LoggerColors.COMMAND_COLOR())
+                    LOG.info(f'Executing command {self.current_operation_number}/{self.number_of_operations_to_perform} - {round(self.progress,2)}% : "{self.current_command}"', level=MessageLevel.COMMAND)
 
                     override = {}
                     override["selected_objects"] = [bpy.data.objects[self.current_object_to_process.name]]
@@ -235,11 +242,15 @@ class CommandBatcher(bpy.types.Operator):
 
                     LOG.store_success('Command executed successfully')
                     self.process_succeeded.append(True)
+                    if self.events is not None:
+                        self.events.command(self.current_command, self.current_object_to_process.name, True, time.perf_counter() - command_start)
                 except Exception as e:
                     message = f'{context.selected_objects[0].name} : Command "{self.current_command}" is not valid - {e}'
                     LOG.error(message)
                     LOG.store_failure(message)
                     self.process_succeeded.append(False)
+                    if self.events is not None:
+                        self.events.command(self.current_command, self.current_object_to_process.name, False, time.perf_counter() - command_start, error=str(e))
                 
                 self.current_command = None
 
@@ -280,6 +291,12 @@ class CommandBatcher(bpy.types.Operator):
 
         self.number_of_operations_to_perform = number_of_operations * number_of_objects
 
+        # In importer mode, the commands are part of the import session
+        if self.importer_mode:
+            self.events = get_event_stream()
+        else:
+            self.events = start_event_stream('batcher', object_count=number_of_objects, command_count=number_of_operations)
+
         if not self.importer_mode:
             self.next_object()
             args = (context,)
@@ -313,6 +330,7 @@ class CommandBatcher(bpy.types.Operator):
         if self._timer is not None:
             wm = context.window_manager
             wm.event_timer_remove(self._timer)
+        LOG.flush()
     
     def register_timer(self, context):
         wm = context.window_manager
@@ -1,16 +1,21 @@
 import bpy
 from bpy_extras.io_utils import ImportHelper
-import os, time
+import os, time, shutil, tempfile
 from os import path
+from collections import deque
 import math
-from string import punctuation
-from ..preferences.formats import FormatHandler, COMPATIBLE_FORMATS
+from ..preferences.formats import COMPATIBLE_FORMATS, get_format_handler, get_format_handlers, get_current_format_handler
 from ..preferences.formats.properties.properties import update_file_stats, get_file_selected_items, update_file_extension_selection
 from .OP_command_batcher import draw_command_batcher
-from ..umi_const import get_umi_settings, AUTOSAVE_PATH
+from ..umi_const import get_umi_settings, get_umi_performance, AUTOSAVE_PATH
 from ..preferences.formats.panels.presets import import_preset
-from ..logger import LOG, LoggerColors, MessageType
+from ..logger import LOG, MessageType
 from ..blender_version import BVERSION
+from ..import_module.import_plan import ImportPlans
+from ..import_module.datablock_tracker import DatablockTracker, TRACKED_COLLECTIONS, PROFILED_COLLECTIONS
+from ..import_module.worker_service import get_worker_pool, shutdown_worker_pool
+from ..import_module.event_service import start_event_stream, end_event_stream
+from ..core import FolderScanner, FileRecordStore, FileStatus, ScanIndex, ImportStats, FrameBudgetScheduler, ImportCache, ImportProfiler, MessageLevel, plan_batches, split_shards
 
 if BVERSION >= 4.1:
     class IMPORT_SCENE_FH_UMI_3DVIEW(bpy.types.FileHandler):
@@ -125,7 +130,7 @@ class UMI_OT_Settings(bpy.types.Operator):
 
         key_to_delete = []
         self.registered_annotations = []
-        self.format_handler = eval(f'FormatHandler(import_format="{self.import_format}", module_name="default" context=cont)', {'self':self, 'FormatHandler':FormatHandler, 'cont':context})
+        self.format_handler = get_format_handler(self.import_format, 'default')
 
         for k,v in self.format_handler.format_annotations.items():
             if getattr(v, 'is_hidden', False) or getattr(v, 'is_readonly', False):
@@ -180,11 +185,9 @@ class UMI_OT_Settings(bpy.types.Operator):
 
 
 def register_import_format(self, context):
+    # The handlers are built once at registration, and shared by every session
     for f in COMPATIBLE_FORMATS.formats:
-        exec('self.{}_format = {{ }}'.format(f[0]), {'self':self})
-        current_format = eval(f'self.{f[0]}_format')
-        for i,name in enumerate(f[1]['operator'].keys()):
-            current_format[name] = FormatHandler(import_format=f"{f[0]}", module_name=name, context=context)
+        setattr(self, f'{f[0]}_format', get_format_handlers(f[0]))
 
 class UMI_FileSelection(bpy.types.Operator):
     bl_idname = "import_scene.tila_universal_multi_importer_file_selection"
@@ -280,6 +283,11 @@ class UMI_FileSelection(bpy.types.Operator):
         row2.prop(self.umi_settings, 'umi_file_name_case_sensitive_selection', text='', icon='SYNTAX_OFF')
         row2.prop(self.umi_settings, 'umi_file_name_include_folder_selection', text='', icon='FILEBROWSER')
         
+        if self.umi_settings.umi_file_scan_in_progress:
+            row2 = file_selection_box.row(align=True)
+            row2.alignment = 'LEFT'
+            row2.label(text=f'{self.umi_settings.umi_file_scan_found_count} file(s) found / scanning...', icon='VIEWZOOM')
+
         row2 = file_selection_box.row(align=True)
         row2.alignment = 'LEFT'
         row2.label(text=str(self.umi_settings.umi_file_stat_selected_count) + ' file(s)  |  ')
@@ -321,15 +329,13 @@ class UMI_FileSelection(bpy.types.Operator):
         layout.use_property_split = True
         layout.use_property_decorate = False
         col = layout.column()
-        current_format = eval(f'self.{format_name}_format')
-        if len(current_format.keys()) > 1:
+        current_settings = get_current_format_handler(format_name)
+        if len(get_format_handlers(format_name)) > 1:
             row = col.row()
-            row.prop(eval(f"self.umi_settings.umi_format_import_settings.{format_name}_import_module", {'self':self}), 'name' , expand=True)
+            row.prop(current_settings.import_module, 'name' , expand=True)
             col.separator()
 
-        current_module = eval(f'self.umi_settings.umi_format_import_settings.{format_name}_import_module', {'self':self}).name.lower()
-        current_settings = current_format[current_module]
-        COMPATIBLE_FORMATS.draw_format_settings(context, format_name, current_settings.format_settings, current_module, col)
+        COMPATIBLE_FORMATS.draw_format_settings(context, format_name, current_settings.format_settings, current_settings.module_name, col)
 
     def draw_global_settings(self, context, layout):
         layout.use_property_split = True
@@ -338,9 +344,17 @@ class UMI_FileSelection(bpy.types.Operator):
         import_count = col.box()
         import_count.label(text='File Count', icon='LONGDISPLAY')
         import_count.prop(self.umi_settings.umi_global_import_settings, 'import_simultaneously_count')
-        import_count.prop(self.umi_settings.umi_global_import_settings, 'max_batch_size')
-        if self.umi_settings.umi_global_import_settings.max_batch_size:
+        import_count.prop(self.umi_settings.umi_global_import_settings, 'parallel_import')
+        if not self.umi_settings.umi_global_import_settings.parallel_import:
+            import_count.prop(self.umi_settings.umi_global_import_settings, 'import_time_budget')
+        import_count.prop(self.umi_settings.umi_global_import_settings, 'batch_size_mode')
+        if self.umi_settings.umi_global_import_settings.batch_size_mode == 'DURATION':
+            import_count.prop(self.umi_settings.umi_global_import_settings, 'target_batch_duration')
             import_count.prop(self.umi_settings.umi_global_import_settings, 'minimize_batch_number')
+        else:
+            import_count.prop(self.umi_settings.umi_global_import_settings, 'max_batch_size')
+            if self.umi_settings.umi_global_import_settings.max_batch_size:
+                import_count.prop(self.umi_settings.umi_global_import_settings, 'minimize_batch_number')
 
         settings = col.box()
         settings.label(text='Options', icon='OPTIONS')
@@ -419,6 +433,18 @@ class UMI(bpy.types.Operator, ImportHelper):
 
     _timer = None
     thread = None
+    batch_plan = ()
+    next_batch_index = 0
+    folder_scanner = None
+    scan_index = None
+    discovery = None
+    scheduler = None
+    import_cache = None
+    profiler = None
+    events = None
+    worker_pool = None
+    worker_folder = None
+    timer_interval = 0.01
     progress = 0
     current_files_to_import = None
     importing = False
@@ -442,7 +468,8 @@ class UMI(bpy.types.Operator, ImportHelper):
             compatible_extensions = self.compatible_extensions
             
             if self.import_folders:
-                self._filepaths = self.get_compatible_files_in_folder(self.directory, recursion_depth=self.recursion_depth)
+                # Filled progressively by discover_files()
+                self._filepaths = []
             else:
                 self._filepaths = [path.join(self.directory, f.name) for f in self.files if path.splitext(f.name)[1].lower() in compatible_extensions]
         
@@ -454,7 +481,7 @@ class UMI(bpy.types.Operator, ImportHelper):
     
     @property
     def compatible_extensions(self):
-        return COMPATIBLE_FORMATS.extensions
+        return COMPATIBLE_FORMATS.extension_set
 
     def draw(self, context):
         layout = self.layout
@@ -487,7 +514,7 @@ class UMI(bpy.types.Operator, ImportHelper):
     def init_progress(self):
         self.number_of_files = len(self.filepaths)
         self.number_of_operations = self.number_of_files
-        self.total_import_size = self.get_total_size(self.filepaths)
+        self.total_import_size = self.file_records.total_size(self.filepaths)
         
     def decrement_counter(self):
         self.counter = self.counter + (self.counter_start_time - self.counter_end_time)*1000
@@ -502,15 +529,15 @@ class UMI(bpy.types.Operator, ImportHelper):
         LOG.info('-----------------------------------')
         if self.import_complete:
             if False in self.files_succeeded:
-                LOG.info('Batch Import completed with errors !', color=LoggerColors.ERROR_COLOR())
+                LOG.info('Batch Import completed with errors !', level=MessageLevel.ERROR)
                 LOG.esc_message = '[Esc] to Hide'
                 LOG.message_offset = 4
             else:
-                LOG.info('Batch Import completed successfully !', color=LoggerColors.SUCCESS_COLOR())
+                LOG.info('Batch Import completed successfully !', level=MessageLevel.SUCCESS)
                 LOG.esc_message = '[Esc] to Hide'
                 LOG.message_offset = 4
         else:
-            LOG.info('Batch Import cancelled !', color=LoggerColors.CANCELLED_COLOR())
+            LOG.info('Batch Import cancelled !', level=MessageLevel.CANCELLED)
             
         LOG.info('Click [ESC] to hide this text ...')
         LOG.info('-----------------------------------')
@@ -545,19 +572,33 @@ class UMI(bpy.types.Operator, ImportHelper):
         self.first_setting_to_import = False
  
     def select_files(self):
-        for f in self.filepaths:
-            filepath = self.umi_settings.umi_file_selection.add()
-            filepath.name = f
-            filepath.ext = path.splitext(f)[1]
-            filepath.path = f
-            filesize = self.get_filesize(f)
-            filepath.size = filesize
+        # In folder mode, the dialog opens right away and is fed by discover_files() while scanning
+        if not self.import_folders:
+            for f in self.filepaths:
+                record = self.file_records[f]
+                filepath = self.umi_settings.umi_file_selection.add()
+                filepath.name = f
+                filepath.ext = record.ext
+                filepath.path = f
+                filepath.size = record.size_mb
 
         update_file_extension_selection(self, bpy.context)
         bpy.ops.import_scene.tila_universal_multi_importer_file_selection('INVOKE_DEFAULT')
 
     def finish(self, context, canceled=False):
         bpy.types.SpaceView3D.draw_handler_remove(self._handle, 'WINDOW')
+        try:
+            self.import_stats.save_changes()
+        except OSError as e:
+            LOG.warning(f'Import statistics not saved : {e}')
+        if self.import_cache is not None:
+            try:
+                self.import_cache.save()
+            except OSError as e:
+                LOG.warning(f'Import cache index not saved : {e}')
+        end_event_stream('cancelled' if canceled else 'completed')
+        self.events = None
+        LOG.flush()
         self.revert_parameters(context)
         bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
         if canceled:
@@ -569,6 +610,8 @@ class UMI(bpy.types.Operator, ImportHelper):
         # If Escape is Pressed :Cancelling
         if not self.import_complete and event.type in {'ESC'} and event.value == 'PRESS':
             LOG.warning('Cancelling...')
+            if self.discovery is not None:
+                self.finish_discovery(interrupted=True)
             self.cancel(context)
 
             self.log_end_text()
@@ -636,12 +679,19 @@ class UMI(bpy.types.Operator, ImportHelper):
             if not self.umi_settings.umi_file_selection_done:
                 if not self.umi_settings.umi_file_selection_started:
                     self.select_files()
+                elif self.discovery is not None:
+                    self.discover_files(context)
                 if self.umi_settings.umi_current_format_setting_cancelled:
+                    if self.discovery is not None:
+                        self.finish_discovery(interrupted=True)
                     return self.cancel_finish(context)
                 return {'PASS_THROUGH'}
             
             # File Selection is approved and fed into self.filepaths
             elif self.umi_settings.umi_file_selection_done and self.umi_settings.umi_file_selection_started:
+                if self.discovery is not None:
+                    LOG.warning('File selection validated before the end of the scan, remaining folders are skipped')
+                    self.finish_discovery(interrupted=True)
                 self.filepaths = [f.path for f in self.umi_settings.umi_file_selection if f.check]
                 self.store_formats_to_import()
                 
@@ -651,6 +701,8 @@ class UMI(bpy.types.Operator, ImportHelper):
                     return self.cancel_finish(context)
                 
                 LOG.info(f'{len(self.filepaths)}  files selected')
+                if self.events is not None:
+                    self.events.files_selected(self.number_of_files, self.total_import_size)
                 
                 self.operator_list = [{'name':'operator', 'operator': o.operator} for o in self.umi_settings.umi_operators]
 
@@ -674,13 +726,25 @@ class UMI(bpy.types.Operator, ImportHelper):
                 #INIT Counter
                 if self.start_time == 0: 
                     self.start_time = time.perf_counter()
+                    self.plan_batches()
+                    self.scheduler = FrameBudgetScheduler(time_budget=self.umi_settings.umi_global_import_settings.import_time_budget / 1000)
+                    if self.umi_settings.umi_global_import_settings.parallel_import:
+                        self.start_parallel_import()
 
                 # wait if post processing in progress
                 if self.umi_settings.umi_batcher_is_processing: 
                     return {'PASS_THROUGH'}
+
+                # Parallel Import : follow the background workers until they are all done
+                elif self.worker_pool is not None:
+                    self.update_parallel_import()
                 
                 # After each Import Batch, and batch process
                 elif not len(self.objects_to_process) and not self.importing and self.current_object_to_process is None and self.current_file_number and not len (self.current_files_to_import):
+                    if self.profiler is not None and self.post_process_start:
+                        self.profiler.add_post_process(self.current_batch_profiles, time.perf_counter() - self.post_process_start)
+                    self.post_process_start = 0
+
                     # update End LOGs
                     i=len(self.current_filenames)
                     for filename in self.current_filenames:
@@ -700,10 +764,13 @@ class UMI(bpy.types.Operator, ImportHelper):
                         if self.umi_settings.umi_global_import_settings.backup_step <= self.current_backup_step:
                             self.current_backup_step = 0
                             LOG.info('Saving backup file : {}'.format(path.basename(self.blend_backup_file)))
+                            backup_start = time.perf_counter()
                             bpy.ops.wm.save_as_mainfile(filepath=self.blend_backup_file, check_existing=False, copy=True)
+                            if self.events is not None:
+                                self.events.backup(self.blend_backup_file, time.perf_counter() - backup_start)
                     
                     # Register Next Batch if files are remaining in the import list
-                    if len(self.filepaths):
+                    if self.has_remaining_batches:
                         LOG.separator()
                         self.next_batch()
                         self.log_next_batch()
@@ -714,14 +781,24 @@ class UMI(bpy.types.Operator, ImportHelper):
                             bpy.ops.wm.save_as_mainfile(filepath=self.current_blend_file, check_existing=False)
 
                         LOG.complete_progress_importer(show_successes=False, duration=round(time.perf_counter() - self.start_time, 2), size=self.total_imported_size, batch_count=self.batch_number)
+                        self.log_time_split()
+                        self.log_cache_stats()
+                        self.log_profile()
+                        end_event_stream('failed' if False in self.files_succeeded else 'succeeded', batch_count=self.batch_number)
+                        self.events = None
                         self.import_complete = True
                         LOG.completed = True
                         self.log_end_text()
                         self.counter = self.umi_settings.umi_global_import_settings.wait_before_hiding
                         bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
 
+                # Import files of the Current Batch, within the time budget of this update
+                elif len(self.current_files_to_import):
+                    self.import_files(context)
+
                 # Running Current Batcher on Imported Objects
                 elif len(self.objects_to_process): 
+                    self.post_process_start = time.perf_counter()
                     self.post_import_command(self.objects_to_process)
                     self.objects_to_process = []
                 
@@ -730,99 +807,32 @@ class UMI(bpy.types.Operator, ImportHelper):
                     self.importing = False
 
                 # Register Next Batch Files
-                elif self.current_files_to_import == [] and len(self.filepaths):
+                elif not len(self.current_files_to_import) and self.has_remaining_batches:
                     LOG.separator()
                     self.next_batch()
                     self.log_next_batch()
 
-                # Start Importing
-                elif not self.importing and len(self.current_files_to_import):
-                    self.files_succeeded += self.import_files(context, self.current_files_to_import)
-                    self.current_files_to_import = []
-
-                elif self.current_files_to_import == [] and len(self.filepaths):
+                elif not len(self.current_files_to_import) and self.has_remaining_batches:
                     self.importing = False
 
         return {'PASS_THROUGH'}
     
-    # from : https://www.digitalocean.com/community/tutorials/how-to-get-file-size-in-python
-    def get_filesize(self, file_path):
-        file_stats = os.stat(file_path)
-
-        # print(file_path)
-        # print(f'File Size in Bytes is {file_path.st_size}')
-        filesize = file_stats.st_size / (1024 * 1024)
-        # print(f'File Size in MegaBytes is {filesize}')
-        return filesize
-    
-    def get_total_size(self, filepaths):
-        size = 0
-        for f in filepaths:
-            size += self.get_filesize(f)
-
-        return size
-
     def import_command(self, context, filepath):
         success = True
-        ext = os.path.splitext(filepath)[1]
-        format_name = COMPATIBLE_FORMATS.get_format_from_extension(ext)['name']
-        current_format = eval(f'self.{format_name}_format')
-        current_module = eval(f'self.umi_settings.umi_format_import_settings.{format_name}_import_module', {'self':self}).name.lower()
-        # format_settings = current_format[current_module].format_settings
-        
-        operators = COMPATIBLE_FORMATS.get_operator_name_from_extension(ext)[current_module]['command']
-
-        # Double \\ in the path causing error in the string
-        args = current_format[current_module].format_settings_dict
-        raw_path = filepath.replace('\\\\', punctuation[23])
-        
-        if format_name == 'image' and current_module in ['plane']:
-            args['files'] = '[{"name":' + f'r"{raw_path}"' + '}]'
-        else:
-            args['filepath'] = f'r"{raw_path}"'
-
-        args_as_string = ''
-        arg_number = len(args.keys())
-        for k,v in args.items():
-            if k in ['settings_imported', 'name']:
-                arg_number -= 1
-                continue
-            if isinstance(v, bpy.types.bpy_prop_collection):
-                if not len(v):
-                    continue
-
-                col_as_string = ''
-                for i,f in enumerate(v):
-                    if i == 0:
-                        col_as_string += '['
-                    elif i < len(v) -1:
-                        col_as_string += ','
-            
-                    col_as_string += f'"{f}"'
-                col_as_string += ']'
+        record = self.file_records[filepath]
+        plan = self.import_plans.get(record.ext)
+        record.format_name = plan.format_name
+        record.module_name = plan.module_name
 
-                args_as_string += f' {k}={col_as_string}'
-            else:
-                args_as_string += f' {k}={v}'
-            if arg_number >= 2:
-                args_as_string += ','
-
-            arg_number -= 1
-            
-        command = '{}({})'.format(operators, args_as_string)
         # Execute the import command
         try:
-            exec(command, {'bpy':bpy})
+            plan(filepath)
         except Exception as e:
             LOG.error(e)
             LOG.store_failure(e)
             success = False
             # raise Exception(e)
 
-        if len(self.operator_list):
-            if success:
-                self.objects_to_process = self.objects_to_process + [o for o in context.selected_objects]
-
         return success
 
     def update_progress(self):
@@ -830,23 +840,29 @@ class UMI(bpy.types.Operator, ImportHelper):
     
     def import_file(self, context, current_file):
         self.importing = True
-        filename = path.basename(current_file)
-        name = (path.splitext(current_file)[0])
-        name = path.basename(name)
-        self.current_filenames.append(path.basename(filename))
+        record = self.file_records[current_file]
+        filename = record.name
+        self.current_filenames.append(filename)
 
         if self.umi_settings.umi_global_import_settings.skip_already_imported_files:
             if filename in bpy.data.collections:
-                self.current_files_to_import = []
-                self.importing = False
+                record.status = FileStatus.SKIPPED
                 LOG.warning(f'File {filename} have already been imported, skiping file...')
+                if self.events is not None:
+                    self.events.file_end(record, FileStatus.SKIPPED)
                 return
         
-        current_file_size = self.get_filesize(current_file)
+        record.status = FileStatus.IMPORTING
+        current_file_size = record.size_mb
         self.total_imported_size += current_file_size
         self.update_progress()
 
-        LOG.info(f'Importing file {len(self.imported_files) + 1}/{self.number_of_files} - {round(self.progress,2)}% - {round(current_file_size, 2)}MB : {filename}', color=LoggerColors.IMPORT_COLOR())
+        file_start = time.perf_counter()
+        profile = self.profiler.start_file(record) if self.profiler is not None else None
+        importer_time = self.import_plans.import_time
+        if self.events is not None:
+            self.events.file_start(record, batch=self.batch_number)
+        LOG.info(f'Importing file {len(self.imported_files) + 1}/{self.number_of_files} - {round(self.progress,2)}% - {round(current_file_size, 2)}MB : {filename}', level=MessageLevel.IMPORT)
         self.current_backup_step += current_file_size
         
         if self.umi_settings.umi_global_import_settings.force_refresh_viewport_after_each_import:
@@ -863,56 +879,243 @@ class UMI(bpy.types.Operator, ImportHelper):
             self.view_layer.active_layer_collection = layer_col
             import_col = collection
 
-        self.store_objects()
+        self.datablocks.mark()
+
+        # Appending the result of a previous import from the cache, or running Import Command
+        cache_key = self.import_cache_key(record)
+        succeeded = None
+        if cache_key is not None:
+            cached_result = self.import_cache.lookup(cache_key)
+            if cached_result is not None:
+                succeeded = self.append_cached_result(cached_result, import_col)
+
+        from_cache = succeeded is not None
+        if not from_cache:
+            import_start = time.perf_counter()
+            succeeded = self.import_command(context, filepath=current_file)
+            if succeeded:
+                self.import_stats.record(record.format_name, record.module_name, record.size_mb, time.perf_counter() - import_start)
+        record.status = FileStatus.SUCCEEDED if succeeded else FileStatus.FAILED
+
+        relink_start = time.perf_counter()
+        new_objects = self.datablocks.new('objects')
+        if not from_cache:
+            self.link_new_object_in_collection(import_col, new_objects)
+        relink_time = time.perf_counter() - relink_start
+        if not from_cache and succeeded and cache_key is not None:
+            self.store_import_result(cache_key, new_objects)
+
+        if succeeded and len(self.operator_list):
+            self.objects_to_process += new_objects
 
-        # Running Import Command
-        succeeded = self.import_command(context, filepath=current_file)
+        self.imported_files.append(current_file)
+        self.file_import_time += time.perf_counter() - file_start
+        if self.events is not None:
+            self.events.file_end(record, record.status, time.perf_counter() - file_start, from_cache=from_cache)
 
-        self.link_new_object_in_collection(import_col)
+        if profile is not None:
+            profile.importer_seconds = self.import_plans.import_time - importer_time
+            profile.relink_seconds = relink_time
+            self.count_new_datablocks(profile, new_objects)
+            self.profiler.end_file(profile, record, succeeded, time.perf_counter() - file_start)
+            self.current_batch_profiles.append(profile)
 
-        self.imported_files.append(current_file)
         return succeeded
-    
-    def store_objects(self):
-        self._stored_objects = [o for o in bpy.data.objects]
 
-    def get_new_objects(self):
-        return [o for o in bpy.data.objects if o not in self._stored_objects]
+    def count_new_datablocks(self, profile, new_objects):
+        meshes = self.datablocks.new('meshes')
+        profile.objects = len(new_objects)
+        profile.meshes = len(meshes)
+        profile.vertices = sum(len(m.vertices) for m in meshes)
+        profile.materials = len(self.datablocks.new('materials'))
+
+    def log_profile(self):
+        if self.profiler is None or not len(self.profiler.profiles):
+            return
+        LOG.info('Import time per format :')
+        for line in self.profiler.summary_lines():
+            LOG.info(line)
+
+        profile_format = get_umi_performance().profile_format
+        profile_file = path.splitext(LOG.log_file)[0] + time.strftime('_profile_%H%M%S') + ('.csv' if profile_format == 'CSV' else '.jsonl')
+        try:
+            if profile_format == 'CSV':
+                self.profiler.write_csv(profile_file)
+            else:
+                self.profiler.write_jsonl(profile_file)
+            LOG.info(f'Import profile written to {profile_file}')
+        except OSError as e:
+            LOG.warning(f'Import profile not written : {e}')
+
+    def get_format_handler(self, format_name, module_name):
+        return get_format_handler(format_name, module_name)
+
+    def get_import_module_name(self, format_name):
+        return get_current_format_handler(format_name).module_name
+
+    def import_cache_key(self, record):
+        if self.import_cache is None:
+            return None
+        plan = self.import_plans.get(record.ext)
+        try:
+            return self.import_cache.key(record, plan.format_name, plan.module_name, plan.settings_hash)
+        except OSError as e:
+            LOG.warning(f'Import cache not used for {record.name} : {e}')
+            return None
+
+    def append_cached_result(self, cached_result, import_col):
+        try:
+            with bpy.data.libraries.load(cached_result, link=False) as (data_from, data_to):
+                data_to.objects = data_from.objects
+        except (OSError, RuntimeError) as e:
+            LOG.warning(f'Import cache entry unreadable, importing the file again : {e}')
+            return None
+
+        for o in data_to.objects:
+            if o is not None:
+                import_col.objects.link(o)
+        LOG.info('Appended from the import cache')
+        return True
+
+    def store_import_result(self, cache_key, new_objects):
+        if not len(new_objects):
+            return
+        try:
+            bpy.data.libraries.write(self.import_cache.prepare(cache_key), set(new_objects), path_remap='ABSOLUTE')
+            self.import_cache.add(cache_key)
+        except (OSError, RuntimeError) as e:
+            LOG.warning(f'Import result not stored in the import cache : {e}')
+
+    def log_cache_stats(self):
+        if self.import_cache is None:
+            return
+        LOG.info(f'Import cache : {self.import_cache.hits} hit(s) | {self.import_cache.misses} miss(es) | {self.import_cache.stored} result(s) stored ({round(self.import_cache.stored_size / (1024 * 1024), 2)}MB)')
+
+    def log_time_split(self):
+        importer_time = self.import_plans.import_time
+        umi_time = max(0, self.file_import_time - importer_time)
+        if not self.file_import_time:
+            return
+        LOG.info(f'Importers : {round(importer_time, 2)}s | UMI overhead : {round(umi_time, 2)}s ({round(umi_time * 100 / self.file_import_time, 1)}%)')
     
-    def link_new_object_in_collection(self, import_col):
-        new_objects = self.get_new_objects()
-        
+    def link_new_object_in_collection(self, import_col, new_objects):
         if len(new_objects) and new_objects[0].name not in import_col.all_objects:
             for o in new_objects:
                 previous_col = o.users_collection[0]
                 import_col.objects.link(o)
                 previous_col.objects.unlink(o)
 
-    def import_files(self, context, filepaths):
+    def import_files(self, context):
+        # Import files one at a time until the time budget of this update is spent, to let the UI breathe between files
         self.importing = True
-        success = []
-        for f in filepaths:
-            success.append(self.import_file(context, f))
-        self.current_batch_imported = True
-        return success
+        self.scheduler.start_tick()
+        while len(self.current_files_to_import) and self.scheduler.has_time_left:
+            self.scheduler.start_item()
+            self.files_succeeded.append(self.import_file(context, self.current_files_to_import.popleft()))
+            self.scheduler.end_item()
+        self.scheduler.end_tick()
+
+        if not len(self.current_files_to_import):
+            self.current_batch_imported = True
+
+        self.update_timer_interval(context)
+
+    def update_timer_interval(self, context):
+        interval = self.scheduler.interval
+        if abs(interval - self.timer_interval) < 0.25 * self.timer_interval:
+            return
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        self.timer_interval = interval
+        self._timer = wm.event_timer_add(self.timer_interval, window=context.window)
+
+    def start_discovery(self):
+        performance = get_umi_performance()
+        self.scan_index = None
+        if performance.use_scan_index:
+            try:
+                self.scan_index = ScanIndex(performance.scan_index_file)
+            except Exception as e:
+                LOG.warning(f'Scan index unavailable, scanning without it : {e}')
+
+        self.folder_scanner = FolderScanner(thread_count=performance.scan_thread_count if performance.parallel_scan else 1, index=self.scan_index)
+        self.discovery = self.folder_scanner.scan(self.directory, self.compatible_extensions, recursion_depth=self.recursion_depth, on_error=LOG.warning, yield_folders=True)
+        self.discovery_time_budget = performance.scan_time_budget / 1000
+        self.discovery_start = time.perf_counter()
+        self.last_selection_stats_update = 0
+        self.umi_settings.umi_file_scan_in_progress = True
+        self.umi_settings.umi_file_scan_found_count = 0
+        LOG.info(f'Scanning {self.directory} ...')
+
+    def discover_files(self, context):
+        # Walk the folders until the time budget of this tick is spent, then feed the selection dialog with what was found
+        deadline = time.perf_counter() + self.discovery_time_budget
+        found = []
+        done = True
+        for record in self.discovery:
+            # None marks the end of a folder : the budget is also checked while walking folders without compatible files
+            if record is not None:
+                found.append(record)
+            if time.perf_counter() > deadline:
+                done = False
+                break
+
+        # The last chunk must be in the selection before the scan is reported as done
+        self.add_to_selection(found)
+        if done:
+            self.finish_discovery()
+
+        now = time.perf_counter()
+        if self.discovery is None or now - self.last_selection_stats_update > 0.25:
+            self.last_selection_stats_update = now
+            update_file_extension_selection(self, context)
+            update_file_stats(self, context)
+
+        for window in context.window_manager.windows:
+            for area in window.screen.areas:
+                area.tag_redraw()
+
+    def finish_discovery(self, interrupted=False):
+        if interrupted:
+            self.folder_scanner.cancel()
+        self.discovery.close()
+        self.discovery = None
+        self.umi_settings.umi_file_scan_in_progress = False
+        if self.events is not None:
+            self.events.scan_done(len(self.filepaths), self.file_records.total_size(self.filepaths), time.perf_counter() - self.discovery_start, interrupted=interrupted)
+
+        if self.scan_index is not None:
+            self.scan_index.close()
+            LOG.info(f'Scan index : {self.scan_index.reused_folders} folder(s) reused, {self.scan_index.scanned_folders} folder(s) scanned')
+            self.scan_index = None
+
+        if not interrupted:
+            if len(self.filepaths):
+                LOG.info(f'{len(self.filepaths)} compatible file(s) found')
+            else:
+                LOG.error('No compatible file found')
 
-    def get_compatible_files_in_folder(self, folder_path, recursion_depth=0):
-        compatible_files = []
-        for f in os.listdir(folder_path):
-            filepath = path.join(folder_path, f)
-            if path.isfile(filepath):
-                if path.splitext(f)[1].lower() in self.compatible_extensions:
-                    compatible_files.append(filepath)
-            elif path.isdir(filepath):
-                if recursion_depth > 0:
-                    compatible_files = compatible_files + self.get_compatible_files_in_folder(filepath, recursion_depth-1)
+    def add_to_selection(self, records):
+        file_selection = self.umi_settings.umi_file_selection
+        for record in records:
+            self.file_records.add(record)
+            self.filepaths.append(record.path)
+            filepath = file_selection.add()
+            filepath.name = record.path
+            filepath.ext = record.ext
+            filepath.path = record.path
+            filepath.size = record.size_mb
 
-        return compatible_files
+        self.umi_settings.umi_file_scan_found_count = len(self.filepaths)
 
     def store_formats_to_import(self):
+        stored_formats = {f['name'] for f in self.formats_to_import}
         for f in self.filepaths:
-            format = COMPATIBLE_FORMATS.get_format_from_extension(path.splitext(f)[1])
-            if format not in self.formats_to_import:
+            record = self.file_records[f]
+            format = COMPATIBLE_FORMATS.get_format_from_extension(record.ext)
+            record.format_name = format['name']
+            if format['name'] not in stored_formats:
+                stored_formats.add(format['name'])
                 self.formats_to_import.append(format)
 
     def revert_parameters(self, context):
@@ -933,6 +1136,10 @@ class UMI(bpy.types.Operator, ImportHelper):
         self.umi_settings.umi_current_format_setting_imported = False
         self.umi_settings.umi_current_format_setting_cancelled = False
         self._filepaths = None
+        self.file_records = FileRecordStore()
+        if self.discovery is not None:
+            self.finish_discovery(interrupted=True)
+        self.folder_scanner = None
         context.window_manager.event_timer_remove(self._timer)
         LOG.revert_parameters()
         LOG.clear_all()
@@ -941,6 +1148,17 @@ class UMI(bpy.types.Operator, ImportHelper):
         bpy.utils.unregister_class(UMI_OT_Settings)
         bpy.utils.register_class(UMI_OT_Settings)
         self._filepaths = None
+        self.file_records = FileRecordStore()
+        self.import_stats = ImportStats(get_umi_performance().import_stats_file)
+        performance = get_umi_performance()
+        # Meshes and materials are only counted by the profiler
+        self.datablocks = DatablockTracker(PROFILED_COLLECTIONS if performance.profile_imports else TRACKED_COLLECTIONS)
+        self.profiler = ImportProfiler() if performance.profile_imports else None
+        self.current_batch_profiles = []
+        self.post_process_start = 0
+        self.import_cache = ImportCache(performance.import_cache_folder, performance.import_cache_size, hash_content=performance.import_cache_hash_content) if performance.use_import_cache else None
+        self.import_plans = ImportPlans(self.get_format_handler, self.get_import_module_name)
+        self.file_import_time = 0
         self.current_blend_file = bpy.data.filepath
         self.current_files_to_import = []
         self.current_filenames = []
@@ -975,20 +1193,20 @@ class UMI(bpy.types.Operator, ImportHelper):
 
         self.blend_backup_file = autosave
         
-        if not len(self.filepaths):
-            message = "No compatible file selected"
-            LOG.error(message)
-            self.report({'ERROR'}, message)
-            return {'CANCELLED'}
-
-        if self.umi_settings.umi_global_import_settings.max_batch_size and self.umi_settings.umi_global_import_settings.minimize_batch_number:
-            # Sorting filepaths per Filesize for optimization
-            self.filepaths = self.sort_per_filesize(self.filepaths)
+        # In folder mode, files are discovered progressively in the modal loop while the selection dialog is open
+        if self.import_folders:
+            self.start_discovery()
+        else:
+            if not len(self.filepaths):
+                message = "No compatible file selected"
+                LOG.error(message)
+                self.report({'ERROR'}, message)
+                return {'CANCELLED'}
 
-        self.init_progress()
+            self.init_progress()
 
-        LOG.info("{} compatible file(s) found".format(len(self.filepaths)))
-        LOG.separator()
+            LOG.info("{} compatible file(s) found".format(len(self.filepaths)))
+            LOG.separator()
 
         self.view_layer = bpy.context.view_layer
         self.root_collection = bpy.context.collection
@@ -1003,101 +1221,215 @@ class UMI(bpy.types.Operator, ImportHelper):
         self.objects_to_process = []
         self.current_object_to_process = None
 
+        if self.import_folders:
+            self.events = start_event_stream('folder', directory=self.directory, recursion_depth=self.recursion_depth)
+        else:
+            self.events = start_event_stream('files', directory=self.directory, file_count=self.number_of_files, size_mb=self.total_import_size)
+
         args = (context,)
         self._handle = bpy.types.SpaceView3D.draw_handler_add(LOG.draw_callback_px, args, 'WINDOW', 'POST_PIXEL')
 
         wm = context.window_manager
-        self._timer = wm.event_timer_add(0.01, window=context.window)
+        self.timer_interval = 0.01
+        self._timer = wm.event_timer_add(self.timer_interval, window=context.window)
         wm.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
-    def sort_zipped_list(self, zipped):
-        sorted_filepaths = []
-        i = 0
-        for z in zipped:
-            if len(sorted_filepaths):
-                j = 0
-                for s in sorted_filepaths:
-                    if s[0] > z[0]:
-                        j += 1
-                        # print(f'{s[0]} > {z[0]}')
-                        continue
-                    else:
-                        # print(f'Assigning {z} to position {z}')
-                        sorted_filepaths.insert(j, z)
-                        break
-                else:
-                    sorted_filepaths.insert(j, z)
-            else:
-                sorted_filepaths.insert(0, z)
-            i += 1
+    def plan_batches(self):
+        global_settings = self.umi_settings.umi_global_import_settings
+        start = time.perf_counter()
+        if global_settings.batch_size_mode == 'DURATION':
+            # Batches are filled up to a predicted import duration instead of a size in MB
+            files = []
+            for f in self.filepaths:
+                record = self.file_records[f]
+                record.module_name = self.get_import_module_name(record.format_name)
+                files.append((f, self.import_stats.predict(record.format_name, record.module_name, record.size_mb)))
+            max_batch_size = global_settings.target_batch_duration
+        else:
+            files = [(f, self.file_records[f].size_mb) for f in self.filepaths]
+            max_batch_size = global_settings.max_batch_size
 
-        return sorted_filepaths
+        self.batch_plan = plan_batches(files, max_batch_size, global_settings.import_simultaneously_count, minimize_batch_number=global_settings.minimize_batch_number)
+        self.next_batch_index = 0
+        LOG.info(f'{len(self.batch_plan)} batch(es) planned in {round(time.perf_counter() - start, 3)}s')
+        if self.events is not None:
+            self.events.batch_planned(len(self.batch_plan), global_settings.batch_size_mode, time.perf_counter() - start)
 
-    def sort_per_filesize(self, filepaths):
-        size_list = [self.get_filesize(f) for f in filepaths]
+    @property
+    def has_remaining_batches(self):
+        return self.next_batch_index < len(self.batch_plan)
+
+    def start_parallel_import(self):
+        global_settings = self.umi_settings.umi_global_import_settings
+        performance = get_umi_performance()
+        filepaths = [f for batch in self.batch_plan for f in batch.filepaths]
+        self.current_file_number = len(filepaths)
+        self.next_batch_index = len(self.batch_plan)
+        self.current_filenames = []
 
-        zipped = zip(size_list, filepaths)
-        zipped = list(zipped)
-        
-        sorted_filepaths = self.sort_zipped_list(zipped)
+        if global_settings.skip_already_imported_files:
+            for f in filepaths:
+                record = self.file_records[f]
+                if record.name in bpy.data.collections:
+                    record.status = FileStatus.SKIPPED
+                    LOG.warning(f'File {record.name} have already been imported, skiping file...')
+                    if self.events is not None:
+                        self.events.file_end(record, FileStatus.SKIPPED)
+            filepaths = [f for f in filepaths if self.file_records[f].status != FileStatus.SKIPPED]
+            remaining = set(filepaths)
+            self.batch_plan = tuple(b._replace(filepaths=[f for f in b.filepaths if f in remaining]) for b in self.batch_plan)
+
+        if not len(filepaths):
+            return
+
+        plans = {}
+        for f in filepaths:
+            record = self.file_records[f]
+            plan = self.import_plans.get(record.ext)
+            record.format_name = plan.format_name
+            record.module_name = plan.module_name
+            plans[record.ext] = plan.to_dict()
+
+        self.worker_shards = split_shards([b for b in self.batch_plan if len(b.filepaths)], performance.worker_count)
+        self.worker_folder = tempfile.mkdtemp(prefix='umi_workers_')
+        self.worker_outputs = []
+        self.worker_collections = []
+        self.worker_jobs = {}
+        jobs = []
+        for i, shard in enumerate(self.worker_shards):
+            # Job ids are unique across sessions, as the pool is shared between them
+            job_id = f'{path.basename(self.worker_folder)}_{i}'
+            output = path.join(self.worker_folder, f'shard_{i}.blend')
+            jobs.append({'job': job_id, 'files': shard, 'plans': plans, 'output': output, 'recycle_files': performance.worker_recycle_files, 'recycle_memory': performance.worker_recycle_memory})
+            self.worker_jobs[job_id] = i
+            self.worker_outputs.append(output)
+            self.worker_collections.append([])
+
+        self.batch_number = len(self.worker_shards)
+        self.importing = True
+        self.current_batch_imported = False
+        self.worker_pool = get_worker_pool(performance.worker_count, performance.worker_memory_limit)
+        self.worker_pool.poll_events()
+        self.worker_pool.submit(jobs)
+        LOG.info(f'Importing {len(filepaths)} files with {len(self.worker_shards)} background workers')
+
+    def update_parallel_import(self):
+        for event in self.worker_pool.poll_events():
+            worker = event['worker'] + 1
+            shard = self.worker_jobs.get(event.get('job'))
+            if event['event'] == 'recycled':
+                LOG.info(f'Worker {worker} recycled : {event["reason"]}')
+            elif event['event'] == 'warning':
+                LOG.warning(f'Worker {worker} : {event["message"]}')
+            elif shard is None:
+                # Events of a previous session
+                continue
+            elif event['event'] == 'started':
+                record = self.file_records[event['file']]
+                record.status = FileStatus.IMPORTING
+                LOG.info(f'Worker {worker} : importing {record.name}', level=MessageLevel.IMPORT)
+                if self.events is not None:
+                    self.events.file_start(record, worker=worker)
+            elif event['event'] == 'imported':
+                self.worker_file_imported(event['file'], event['success'], event['error'], event['seconds'])
+                if event['success']:
+                    record = self.file_records[event['file']]
+                    self.import_stats.record(record.format_name, record.module_name, record.size_mb, event['seconds'])
+                    self.worker_collections[shard].append(event['collection'])
+            elif event['event'] == 'exited':
+                message = f'Worker {worker} exited with code {event["returncode"]} while importing'
+                LOG.error(message)
+                LOG.store_failure(message)
+                for line in event['output']:
+                    LOG.error(line)
+
+        if not self.worker_pool.finished:
+            return
+
+        # Files never reported by a crashed worker are failures
+        reported = set(self.imported_files)
+        for shard in self.worker_shards:
+            for f in shard:
+                if f not in reported:
+                    self.worker_file_imported(f, False, None)
+
+        self.merge_worker_results()
+        shutil.rmtree(self.worker_folder, ignore_errors=True)
+        self.worker_pool = None
+        if not get_umi_performance().keep_workers_alive:
+            shutdown_worker_pool()
+        self.importing = False
+        self.current_batch_imported = True
 
-        # Unzip List
-        sorted_filepaths =  [[i for i, j in sorted_filepaths], [j for i, j in sorted_filepaths]] 
-        sorted_filepaths = sorted_filepaths[1]
-        return sorted_filepaths
+    def worker_file_imported(self, filepath, success, error, seconds=None):
+        record = self.file_records[filepath]
+        record.status = FileStatus.SUCCEEDED if success else FileStatus.FAILED
+        self.current_filenames.append(record.name)
+        self.imported_files.append(filepath)
+        self.files_succeeded.append(success)
+        self.total_imported_size += record.size_mb
+        self.update_progress()
+        if error is not None:
+            LOG.error(error)
+            LOG.store_failure(error)
+        LOG.info(f'File {len(self.imported_files)}/{self.number_of_files} - {round(self.progress,2)}% - {round(record.size_mb, 2)}MB : {record.name}')
+        if self.events is not None:
+            self.events.file_end(record, record.status, seconds)
+
+    def merge_worker_results(self):
+        create_collection_per_file = self.umi_settings.umi_global_import_settings.create_collection_per_file
+        self.datablocks.mark()
+        for output, collection_names in zip(self.worker_outputs, self.worker_collections):
+            if not path.exists(output) or not len(collection_names):
+                continue
+            with bpy.data.libraries.load(output, link=False) as (data_from, data_to):
+                data_to.collections = list(collection_names)
 
-    def get_next_viable_file(self, filepaths, initial_size, max_size, selected_files):
-        for f in filepaths:
-            if self.umi_settings.umi_global_import_settings.minimize_batch_number:
-                current_size = self.get_filesize(f)
-                if initial_size + current_size > max_size:
-                    if len(selected_files):
-                        continue
-                return f
-            else:
-                return f
-        
-        return None
+            for collection in data_to.collections:
+                if collection is None:
+                    continue
+                if create_collection_per_file:
+                    self.root_collection.children.link(collection)
+                else:
+                    for o in collection.all_objects:
+                        self.root_collection.objects.link(o)
+
+        if len(self.operator_list):
+            self.objects_to_process += self.datablocks.new('objects')
 
     def log_next_batch(self):
         LOG.info(f'Starting Batch n°{self.batch_number} with {len(self.current_files_to_import)} files')
-        LOG.info(f'Batch size : {round(self.current_batch_size, 2)}MB')
+        if self.events is not None:
+            self.events.batch_start(self.batch_number, len(self.current_files_to_import), self.current_batch_size)
+        if self.umi_settings.umi_global_import_settings.batch_size_mode == 'DURATION':
+            LOG.info(f'Batch predicted duration : {round(self.current_batch_size, 2)}s')
+        else:
+            LOG.info(f'Batch size : {round(self.current_batch_size, 2)}MB')
 
     def next_batch(self):
-        self.current_files_to_import = []
-        self.current_filenames = []
-        self.current_batch_size = 0
+        batch = self.batch_plan[self.next_batch_index]
+        self.next_batch_index += 1
         self.batch_number += 1
-        for _ in range(self.umi_settings.umi_global_import_settings.import_simultaneously_count):
-            if not len(self.filepaths):
-                return
-            
-            next_files = self.get_next_viable_file(self.filepaths, self.current_batch_size, self.umi_settings.umi_global_import_settings.max_batch_size, self.current_files_to_import)
-            if next_files is not None:
-                next_filesize = self.get_filesize(next_files)
-            # Batch is Full
-            if next_files is None:
-                if len(self.current_files_to_import):
-                    return
-                next_files = self.filepaths.pop(0)
-
-            elif self.current_batch_size + next_filesize > self.umi_settings.umi_global_import_settings.max_batch_size:
-                if len(self.current_files_to_import):
-                    return
-                
-            # increment batch and import size
-            self.current_batch_size += next_filesize
-            self.filepaths.remove(next_files)
-            self.current_files_to_import.append(next_files)
-            self.current_file_number += 1
-            self.current_batch_imported = False
+        self.current_files_to_import = deque(batch.filepaths)
+        self.current_filenames = []
+        self.current_batch_profiles = []
+        self.current_batch_size = batch.size
+        self.current_file_number += len(batch.filepaths)
+        self.current_batch_imported = False
         
     def cancel(self, context):
         self.canceled = True
         if self._timer is not None:
             wm = context.window_manager
             wm.event_timer_remove(self._timer)
+        if self.worker_pool is not None:
+            self.worker_pool.cancel()
+            self.worker_pool = None
+            shutil.rmtree(self.worker_folder, ignore_errors=True)
+        end_event_stream('cancelled')
+        self.events = None
+        LOG.flush()
 
     def cancel_finish(self, context):
         self.cancel(context)
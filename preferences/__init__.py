@@ -5,9 +5,10 @@ from .. import ADDON_PACKAGE
 from . import formats
 from . import preferences
 from . import colors
+from . import performance
 from . import operators
 
-modules = (formats, colors, preferences, operators)
+modules = (formats, colors, performance, preferences, operators)
 
 def register():
     for m in modules:
@@ -5,54 +5,40 @@ from . import panels
 from .format_definition import FormatDefinition
 FORMATS = [f for f in dir(FormatDefinition) if not f.startswith('__')]
 
+from . import addon_dependency_service
 from .format_compatible import CompatibleFormats
 COMPATIBLE_FORMATS = CompatibleFormats()
 
-from .format_handler import FormatHandler
+from . import format_handler
+from .format_handler import FormatHandler, get_format_handler, get_format_handlers, get_current_format_handler
 
 from . import properties
 
-from .format_class_creator import FormatClassCreator
+from .format_class_creator import FormatClassCreator, get_settings_class, settings_attribute
 
 # function to register dynamically generated classes for each compatible formats
 def register_import_setting_class():
-    for f in COMPATIBLE_FORMATS.formats:
-        cl_name = f'UMI_{f[0]}_module'
-        cl = eval(cl_name)
-        properties.PG_ImportSettings.__annotations__[f'{f[0]}_import_module'] = bpy.props.PointerProperty(type=cl)
-        for name in f[1]['operator'].keys():
-            cl_name = f'UMI_{f[0]}_{name}_settings'
-            cl = eval(cl_name)
-            properties.PG_ImportSettings.__annotations__[f'{f[0]}_{name}_import_settings'] = bpy.props.PointerProperty(type=cl)
+    classes = FormatClassCreator().compatible_formats_class
+    for format_key, cl in classes['modules'].items():
+        properties.PG_ImportSettings.__annotations__[f'{format_key}_import_module'] = bpy.props.PointerProperty(type=cl)
+    for (format_key, module_name), cl in classes['classes'].items():
+        properties.PG_ImportSettings.__annotations__[settings_attribute(format_key, module_name)] = bpy.props.PointerProperty(type=cl)
             
     properties.PG_ImportSettings.umi_import_settings_registered = True
     
 def register():
+    addon_dependency_service.register()
     class_parser = FormatClassCreator()
     class_parser.register_compatible_formats()
     register_import_setting_class()
+    format_handler.register()
     panels.register()
     properties.register()
 
 def unregister():
     properties.unregister()
     panels.unregister()
+    format_handler.unregister()
     class_parser = FormatClassCreator()
     class_parser.unregister_compatible_formats()
-
-def get_import_modules():
-    modules = []
-    for f in COMPATIBLE_FORMATS.formats:
-        module_items = [(m.upper(), m.title().replace('_', ' '), '') for m in f[1]['operator'].keys()]
-        modules.append(f'class UMI_{f[0]}_module(bpy.types.PropertyGroup):name: bpy.props.EnumProperty(items={module_items}, name="Import Module")')
-        # exec(f'class UMI_{f[0]}_module(bpy.types.PropertyGroup):name: bpy.props.EnumProperty(items={module_items}, name="Import Module")')
-        for name in f[1]['operator'].keys():
-            modules.append(f'class UMI_{f[0]}_{name}_settings(bpy.types.PropertyGroup):name: bpy.props.StringProperty(name="Import Setting Name", default="{f[0]}_{name}")')
-            # exec(f'class UMI_{f[0]}_{name}_settings(bpy.types.PropertyGroup):name: bpy.props.StringProperty(name="Import Setting Name", default="{f[0]}_{name}")')
-
-    return modules
-
-modules = get_import_modules()
-
-for m in modules:
-    exec(m)
\ No newline at end of file
+    addon_dependency_service.unregister()
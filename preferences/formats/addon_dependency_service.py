@@ -0,0 +1,45 @@
+import bpy, addon_utils
+from bpy.app.handlers import persistent
+from ...core import AddonSnapshot
+
+_snapshot = None
+
+
+def list_installed_addons():
+    return [m.__name__ for m in addon_utils.modules()]
+
+
+def list_enabled_addons():
+    return bpy.context.preferences.addons.keys()
+
+
+def get_addon_snapshot():
+    """
+    Installed and enabled add-ons, scanned once and kept until invalidate_addon_snapshot() is called
+    """
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = AddonSnapshot(list_installed_addons, list_enabled_addons)
+    return _snapshot
+
+
+def invalidate_addon_snapshot(installed=True, enabled=True):
+    if _snapshot is not None:
+        _snapshot.invalidate(installed=installed, enabled=enabled)
+
+
+@persistent
+def invalidate_on_load(*args):
+    # Loading the startup file or reverting the preferences can change the enabled add-ons
+    invalidate_addon_snapshot()
+
+
+def register():
+    if invalidate_on_load not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(invalidate_on_load)
+
+def unregister():
+    global _snapshot
+    if invalidate_on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(invalidate_on_load)
+    _snapshot = None
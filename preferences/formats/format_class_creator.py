@@ -1,159 +1,80 @@
 import bpy
 from . import COMPATIBLE_FORMATS
 
-### from https://stackoverflow.com/questions/15247075/how-can-i-dynamically-create-derived-classes-from-a-base-class
-# class BaseClass(object):
-#     def __init__(self, classtype):
-#         self._type = classtype
-
-# def ClassFactory(name, argnames, BaseClass=BaseClass):
-#     def __init__(self, **kwargs):
-#         for key, value in kwargs.items():
-#             # here, the argnames variable is the one passed to the
-#             # ClassFactory call
-#             if key not in argnames:
-#                 raise TypeError("Argument %s not valid for %s" 
-#                     % (key, self.__class__.__name__))
-#             setattr(self, key, value)
-#         BaseClass.__init__(self, name[:-len("Class")])
-#     newclass = type(name, (BaseClass,),{"__init__": __init__})
-#     return newclass
+def settings_attribute(format_key, module_name):
+    return f'{format_key}_{module_name}_import_settings'
 
 class FormatClassCreator():
-    def __init__(self):
-        self._classes = None
+    """
+    Module classes (the import module enum of each format) and settings classes (the properties of each importer operator)
+    are created and registered with the add-on : Blender doesn't allow registering classes from drawing code.
+    Settings classes are built from the properties cached in COMPATIBLE_FORMATS.schema.
+    """
+    # Shared by every instance : the classes unregistered must be the ones registered
+    _classes = None
 
-    incompatible_subclass = ['Operator', 'bpy_struct', 'object']
-    
     @property
     def compatible_formats_class(self):
-        if self._classes is None:
-            self._classes = {'classes':[], 'modules':[]}
+        if FormatClassCreator._classes is None:
+            classes = {'classes':{}, 'modules':{}}
             for f in COMPATIBLE_FORMATS.formats:
-                try:
-                    exec(f'from . import UMI_{f[0]}_module')
-                except ImportError as e:
-                    continue
-                import_module = eval(f'UMI_{f[0]}_module')
-                self._classes['modules'].append(import_module)
-                for name, operator in f[1]['operator'].items():
-                    exec(f'from . import UMI_{f[0]}_{name}_settings')
-                    format_class = eval(f'UMI_{f[0]}_{name}_settings')
-
-                    if operator['module'] is not None:
-                        format_class = self.create_format_class_from_module(operator, format_class)
-                    else:
-                        format_class = self.create_format_class_from_operator(operator, format_class)
-
-                    self._classes['classes'].append(format_class)
-
-        return self._classes
-
-    def create_format_class_from_module(self, f, format_class):
-        print(f'create class from module {f["module"]}')
-        format_module = getattr(bpy.types, f['module'], None)
-
-        if format_module is None:
-            print(f"Invalid module name passed : {f['module']}\nOr importer addon is disable")
-            return None
-        
-        for sub_module in self.get_valid_submodule(format_module):
-            self.create_format_class_hierarchy_from_module(f, format_class, sub_module)
-
-        format_class.__annotations__['settings_imported'] = bpy.props.BoolProperty(name='Settings imported', default=False, options={'HIDDEN'})
-        return format_class
-    
-    def create_format_class_hierarchy_from_module(self, f, format_class, format_module):
-
-        if format_module is None:
-            print(f"Invalid module name passed : {f['module']}\nOr importer addon is disable")
-            return None
-        
-        format_annotations = getattr(format_module, "__annotations__", None)
-
-        key_to_delete = []
-        for k,v in format_annotations.items():
-            try:
-                v.keywords
-            except AttributeError:
-                continue
-            
-            if 'options' in v.keywords.keys():
-                options = v.keywords['options']
-            else:
-                options = None
-
-            if options == {'HIDDEN'}:
-                key_to_delete.append(k)
-                continue
-
-            format_class.__annotations__[k] = v
-
-        for k in key_to_delete:
-            del format_annotations[k]
+                module_items = [(m.upper(), m.title().replace('_', ' '), '') for m in f[1]['operator'].keys()]
+                classes['modules'][f[0]] = type(f'UMI_{f[0]}_module', (bpy.types.PropertyGroup,), {'__annotations__': {'name': bpy.props.EnumProperty(items=module_items, name="Import Module")}})
+                for name in f[1]['operator'].keys():
+                    classes['classes'][(f[0], name)] = create_settings_class(f[0], name)
+            # Properties gathered from the importer operators are written once, for the next start
+            COMPATIBLE_FORMATS.schema.save_changes()
+            FormatClassCreator._classes = classes
 
-        return format_class
-
-    def create_format_class_from_operator(self, f, format_class):
-        print(f'create class from operator {f["command"]}')
-        if 'import_settings' in f.keys() :
-            # TODO : create a pointer to a settings for each g[0]
-            for g in f['import_settings']:
-                if not len(g):
-                    continue
-                if not len(g[1].keys()):
-                    continue
-                for k,v in g[1].items():
-                    command = f'{v["type"]}(name={v["name"]}, default={v["default"]}'
-                    
-                    if 'enum_items' in v.keys():
-                        command += f', items={v["enum_items"]}'
-                    if 'min' in v.keys():
-                        command += f', min={v["min"]}'
-                    if 'max' in v.keys():
-                        command += f', max={v["max"]}'
-                        
-                    command += f')'
-                    
-                    format_class.__annotations__[k] = eval(command)
-        
-        format_class.__annotations__['settings_imported'] = bpy.props.BoolProperty(name='Settings imported', default=False, options={'HIDDEN'})
-        return format_class
-    
-    def get_valid_submodule(self, format_module):
-        return [c for c in format_module.__mro__ if c.__name__ not in self.incompatible_subclass]
+        return FormatClassCreator._classes
 
     def register_compatible_formats(self):
-        for c in self.compatible_formats_class['classes']:
-            if c is None:
-                continue
+        for c in self.compatible_formats_class['classes'].values():
             try:
                 bpy.utils.register_class(c)
             except ValueError:
                 continue
 
-        for c in self.compatible_formats_class['modules']:
-            if c is None:
-                continue
+        for c in self.compatible_formats_class['modules'].values():
             try:
                 bpy.utils.register_class(c)
             except ValueError:
                 continue
-    
+
     def unregister_compatible_formats(self):
-        for c in reversed(self.compatible_formats_class['classes']):
-            if c is None:
-                continue
+        for c in reversed(list(self.compatible_formats_class['classes'].values())):
             try:
                 bpy.utils.unregister_class(c)
-            except ValueError:
+            except (ValueError, RuntimeError):
                 continue
 
-        for c in reversed(self.compatible_formats_class['modules']):
-            if c is None:
-                continue
+        for c in reversed(list(self.compatible_formats_class['modules'].values())):
             try:
                 bpy.utils.unregister_class(c)
-            except ValueError:
+            except (ValueError, RuntimeError):
                 continue
-        
+
+
+def create_settings_class(format_key, module_name):
+    operator = COMPATIBLE_FORMATS.formats_dict[format_key]['operator'][module_name]
+    entries = COMPATIBLE_FORMATS.schema.settings_entries(format_key, module_name, operator)
+    if entries is None:
+        print(f"Invalid module name passed : {operator['module']}\nOr importer addon is disable")
+        entries = []
+
+    def settings_update(self, context):
+        # The settings dict of the format handler is only gathered again after a change
+        from .format_handler import settings_changed
+        settings_changed(format_key, module_name)
+
+    annotations = {'name': bpy.props.StringProperty(name="Import Setting Name", default=f"{format_key}_{module_name}")}
+    for entry in entries:
+        prop = COMPATIBLE_FORMATS.schema.create_property(entry, operator, update=settings_update)
+        if prop is not None:
+            annotations[entry['name']] = prop
+    annotations['settings_imported'] = bpy.props.BoolProperty(name='Settings imported', default=False, options={'HIDDEN'})
+
+    return type(f'UMI_{format_key}_{module_name}_settings', (bpy.types.PropertyGroup,), {'__annotations__': annotations})
+
+def get_settings_class(format_key, module_name):
+    return FormatClassCreator().compatible_formats_class['classes'][(format_key, module_name)]
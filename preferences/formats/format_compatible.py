@@ -1,16 +1,34 @@
-import bpy, addon_utils
+import bpy
 from .format_definition import FormatDefinition
+from .format_schema import FormatSchema
+from .addon_dependency_service import get_addon_snapshot
 from . import FORMATS
 from ...logger import LOG
 from .panels.presets import format_preset
-import inspect
+from ...core import FormatResolver
+import importlib, inspect
+from types import MappingProxyType
+
+def resolve_operator(command):
+    # 'bpy.ops.wm.obj_import' -> bpy.ops.wm.obj_import
+    category, name = command.split('.')[-2:]
+    return getattr(getattr(bpy.ops, category), name)
+
+def get_definitions(cls):
+    attributes = inspect.getmembers(cls, lambda a:not(inspect.isroutine(a)))
+    formats = [a for a in attributes if (not(a[0].startswith('__') and a[0].endswith('__')) and isinstance(a[1], dict))]
+    return {a[0]:a[1] for a in formats}
 
 class CompatibleFormats():
     for format in FORMATS:
         exec('{} = {}'.format(format, getattr(FormatDefinition, format)))
+
+    # Format definitions never change once the add-on is loaded : they are gathered once
+    _all_formats = None
+    _all_registered_formats = None
+    _all_valid_addons = None
     
     def __init__(self):
-        self._extensions = None
         self._extensions_string = None
         self._operators = None
         self._module = None		
@@ -18,89 +36,78 @@ class CompatibleFormats():
         self._filter_glob_extensions = None
         self._filter_glob = None
         # automatically gather format
-        self.formats = CompatibleFormats.get_formats()
+        self.schema = FormatSchema()
+        self.formats = CompatibleFormats.get_formats(self.schema)
         self.formats_dict = {a[0]:a[1] for a in self.formats}
+        self.resolver = FormatResolver(self.formats)
 
     def is_format_installed(self, addon_name):
-        return addon_name in self.installed_addons
+        return get_addon_snapshot().is_installed(addon_name)
     
     def is_format_enabled(self, addon_name):
-        return addon_name in self.enabled_addons
+        return get_addon_snapshot().is_enabled(addon_name)
 
     def is_format_extension(self, format_name, module):
         return self.all_formats[format_name]['operator'][module]['pkg_id'] != None
 
     @property
     def all_valid_addons(self):
-        all_valid_addons = []
-        for f in self.all_formats.values():
-            for module in f['operator'].values():
-                all_valid_addons.append(module['addon_name'])
+        if CompatibleFormats._all_valid_addons is None:
+            all_valid_addons = []
+            for f in self.all_formats.values():
+                for module in f['operator'].values():
+                    if module['addon_name'] not in all_valid_addons:
+                        all_valid_addons.append(module['addon_name'])
+            CompatibleFormats._all_valid_addons = tuple(all_valid_addons)
 
-        return all_valid_addons
+        return CompatibleFormats._all_valid_addons
 
     @property
     def valid_installed_addons(self):
-        return [a for a in self.installed_addons if a in self.all_valid_addons]
+        installed_addons = get_addon_snapshot().installed
+        return [a for a in self.all_valid_addons if a in installed_addons]
 
     @property
     def installed_addons(self):
-        return [a.__name__ for a in addon_utils.modules()]
+        return get_addon_snapshot().installed
     
     @property
     def enabled_addons(self):
-        return list(bpy.context.preferences.addons.keys())
+        return get_addon_snapshot().enabled
 
     @property
     def is_all_formats_installed(self):
-        valid = True
-        valid_installed_addons = self.valid_installed_addons
-        for a in self.all_valid_addons:
-            if a is None:
-                continue
-
-            if a not in valid_installed_addons:
-                valid = False
-                break
-
-        return valid
+        return get_addon_snapshot().all_installed(self.all_valid_addons)
 
     @property
     def is_all_formats_enabled(self):
-        valid = True
-        enabled_addons = self.enabled_addons
-        for a in self.all_valid_addons:
-            if a is None:
-                continue
-
-            if a not in enabled_addons:
-                valid = False
-                break
-
-        return valid
+        return get_addon_snapshot().all_enabled(self.all_valid_addons)
 
     @property
     def need_reboot(self):
-        try:
-            
-            for f in self.all_formats.values():
-                for name in f['operator'].keys():
-                    exec(f'from . import UMI_{f["name"]}_{name}_settings')
-        except ImportError as e:
-            return True
+        # Import modules found since the add-on was loaded only get their settings class after a reload
+        for format_key, f in self.all_formats.items():
+            registered = self.formats_dict.get(format_key)
+            for name in f['operator'].keys():
+                if registered is None or name not in registered['operator']:
+                    return True
         
         return False
 
 
     @property
     def extensions(self):
-        if self._extensions is None:
-            extensions = []
-            for f in self.formats:
-                if isinstance(f[1], dict):
-                    extensions = extensions + f[1]['ext']
-            self._extensions = extensions
-        return self._extensions
+        return self.resolver.extensions
+
+    @property
+    def extension_set(self):
+        """
+        Frozen set of the compatible extensions, lowercase
+        """
+        return self.resolver.extension_set
+
+    def is_extension_supported(self, ext):
+        return self.resolver.is_supported(ext)
     
     @property
     def extensions_string(self):
@@ -134,7 +141,7 @@ class CompatibleFormats():
     @property
     def filename_ext(self):
         if self._filename_ext is None:
-            self._filename_ext = {e for e in self.extensions}
+            self._filename_ext = frozenset(self.extensions)
 
         return self._filename_ext
     
@@ -160,81 +167,76 @@ class CompatibleFormats():
 
     @property
     def all_formats(self):
-        attributes = inspect.getmembers(FormatDefinition, lambda a:not(inspect.isroutine(a)))
-        formats = [a for a in attributes if (not(a[0].startswith('__') and a[0].endswith('__')) and isinstance(a[1], dict))]
-
-        all_formats = {a[0]:a[1] for a in formats}
-        return all_formats
+        if CompatibleFormats._all_formats is None:
+            CompatibleFormats._all_formats = MappingProxyType(get_definitions(FormatDefinition))
+        return CompatibleFormats._all_formats
     
     @property
     def all_registered_formats(self):
-        attributes = inspect.getmembers(CompatibleFormats, lambda a:not(inspect.isroutine(a)))
-        formats = [a for a in attributes if (not(a[0].startswith('__') and a[0].endswith('__')) and isinstance(a[1], dict))]
-
-        all_formats = {a[0]:a[1] for a in formats}
-        return all_formats
+        if CompatibleFormats._all_registered_formats is None:
+            CompatibleFormats._all_registered_formats = MappingProxyType(get_definitions(CompatibleFormats))
+        return CompatibleFormats._all_registered_formats
 
     @classmethod
-    def get_formats(cls):
-        attributes = inspect.getmembers(CompatibleFormats, lambda a:not(inspect.isroutine(a)))
-        formats = [a for a in attributes if (not(a[0].startswith('__') and a[0].endswith('__')) and isinstance(a[1], dict))]
+    def get_formats(cls, schema=None):
+        formats = list(get_definitions(CompatibleFormats).items())
+        available_modules = schema.modules if schema is not None else None
+        probed_modules = {}
 
         valid_formats = []
         for f in formats:
             op = {}
             new_f = f
-            assigned = []
-            for n,o in f[1]['operator'].items():
-                if o['module'] is None:
-                    # Check Command
-                    try:
-                        eval(o['command'])
-                    except:
-                        assigned.append(False)
-                        print(o['command'], 'not found')
-                        continue
-
-                    op[n] = f[1]['operator'][n]
-                else:
-                    # Check Module
-                    if o['module'] not in dir(bpy.types):
-                        assigned.append(False)
+            if available_modules is not None:
+                # Result of a previous probe with the same Blender and importer add-on versions
+                for n in available_modules.get(f[0], []):
+                    if n in f[1]['operator']:
+                        op[n] = f[1]['operator'][n]
+            else:
+                for n,o in f[1]['operator'].items():
+                    if o['module'] is None:
+                        # Check Command
+                        try:
+                            resolve_operator(o['command'])
+                        except AttributeError:
+                            print(o['command'], 'not found')
+                            continue
+                    elif not hasattr(bpy.types, o['module']):
+                        # Check Module
                         print(o['module'], 'not in bpy.types')
                         continue
 
                     op[n] = f[1]['operator'][n]
+                probed_modules[f[0]] = list(op.keys())
             
             # check if at leas one modyle succeeded
-            if len(assigned) < len(f[1]['operator'].keys()):
+            if len(op):
                 new_f[1]['operator'] = op
                 valid_formats.append(new_f)
 
+        if schema is not None and available_modules is None:
+            schema.set_modules(probed_modules)
+
         return valid_formats
     
     def get_format_from_extension(self, ext):
-        if ext.lower() not in self.extensions:
+        format = self.resolver.format_from_extension(ext)
+        if format is None:
             # raise Exception("extension '{}' is not supported".format(ext))
             message = f"extension '{ext}' is not supported"
             LOG.error(message)
-            return None
-        else:
-            for f in self.formats:
-                if  ext.lower() in f[1]['ext']:
-                    return f[1]
+        return format
     
     def get_operator_name_from_extension(self, ext):
-        format = self.get_format_from_extension(ext)
-        if format is None:
-            return None
-        formats = {}
-        for k,v in format['operator'].items():
-            formats[k] = v
-        
-        return formats
+        operators = self.resolver.operators_from_extension(ext)
+        if operators is None:
+            message = f"extension '{ext}' is not supported"
+            LOG.error(message)
+        return operators
     
     def draw_format_settings(self, context, format_name, operator, module_name, layout):
-        exec(f'from .panels import panel_{format_name}')
-        module = eval(f'panel_{format_name}.IMPORT_SCENE_{format_name.upper()}Settings')
+        panel = importlib.import_module(f'.panels.panel_{format_name}', __package__)
+        module = getattr(panel, f'IMPORT_SCENE_{format_name.upper()}Settings')
         self.layout = layout
         
         format_preset.panel_func(self, context)
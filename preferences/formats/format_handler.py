@@ -1,60 +1,78 @@
 import bpy
+from bpy.app.handlers import persistent
 from ...umi_const import get_umi_settings
 from . import COMPATIBLE_FORMATS
+from .format_class_creator import get_settings_class
+
+# format -> {module -> FormatHandler}, built once at registration and reused by every import session
+FORMAT_HANDLERS = {}
 
 class FormatHandler():
     import_format : bpy.props.StringProperty(name='Import Format', default="", options={'HIDDEN'},)
 
-    def __init__(self, import_format, module_name, context):
-        self.umi_settings = get_umi_settings() 
-        self._format = None
-        self._format_name = None
-        self._format_settings = None
-        self._format_class = None
-        self._format_annotations = None
-        self._format_settings_dict = None
+    def __init__(self, import_format, module_name, context=None):
         self.module_name = module_name
         self.import_format = import_format
         self.context = context
+        self._format = getattr(COMPATIBLE_FORMATS, self.import_format)
+        self._format_name = self._format['name']
+        self._format_class = None
+        self._format_annotations = None
+        self._format_settings_dict = None
+        self.settings_attribute = f'{self._format_name}_{self.module_name}_import_settings'
+        self.module_attribute = f'{self._format_name}_import_module'
+        self.reset()
+
+    def reset(self):
+        """
+        Drop the references to the preferences property groups, they are no longer valid once the preferences are reloaded
+        """
+        self.umi_settings = None
+        self._format_settings = None
+        self._import_module = None
+        self._format_settings_dict = None
+
+    def settings_changed(self):
+        # Called by the update callback of each settings property
+        self._format_settings_dict = None
 
     @property
     def format(self):
-        if self._format is None:
-            self._format = getattr(COMPATIBLE_FORMATS, self.import_format)
-
         return self._format
 
     @property
     def format_name(self):
-        if self._format_name is None:
-            self._format_name = self.format['name']
-
         return self._format_name
 
     @property
     def format_class(self):
         if self._format_class is None:
-            eval(f'from . import UMI_{self.format_name}_{self.module_name}_settings')
-            self._format_class = eval(f'UMI_{self.format_name}_{self.module_name}_settings')
-        
+            self._format_class = get_settings_class(self.format_name, self.module_name)
+
         return self._format_class
 
     @property
     def format_annotations(self):
         if self._format_annotations is None:
             self._format_annotations = getattr(self.format_settings, "__annotations__", None)
-        
+
         return self._format_annotations
 
     @property
     def format_is_imported(self):
         return self.format_settings.settings_imported
 
+    @property
+    def import_settings(self):
+        if self.umi_settings is None:
+            self.umi_settings = get_umi_settings()
+        return self.umi_settings.umi_format_import_settings
+
     @property
     def format_settings(self):
         if self._format_settings is None:
-            self._format_settings = eval(f"self.umi_settings.umi_format_import_settings.{self.format_name}_{self.module_name}_import_settings", {'self':self})
-        
+            self._format_settings = getattr(self.import_settings, self.settings_attribute)
+
         return self._format_settings
 
     @property
@@ -66,7 +84,7 @@ class FormatHandler():
                     continue
                 if k in ['settings_imported', 'bl_rna', 'rna_type', 'name']:
                     continue
-                
+
                 d[k] = getattr(self.format_settings, k)
                 if isinstance(d[k], str):
                     d[k] = '"{}"'.format(d[k])
@@ -76,7 +94,59 @@ class FormatHandler():
 
 
         return self._format_settings_dict
-    
+
     @property
     def import_module(self):
-        return eval(f"self.umi_settings.umi_format_import_settings.{self.format_name}_import_module", {'self':self})
+        if self._import_module is None:
+            self._import_module = getattr(self.import_settings, self.module_attribute)
+        return self._import_module
+
+    @property
+    def import_module_name(self):
+        return self.import_module.name.lower()
+
+
+def build_format_handlers():
+    FORMAT_HANDLERS.clear()
+    for format_key, f in COMPATIBLE_FORMATS.formats:
+        FORMAT_HANDLERS[format_key] = {module_name: FormatHandler(import_format=format_key, module_name=module_name) for module_name in f['operator'].keys()}
+
+def get_format_handlers(format_name):
+    """
+    Handlers of each import module of a format : module name -> FormatHandler
+    """
+    return FORMAT_HANDLERS[format_name]
+
+def get_format_handler(format_name, module_name):
+    return FORMAT_HANDLERS[format_name][module_name]
+
+def get_current_format_handler(format_name):
+    """
+    Handler of the import module selected for a format
+    """
+    handlers = FORMAT_HANDLERS[format_name]
+    return handlers[next(iter(handlers.values())).import_module_name]
+
+def settings_changed(format_name, module_name):
+    handler = FORMAT_HANDLERS.get(format_name, {}).get(module_name)
+    if handler is not None:
+        handler.settings_changed()
+
+@persistent
+def reset_format_handlers(*args):
+    for handlers in FORMAT_HANDLERS.values():
+        for handler in handlers.values():
+            handler.reset()
+
+
+def register():
+    build_format_handlers()
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.load_factory_preferences_post):
+        if reset_format_handlers not in handlers:
+            handlers.append(reset_format_handlers)
+
+def unregister():
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.load_factory_preferences_post):
+        if reset_format_handlers in handlers:
+            handlers.remove(reset_format_handlers)
+    FORMAT_HANDLERS.clear()
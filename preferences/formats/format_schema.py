@@ -0,0 +1,218 @@
+import bpy, ast, hashlib, importlib.util, json, os
+from .format_definition import FormatDefinition
+from ...umi_const import CACHE_PATH
+
+SCHEMA_VERSION = 1
+SCHEMA_FILE = os.path.join(CACHE_PATH, 'format_schema.json')
+
+INCOMPATIBLE_SUBCLASS = ['Operator', 'bpy_struct', 'object']
+
+
+def addon_stamp(addon_name):
+    """
+    Location and modification time of an add-on, read from disk : available whether or not the add-on is loaded yet
+    """
+    try:
+        spec = importlib.util.find_spec(addon_name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None or spec.origin is None:
+        return 'missing'
+    try:
+        return f'{spec.origin}|{os.stat(spec.origin).st_mtime}'
+    except OSError:
+        return 'missing'
+
+
+def schema_key(format_definitions):
+    """
+    Hash of everything the generated schemas depend on : Blender build, UMI version and the state of each importer add-on
+    """
+    from ... import bl_info
+    enabled_addons = bpy.context.preferences.addons
+    addons = set()
+    for f in format_definitions.values():
+        for o in f['operator'].values():
+            if o['addon_name'] is not None:
+                addons.add(o['addon_name'])
+
+    key = {'schema': SCHEMA_VERSION,
+           'blender': [list(bpy.app.version), str(bpy.app.build_hash)],
+           'umi': list(bl_info['version']),
+           'addons': sorted([name, name in enabled_addons, addon_stamp(name)] for name in addons)}
+    return hashlib.sha1(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def to_literal(value):
+    """
+    Return value as a python literal string, or None if it can't be read back as the same value (functions, classes...)
+    """
+    try:
+        literal = repr(value)
+        if ast.literal_eval(literal) == value:
+            return literal
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        pass
+    return None
+
+
+def serialize_property(name, prop):
+    keywords = to_literal(prop.keywords)
+    entry = {'name': name, 'type': prop.function.__name__}
+    if keywords is None:
+        # Update callbacks, dynamic enum items, pointer types : read again from the operator class when the settings class is created
+        entry['live'] = True
+    else:
+        entry['keywords'] = keywords
+    return entry
+
+
+def operator_properties(module_name):
+    """
+    (name, deferred property) of an importer operator class and its bases, without its hidden properties
+    """
+    format_module = getattr(bpy.types, module_name, None)
+    if format_module is None:
+        return None
+
+    properties = []
+    for sub_module in format_module.__mro__:
+        if sub_module.__name__ in INCOMPATIBLE_SUBCLASS:
+            continue
+        for k, v in getattr(sub_module, '__annotations__', {}).items():
+            keywords = getattr(v, 'keywords', None)
+            if keywords is None:
+                continue
+            if keywords.get('options') == {'HIDDEN'}:
+                continue
+            properties.append((k, v))
+
+    return properties
+
+
+def definition_properties(operator):
+    """
+    Schema entries of the import_settings declared in the format definition, for operators without a python class
+    """
+    entries = []
+    for g in operator.get('import_settings', []):
+        if not len(g) or not len(g[1].keys()):
+            continue
+        for k, v in g[1].items():
+            keywords = {'name': ast.literal_eval(v['name'])}
+            keywords['default'] = ast.literal_eval(v['default']) if isinstance(v['default'], str) else v['default']
+            if 'enum_items' in v.keys():
+                keywords['items'] = v['enum_items']
+            for limit in ('min', 'max'):
+                if limit in v.keys():
+                    keywords[limit] = ast.literal_eval(v[limit]) if isinstance(v[limit], str) else v[limit]
+            entries.append({'name': k, 'type': v['type'].split('.')[-1], 'keywords': repr(keywords)})
+
+    return entries
+
+
+class FormatSchema():
+    """
+    Cached result of the format probing done when the add-on loads : the import modules available for each format,
+    and the properties of each format settings class, read from the importer operators. The cache is dropped when its key changes.
+    """
+    def __init__(self, filepath=SCHEMA_FILE):
+        self.filepath = filepath
+        self.key = schema_key(self.format_definitions)
+        self.modules = None
+        self.settings = {}
+        self.changed = False
+        self.load()
+
+    @property
+    def format_definitions(self):
+        return {k: getattr(FormatDefinition, k) for k in dir(FormatDefinition) if not k.startswith('__') and isinstance(getattr(FormatDefinition, k), dict)}
+
+    def load(self):
+        try:
+            with open(self.filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict) or data.get('key') != self.key:
+            return
+
+        modules = data.get('modules')
+        settings = data.get('settings', {})
+        # A hand edited or truncated file is a cache miss : every importer is probed again
+        if not isinstance(modules, dict) or not isinstance(settings, dict):
+            return
+        if not all(isinstance(v, list) for v in (*modules.values(), *settings.values())):
+            return
+
+        self.modules = modules
+        self.settings = settings
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
+            temp_file = self.filepath + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'key': self.key, 'modules': self.modules, 'settings': self.settings}, f)
+            os.replace(temp_file, self.filepath)
+            self.changed = False
+        except OSError as e:
+            print(f'UMI : Format schema cache not saved : {e}')
+
+    def save_changes(self):
+        if self.changed:
+            self.save()
+
+    def set_modules(self, modules):
+        self.modules = modules
+        self.save()
+
+    def settings_entries(self, format_key, module_name, operator):
+        """
+        Property entries of the settings class of one format module, read from the importer when not cached. Written with save_changes()
+        """
+        settings_key = f'{format_key}_{module_name}'
+        if settings_key not in self.settings:
+            if operator['module'] is not None:
+                properties = operator_properties(operator['module'])
+                if properties is None:
+                    return None
+                entries = [serialize_property(k, v) for k, v in properties]
+            else:
+                entries = definition_properties(operator)
+            self.settings[settings_key] = entries
+            self.changed = True
+
+        return self.settings[settings_key]
+
+    @staticmethod
+    def create_property(entry, operator, update=None):
+        """
+        Property of a schema entry, calling *update(self, context)* after its own update callback when the value changes
+        """
+        if entry.get('live'):
+            prop = None
+            # The last definition wins, as in the annotations of the settings class
+            for k, v in operator_properties(operator['module']) or []:
+                if k == entry['name']:
+                    prop = v
+            if prop is None:
+                return None
+            keywords = dict(prop.keywords)
+        else:
+            keywords = ast.literal_eval(entry['keywords'])
+
+        if update is not None and entry['type'] != 'CollectionProperty':
+            keywords['update'] = chain_update(keywords.get('update'), update)
+        return getattr(bpy.props, entry['type'])(**keywords)
+
+
+def chain_update(first, second):
+    if first is None:
+        return second
+
+    def update(self, context):
+        first(self, context)
+        second(self, context)
+    return update
@@ -23,7 +23,8 @@ class WM_MT_UMIFormatPresets(Menu):
 	def preset_subdir(self):
 		umi_settings = get_umi_settings()
 		current_format = umi_settings.umi_file_format_current_settings.copy().pop().lower()
-		current_module = eval(f'umi_settings.umi_format_import_settings.{current_format}_import_module', {'umi_settings':umi_settings}).name.lower()
+		from ...format_handler import get_current_format_handler
+		current_module = get_current_format_handler(current_format).module_name
 		return AddUMIFormatPreset.operator_path(current_format, current_module)
 
 class AddUMIFormatPreset(AddPresetBase, Operator): 
@@ -41,7 +42,8 @@ class AddUMIFormatPreset(AddPresetBase, Operator):
 	def preset_subdir(self):
 		umi_settings = get_umi_settings()
 		current_format = umi_settings.umi_file_format_current_settings.copy().pop().lower()
-		current_module = eval(f'umi_settings.umi_format_import_settings.{current_format}_import_module', {'umi_settings':umi_settings}).name.lower()
+		from ...format_handler import get_current_format_handler
+		current_module = get_current_format_handler(current_format).module_name
 		return AddUMIFormatPreset.operator_path(current_format, current_module)
 
 	@property
@@ -49,9 +51,10 @@ class AddUMIFormatPreset(AddPresetBase, Operator):
 		properties_blacklist = Operator.bl_rna.properties.keys()
 		umi_settings = get_umi_settings()
 		current_format = umi_settings.umi_file_format_current_settings.copy().pop().lower()
-		current_module = eval(f'umi_settings.umi_format_import_settings.{current_format}_import_module', {'umi_settings':umi_settings}).name.lower()
-		from ...format_handler import FormatHandler
-		settings = FormatHandler(import_format=f"{current_format}", module_name=current_module, context=bpy.context).format_settings
+		from ...format_handler import get_current_format_handler
+		handler = get_current_format_handler(current_format)
+		current_module = handler.module_name
+		settings = handler.format_settings
 
 		ret = []
 		for s in dir(settings):
@@ -12,23 +12,18 @@ def update_file_stats(self, context):
     
     selected_files = [f for f in umi_settings.umi_file_selection if f.check]
     size = [f.size for f in selected_files]
-    formats = []
-    for f in selected_files:
-        ext = path.splitext(f.name)[1].lower()
-        if ext in formats:
-            continue
-
-        formats.append(ext)
+    # Unique extensions, in selection order
+    formats = list(dict.fromkeys(path.splitext(f.name)[1].lower() for f in selected_files))
     
     umi_settings.umi_file_stat_selected_count = len(selected_files)
     umi_settings.umi_file_stat_selected_size = sum(size)
     umi_settings.umi_file_stat_selected_formats = '( ' + ' | '.join(formats) + ' )' if len(formats) else 'no'
-    file_selected_format_items = {( COMPATIBLE_FORMATS.get_format_from_extension(f)['name'].upper(), COMPATIBLE_FORMATS.get_format_from_extension(f)['name'].upper(), '') for f in formats}
+    format_names = [COMPATIBLE_FORMATS.get_format_from_extension(f)['name'].upper() for f in formats]
+    file_selected_format_items = {(name, name, '') for name in format_names}
     umi_settings.umi_file_selected_format_items = str(list(file_selected_format_items))
     
     if len(formats) and not len(umi_settings.umi_file_format_current_settings):
-        f = COMPATIBLE_FORMATS.get_format_from_extension(formats[0])['name'].upper()
-        umi_settings.umi_file_format_current_settings = {f}
+        umi_settings.umi_file_format_current_settings = {format_names[0]}
         
 def update_file_format_current_settings(self, context):
     umi_settings = get_umi_settings()
@@ -49,7 +44,8 @@ def get_file_selected_items(self, context):
 
 def update_file_extension_selection(self, context):
     umi_settings = get_umi_settings()
-    current_extensions = {e.ext for e in umi_settings.umi_file_selection if e.ext in COMPATIBLE_FORMATS.extensions}
+    extension_set = COMPATIBLE_FORMATS.extension_set
+    current_extensions = {e.ext for e in umi_settings.umi_file_selection if e.ext in extension_set}
     umi_settings.umi_file_extension_selection_items = str([(e, e, '') for e in current_extensions])
 
 def get_file_extension_selection(self, context):
@@ -94,6 +90,10 @@ class PG_FilePathSelection(bpy.types.PropertyGroup):
 class PG_GlobalSettings(bpy.types.PropertyGroup):
     import_simultaneously_count : bpy.props.IntProperty(name="Max Simultaneously Files", default=200, min=1, description='Maximum number of file to import simultaneously')
     max_batch_size : bpy.props.FloatProperty(name="Max batch size (MB)", description="Max size per import batch. An import batch represents the number of files imported simultaneously", default=20, min=0)
+    parallel_import : bpy.props.BoolProperty(name="Import in Background Workers", description="Split the files between several background Blender processes importing at the same time, then append their results in the current file. The number of workers is set in the add-on preferences", default=False)
+    import_time_budget : bpy.props.FloatProperty(name="Time Budget per Update (ms)", description="Files of the current batch are imported one after the other until this time is spent, then the interface gets a chance to refresh. Lower values keep the viewport responsive, higher values import faster", default=50, min=1)
+    batch_size_mode : bpy.props.EnumProperty(name="Batch Size", description="How the size of an import batch is measured", default='SIZE', items=[('SIZE', 'File Size', 'Limit each batch to Max batch size'), ('DURATION', 'Predicted Duration', 'Limit each batch to Target batch duration, predicted from the import speed of each format in previous sessions')])
+    target_batch_duration : bpy.props.FloatProperty(name="Target batch duration (s)", description="Predicted import duration targeted for each batch", default=5.0, min=0.1)
     minimize_batch_number : bpy.props.BoolProperty(name="Minimize batch number", description="Try to pack files per batch in a way to be as close as possible to the Max batch size, and then minimize the number of import batches", default=True)
     create_collection_per_file : bpy.props.BoolProperty(name='Create collection per file', description='Each imported file will be placed in a collection', default=False)
     backup_file_after_import : bpy.props.BoolProperty(name='Backup file during import', description='Backup file after importing file. The frequency will be made based on "Bakup Step Parameter"',  default=False)
@@ -116,6 +116,8 @@ class PG_UMISettings(bpy.types.PropertyGroup):
     umi_current_format_setting_cancelled : bpy.props.BoolProperty(name='Current Format Settings cancelled', default=False)
     umi_file_selection_started : bpy.props.BoolProperty(name='File selection_started', default=False)
     umi_file_selection_done : bpy.props.BoolProperty(name='File Selected', default=False)
+    umi_file_scan_in_progress : bpy.props.BoolProperty(name='File Scan in Progress', default=False)
+    umi_file_scan_found_count : bpy.props.IntProperty(name='Files Found', default=0)
     umi_operators : bpy.props.CollectionProperty(type = PG_Operator)
     umi_operator_idx : bpy.props.IntProperty()
     umi_presets : bpy.props.CollectionProperty(type = PG_Preset)
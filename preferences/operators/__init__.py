@@ -1,6 +1,6 @@
-from . import log_file, check_addon_dependencies
+from . import log_file, check_addon_dependencies, scan_index, import_stats, import_cache
 
-modules = (log_file, check_addon_dependencies)
+modules = (log_file, check_addon_dependencies, scan_index, import_stats, import_cache)
 
 def register():
     for m in modules:
@@ -1,5 +1,6 @@
 import bpy
 from ..formats import COMPATIBLE_FORMATS
+from ..formats.addon_dependency_service import invalidate_addon_snapshot
 from ...umi_const import get_umi_settings
 
 class UI_UMICheckAddonDependencies(bpy.types.Operator):
@@ -8,8 +9,12 @@ class UI_UMICheckAddonDependencies(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
     bl_description = "Check if Importers addons are installed and enable"
 
+    refresh : bpy.props.BoolProperty(name='Refresh', description='Scan the installed addons again', default=True, options={'HIDDEN', 'SKIP_SAVE'})
 
     def execute(self, context):
+        if self.refresh:
+            invalidate_addon_snapshot()
+
         umi_settings = get_umi_settings()
         addon_dependencies = umi_settings.umi_addon_dependencies
         addon_dependencies.clear()
@@ -48,7 +53,8 @@ class UI_UMIInstallExtension(bpy.types.Operator):
 
     def execute(self, context):
         bpy.ops.extensions.package_install(pkg_id=self.pkg_id, repo_index=self.repo_index)
-        bpy.ops.preferences.umi_check_addon_dependency()
+        invalidate_addon_snapshot()
+        bpy.ops.preferences.umi_check_addon_dependency(refresh=False)
         return {'FINISHED'}
     
 class UI_UMIEnableAddon(bpy.types.Operator):
@@ -62,7 +68,9 @@ class UI_UMIEnableAddon(bpy.types.Operator):
     def execute(self, context):
         assert self.module in COMPATIBLE_FORMATS.all_valid_addons
         bpy.ops.preferences.addon_enable(module=self.module)
-        bpy.ops.preferences.umi_check_addon_dependency()
+        # Enabling doesn't change the installed addons
+        invalidate_addon_snapshot(installed=False)
+        bpy.ops.preferences.umi_check_addon_dependency(refresh=False)
         return {'FINISHED'}
     
 classes = (UI_UMICheckAddonDependencies, UI_UMIInstallExtension, UI_UMIEnableAddon)
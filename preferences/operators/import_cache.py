@@ -0,0 +1,33 @@
+import bpy
+from ...umi_const import get_umi_performance
+from ...core import clear_import_cache
+
+class UI_UMIClearImportCache(bpy.types.Operator):
+    bl_idname = "preferences.umi_clear_import_cache"
+    bl_label = "Clear Import Cache"
+    bl_options = {'REGISTER'}
+    bl_description = "Remove the import results stored in the import cache"
+
+    def invoke(self, context, event):
+        wm = context.window_manager
+        return wm.invoke_confirm(self, event)
+
+    def execute(self, context):
+        cache_folder = get_umi_performance().import_cache_folder
+        if clear_import_cache(cache_folder):
+            self.report({'INFO'}, f'UMI : Import cache cleared : {cache_folder}')
+        else:
+            self.report({'INFO'}, 'UMI : Import cache is already empty')
+        return {'FINISHED'}
+
+classes = (UI_UMIClearImportCache,)
+
+def register():
+	from bpy.utils import register_class
+	for cls in classes:
+		register_class(cls)
+
+def unregister():
+	from bpy.utils import unregister_class
+	for cls in reversed(classes):
+		unregister_class(cls)
@@ -0,0 +1,33 @@
+import bpy
+from ...umi_const import get_umi_performance
+from ...core import clear_import_stats
+
+class UI_UMIClearImportStats(bpy.types.Operator):
+    bl_idname = "preferences.umi_clear_import_stats"
+    bl_label = "Reset Import Statistics"
+    bl_options = {'REGISTER'}
+    bl_description = "Forget the import durations recorded for each format"
+
+    def invoke(self, context, event):
+        wm = context.window_manager
+        return wm.invoke_confirm(self, event)
+
+    def execute(self, context):
+        stats_file = get_umi_performance().import_stats_file
+        if clear_import_stats(stats_file):
+            self.report({'INFO'}, f'UMI : Import statistics cleared : {stats_file}')
+        else:
+            self.report({'INFO'}, 'UMI : Import statistics are already empty')
+        return {'FINISHED'}
+
+classes = (UI_UMIClearImportStats,)
+
+def register():
+	from bpy.utils import register_class
+	for cls in classes:
+		register_class(cls)
+
+def unregister():
+	from bpy.utils import unregister_class
+	for cls in reversed(classes):
+		unregister_class(cls)
@@ -1,17 +1,10 @@
-import bpy, os, tempfile
+import bpy, os
+from ...logger import LOG
 
 def get_latest_log_file():
-    tempdir = tempfile.gettempdir()
-    tempfiles = os.listdir(tempdir)
-
-    assert len(tempfiles)
-    tempfiles = [f for f in tempfiles if os.path.basename(f).startswith('UMI_')]
-    
-    assert len(tempfiles)
-    tempfiles = sorted(tempfiles)
-    log_file = os.path.join(tempdir, tempfiles[0])
-
-    return log_file
+    # Write the queued records before reading the file
+    LOG.flush()
+    return LOG.log_file
 
 
 class UI_UMIOpenLogFile(bpy.types.Operator):
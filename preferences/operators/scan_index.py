@@ -0,0 +1,33 @@
+import bpy
+from ...umi_const import get_umi_performance
+from ...core import clear_scan_index
+
+class UI_UMIClearScanIndex(bpy.types.Operator):
+    bl_idname = "preferences.umi_clear_scan_index"
+    bl_label = "Clear Scan Index"
+    bl_options = {'REGISTER'}
+    bl_description = "Delete the scan index. Next folder scan will list every folder again"
+
+    def invoke(self, context, event):
+        wm = context.window_manager
+        return wm.invoke_confirm(self, event)
+
+    def execute(self, context):
+        index_file = get_umi_performance().scan_index_file
+        if clear_scan_index(index_file):
+            self.report({'INFO'}, f'UMI : Scan index cleared : {index_file}')
+        else:
+            self.report({'INFO'}, 'UMI : Scan index is already empty')
+        return {'FINISHED'}
+
+classes = (UI_UMIClearScanIndex,)
+
+def register():
+	from bpy.utils import register_class
+	for cls in classes:
+		register_class(cls)
+
+def unregister():
+	from bpy.utils import unregister_class
+	for cls in reversed(classes):
+		unregister_class(cls)
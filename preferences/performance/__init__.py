@@ -0,0 +1,12 @@
+from . import performance
+from .performance import PG_UMIPerformance
+
+modules = (performance, )
+
+def register():
+    for m in modules:
+        m.register()
+
+def unregister():
+    for m in reversed(modules):
+        m.unregister()
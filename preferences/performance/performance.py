@@ -0,0 +1,77 @@
+import bpy, os
+from ...umi_const import CACHE_PATH
+
+class PG_UMIPerformance(bpy.types.PropertyGroup):
+    parallel_scan       : bpy.props.BoolProperty(name="Parallel Folder Scan", description="List sibling folders concurrently when scanning for files to import. It mostly speeds up scans of network storage (SMB/NFS)", default=False)
+    scan_thread_count   : bpy.props.IntProperty(name="Scan Threads", description="Maximum number of folders listed at the same time when Parallel Folder Scan is enabled", default=8, min=2, max=64)
+    scan_time_budget    : bpy.props.IntProperty(name="Scan Time Budget (ms)", description="Time spent scanning folders on each update of the file selection dialog. Higher values scan faster, lower values keep the interface more responsive", default=20, min=5, max=500)
+    use_scan_index      : bpy.props.BoolProperty(name="Use Scan Index", description="Store the content of the scanned folders on disk, so that next scans only list again the folders that changed since", default=False)
+    scan_index_path     : bpy.props.StringProperty(name="Scan Index File", description="File where the scan index is stored. Leave empty to use the default location", default='', subtype='FILE_PATH')
+
+    worker_count        : bpy.props.IntProperty(name="Background Workers", description="Number of background Blender processes used by the parallel import", default=4, min=1, max=64)
+    worker_memory_limit : bpy.props.IntProperty(name="Worker Memory Limit (MB)", description="Maximum memory of each background worker, 0 for no limit. Not supported on Windows", default=0, min=0)
+    keep_workers_alive  : bpy.props.BoolProperty(name="Keep Workers Running", description="Keep the background workers running between imports, so that the next import doesn't wait for Blender to start again", default=True)
+    worker_recycle_files : bpy.props.IntProperty(name="Recycle After (files)", description="Restart a background worker once it imported this number of files, to release memory leaked by importers. 0 to never restart", default=500, min=0)
+    worker_recycle_memory : bpy.props.IntProperty(name="Recycle Above (MB)", description="Restart a background worker once its memory use goes above this value after a job. 0 to never restart", default=4096, min=0)
+
+    profile_imports     : bpy.props.BoolProperty(name="Profile Imports", description="Record the time, memory and datablocks of each imported file, write them next to the log file and show the import time per format at the end of the import", default=False)
+    profile_format      : bpy.props.EnumProperty(name="Profile Format", items=[("CSV", "CSV", ""), ("JSONL", "JSON Lines", "")], default="CSV")
+
+    write_import_events : bpy.props.BoolProperty(name="Write Import Events", description="Write one JSON line per event of each import session (start, scan, batches, files, commands, backups, end), and keep a metrics file in the Prometheus textfile format up to date during the import", default=False)
+    import_events_path  : bpy.props.StringProperty(name="Events File", description="JSON Lines file the import events are appended to. Leave empty to use the default location", default='', subtype='FILE_PATH')
+    import_metrics_path : bpy.props.StringProperty(name="Metrics File", description="Prometheus textfile (.prom) rewritten with the progress of the current import session. Leave empty to use the default location", default='', subtype='FILE_PATH')
+    import_metrics_interval : bpy.props.FloatProperty(name="Metrics Update Interval (s)", description="Minimum time between two writes of the metrics file", default=1.0, min=0.1, max=60.0)
+
+    log_capacity        : bpy.props.IntProperty(name="Log Capacity (lines)", description="Maximum number of lines kept in the log displayed during the import. The oldest lines are dropped above it, the log file keeps every line", default=10000, min=100)
+    log_max_size        : bpy.props.IntProperty(name="Log File Size (MB)", description="The log file is rotated above this size, and once a day", default=10, min=1)
+    log_backup_count    : bpy.props.IntProperty(name="Log File Backups", description="Number of rotated log files kept next to the current one", default=5, min=0, max=100)
+    log_draw_budget     : bpy.props.FloatProperty(name="Log Draw Budget (ms)", description="Maximum time spent drawing the log on the 3D view on each redraw. The remaining lines are skipped for this redraw above it", default=4.0, min=0.5, max=100.0)
+
+    import_stats_path   : bpy.props.StringProperty(name="Import Statistics File", description="File where the import duration of each format is recorded, to plan batches per predicted duration. Leave empty to use the default location", default='', subtype='FILE_PATH')
+
+    use_import_cache    : bpy.props.BoolProperty(name="Use Import Cache", description="Store the result of each import, and append it instead of importing again when the same file is imported with the same settings", default=False)
+    import_cache_path   : bpy.props.StringProperty(name="Import Cache Folder", description="Folder where the import results are stored. Leave empty to use the default location", default='', subtype='DIR_PATH')
+    import_cache_size   : bpy.props.IntProperty(name="Import Cache Size (MB)", description="Maximum size of the import cache. The least recently used results are removed above it", default=2048, min=16)
+    import_cache_hash_content : bpy.props.BoolProperty(name="Identify Files by Content", description="Identify source files by a hash of their content instead of their path, size and modification date. Finds copies of the same file, but reads every file once more", default=False)
+
+    @property
+    def scan_index_file(self):
+        if len(self.scan_index_path):
+            return bpy.path.abspath(self.scan_index_path)
+        return os.path.join(CACHE_PATH, 'scan_index.sqlite')
+
+    @property
+    def import_cache_folder(self):
+        if len(self.import_cache_path):
+            return bpy.path.abspath(self.import_cache_path)
+        return os.path.join(CACHE_PATH, 'import_cache')
+
+    @property
+    def import_events_file(self):
+        if len(self.import_events_path):
+            return bpy.path.abspath(self.import_events_path)
+        return os.path.join(CACHE_PATH, 'import_events.jsonl')
+
+    @property
+    def import_metrics_file(self):
+        if len(self.import_metrics_path):
+            return bpy.path.abspath(self.import_metrics_path)
+        return os.path.join(CACHE_PATH, 'umi_import.prom')
+
+    @property
+    def import_stats_file(self):
+        if len(self.import_stats_path):
+            return bpy.path.abspath(self.import_stats_path)
+        return os.path.join(CACHE_PATH, 'import_stats.json')
+
+classes = (PG_UMIPerformance, )
+
+def register():
+    from bpy.utils import register_class
+    for cls in classes:
+        register_class(cls)
+
+def unregister():
+    from bpy.utils import unregister_class
+    for cls in reversed(classes):
+        unregister_class(cls)
@@ -4,19 +4,24 @@ from ..logger import LOG
 from .formats.properties import PG_UMISettings
 from .colors.presets import color_preset
 from .colors.colors import PG_UMIColors
+from .performance.performance import PG_UMIPerformance
 from .formats import COMPATIBLE_FORMATS
+from .formats.addon_dependency_service import invalidate_addon_snapshot
 from .. import ADDON_PACKAGE
 
 
 PREFERENCE_TABS = [ ("FORMATS", "Formats", ""),
-                    ("COLORS", "Colors", "")]
+                    ("COLORS", "Colors", ""),
+                    ("PERFORMANCE", "Performance", "")]
 
 def update_log_drawing(self, context):
     LOG.show_log = self.umi_settings.umi_global_import_settings.show_log_on_3d_view
 
 def update_addon_dependency(self, context):
     if self.tabs == 'FORMATS':
-        bpy.ops.preferences.umi_check_addon_dependency()
+        # Reading the enabled addons is cheap, the installed ones are rescanned with the refresh button
+        invalidate_addon_snapshot(installed=False)
+        bpy.ops.preferences.umi_check_addon_dependency(refresh=False)
 
 class Preferences(bpy.types.AddonPreferences):
     bl_idname = ADDON_PACKAGE
@@ -25,6 +30,8 @@ class Preferences(bpy.types.AddonPreferences):
 
     umi_colors 	 : bpy.props.PointerProperty(type= PG_UMIColors)
 
+    umi_performance : bpy.props.PointerProperty(type= PG_UMIPerformance)
+
     tabs: bpy.props.EnumProperty(name="Tabs", items=PREFERENCE_TABS, default="FORMATS", update=update_addon_dependency)
     
     def grid_layout(self, layout, alignment, size):
@@ -144,6 +151,69 @@ class Preferences(bpy.types.AddonPreferences):
             box.prop(self.umi_colors, 'umi_command_color')
             box.prop(self.umi_colors, 'umi_import_color')
 
+        elif self.tabs == "PERFORMANCE":
+            scan = box.box()
+            scan.label(text='Folder Scan', icon='VIEWZOOM')
+            scan.prop(self.umi_performance, 'parallel_scan')
+            if self.umi_performance.parallel_scan:
+                scan.prop(self.umi_performance, 'scan_thread_count')
+            scan.prop(self.umi_performance, 'scan_time_budget')
+            scan.prop(self.umi_performance, 'use_scan_index')
+            if self.umi_performance.use_scan_index:
+                scan.prop(self.umi_performance, 'scan_index_path')
+                row = scan.row()
+                row.label(text=self.umi_performance.scan_index_file)
+                row.operator('preferences.umi_clear_scan_index', icon='TRASH')
+
+            workers = box.box()
+            workers.label(text='Parallel Import', icon='SYSTEM')
+            workers.prop(self.umi_performance, 'worker_count')
+            workers.prop(self.umi_performance, 'worker_memory_limit')
+            workers.prop(self.umi_performance, 'keep_workers_alive')
+            workers.prop(self.umi_performance, 'worker_recycle_files')
+            workers.prop(self.umi_performance, 'worker_recycle_memory')
+
+            cache = box.box()
+            cache.label(text='Import Cache', icon='FILE_CACHE')
+            cache.prop(self.umi_performance, 'use_import_cache')
+            if self.umi_performance.use_import_cache:
+                cache.prop(self.umi_performance, 'import_cache_path')
+                cache.prop(self.umi_performance, 'import_cache_size')
+                cache.prop(self.umi_performance, 'import_cache_hash_content')
+                row = cache.row()
+                row.label(text=self.umi_performance.import_cache_folder)
+                row.operator('preferences.umi_clear_import_cache', icon='TRASH')
+
+            profiler = box.box()
+            profiler.label(text='Import Profiler', icon='SORTTIME')
+            profiler.prop(self.umi_performance, 'profile_imports')
+            if self.umi_performance.profile_imports:
+                profiler.prop(self.umi_performance, 'profile_format')
+
+            events = box.box()
+            events.label(text='Import Events', icon='GRAPH')
+            events.prop(self.umi_performance, 'write_import_events')
+            if self.umi_performance.write_import_events:
+                events.prop(self.umi_performance, 'import_events_path')
+                events.label(text=self.umi_performance.import_events_file)
+                events.prop(self.umi_performance, 'import_metrics_path')
+                events.label(text=self.umi_performance.import_metrics_file)
+                events.prop(self.umi_performance, 'import_metrics_interval')
+
+            log = box.box()
+            log.label(text='Log', icon='TEXT')
+            log.prop(self.umi_performance, 'log_capacity')
+            log.prop(self.umi_performance, 'log_draw_budget')
+            log.prop(self.umi_performance, 'log_max_size')
+            log.prop(self.umi_performance, 'log_backup_count')
+
+            stats = box.box()
+            stats.label(text='Import Statistics', icon='TIME')
+            stats.prop(self.umi_performance, 'import_stats_path')
+            row = stats.row()
+            row.label(text=self.umi_performance.import_stats_file)
+            row.operator('preferences.umi_clear_import_stats', icon='TRASH')
+
 
 classes = (Preferences,)
 
@@ -0,0 +1,7 @@
+import sys
+from os import path
+
+# The core package doesn't depend on bpy : it is imported on its own, without the add-on package
+ADDON_ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+if ADDON_ROOT not in sys.path:
+    sys.path.insert(0, ADDON_ROOT)
@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from core import Batch, plan_batches
+
+
+def flatten(batches):
+    return [f for b in batches for f in b.filepaths]
+
+
+def check_limits(batches, files, max_batch_size, max_file_count):
+    sizes = dict(files)
+    for batch in batches:
+        assert len(batch.filepaths) <= max_file_count
+        assert batch.size == sum(sizes[f] for f in batch.filepaths)
+        assert batch.size <= max_batch_size or len(batch.filepaths) == 1
+
+
+def test_sequential_keeps_import_order():
+    files = [('a', 4), ('b', 4), ('c', 4), ('d', 1), ('e', 9)]
+    batches = plan_batches(files, max_batch_size=8, max_file_count=10)
+    assert batches == (Batch(('a', 'b'), 8), Batch(('c', 'd'), 5), Batch(('e',), 9))
+
+
+def test_sequential_file_count_limit():
+    files = [(str(i), 1) for i in range(7)]
+    batches = plan_batches(files, max_batch_size=100, max_file_count=3)
+    assert [len(b.filepaths) for b in batches] == [3, 3, 1]
+    assert flatten(batches) == [f for f, _ in files]
+
+
+def test_file_bigger_than_the_limit_gets_its_own_batch():
+    for minimize in (False, True):
+        batches = plan_batches([('small', 1), ('big', 50), ('other', 2)], max_batch_size=10, max_file_count=10, minimize_batch_number=minimize)
+        assert Batch(('big',), 50) in batches
+        check_limits(batches, [('small', 1), ('big', 50), ('other', 2)], 10, 10)
+
+
+def test_zero_file_count_is_treated_as_one():
+    batches = plan_batches([('a', 1), ('b', 1)], max_batch_size=10, max_file_count=0)
+    assert len(batches) == 2
+
+
+def test_empty_selection():
+    assert plan_batches([], max_batch_size=10, max_file_count=10) == ()
+    assert plan_batches([], max_batch_size=10, max_file_count=10, minimize_batch_number=True) == ()
+
+
+def test_best_fit_packs_tighter_than_sequential():
+    files = [('a', 6), ('b', 5), ('c', 4), ('d', 5), ('e', 4), ('f', 6)]
+    sequential = plan_batches(files, max_batch_size=10, max_file_count=10)
+    packed = plan_batches(files, max_batch_size=10, max_file_count=10, minimize_batch_number=True)
+    assert len(sequential) == 4
+    assert len(packed) == 3
+    assert sorted(flatten(packed)) == sorted(f for f, _ in files)
+    check_limits(packed, files, 10, 10)
+
+
+def test_best_fit_places_biggest_files_first():
+    files = [('small', 1), ('big', 9), ('medium', 5)]
+    packed = plan_batches(files, max_batch_size=10, max_file_count=10, minimize_batch_number=True)
+    assert packed[0].filepaths[0] == 'big'
+
+
+@pytest.mark.parametrize('minimize_batch_number', [False, True])
+def test_limits_hold_on_random_selections(minimize_batch_number):
+    rng = random.Random(0)
+    for _ in range(50):
+        files = [(f'file_{i}', rng.randint(0, 20)) for i in range(rng.randint(0, 60))]
+        max_batch_size = rng.randint(1, 40)
+        max_file_count = rng.randint(1, 8)
+        batches = plan_batches(files, max_batch_size, max_file_count, minimize_batch_number=minimize_batch_number)
+        assert sorted(flatten(batches)) == sorted(f for f, _ in files)
+        check_limits(batches, files, max_batch_size, max_file_count)
@@ -0,0 +1,85 @@
+import json
+import math
+
+from core import FileRecord, FileStatus, ImportEventStream, ImportMetrics
+
+
+def read_events(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def read_metrics(filepath):
+    metrics = {}
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('#'):
+                continue
+            name, value = line.rsplit(' ', 1)
+            metrics[name.split('{')[0]] = float(value)
+    return metrics
+
+
+def record(name, size):
+    r = FileRecord(f'/data/{name}', size, 0.0)
+    r.format_name = 'obj'
+    r.module_name = 'default'
+    return r
+
+
+def test_session_events_and_counters(tmp_path):
+    events_file = str(tmp_path / 'events' / 'import.jsonl')
+    metrics_file = str(tmp_path / 'umi.prom')
+    stream = ImportEventStream(events_file, metrics_file, metrics_interval=0, session='test')
+    stream.session_start('import', file_count=3, size_mb=3.0)
+    for name, status in (('a.obj', FileStatus.SUCCEEDED), ('b.obj', FileStatus.FAILED), ('c.obj', FileStatus.SKIPPED)):
+        r = record(name, 1024 * 1024)
+        stream.file_start(r)
+        stream.file_end(r, status, seconds=0.1)
+    stream.command('bpy.ops.object.shade_smooth()', 'a', True, 0.01)
+    stream.session_end('finished')
+
+    events = read_events(events_file)
+    assert [e['event'] for e in events] == ['session_start'] + ['file_start', 'file_end'] * 3 + ['batcher_command', 'session_end']
+    assert {e['session'] for e in events} == {'test'}
+    assert events[-1]['files_failed'] == 1
+    assert events[-1]['files_skipped'] == 1
+
+    metrics = read_metrics(metrics_file)
+    assert metrics['umi_import_running'] == 0
+    assert metrics['umi_import_files_done'] == 3
+    assert metrics['umi_import_megabytes_done'] == 3.0
+    assert metrics['umi_import_commands_done'] == 1
+    assert stream.closed
+
+
+def test_session_end_is_only_written_once(tmp_path):
+    events_file = str(tmp_path / 'import.jsonl')
+    stream = ImportEventStream(events_file)
+    stream.session_start('import')
+    stream.session_end('finished')
+    stream.session_end('interrupted')
+    assert [e['event'] for e in read_events(events_file)] == ['session_start', 'session_end']
+
+
+def test_write_errors_disable_the_output(tmp_path):
+    errors = []
+    # The metrics file can't be written under a regular file
+    blocker = tmp_path / 'file'
+    blocker.write_text('')
+    stream = ImportEventStream(metrics_file=str(blocker / 'umi.prom'), on_error=errors.append)
+    stream.session_start('import')
+    stream.session_end('finished')
+    assert len(errors) == 1
+    assert stream.metrics_file is None
+
+
+def test_metrics_eta():
+    metrics = ImportMetrics('test')
+    metrics.megabytes_total = 10.0
+    assert math.isnan(metrics.eta)
+    metrics.megabytes_done = 10.0
+    assert metrics.eta == 0.0
+    text = metrics.to_prometheus()
+    assert 'umi_import_eta_seconds{session="test"} 0.0' in text
+    assert '# TYPE umi_import_files_total gauge' in text
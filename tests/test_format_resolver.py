@@ -0,0 +1,44 @@
+import pytest
+
+from core import FormatResolver
+
+FORMATS = [
+    ('obj', {'name': 'obj', 'ext': ['.obj'], 'operator': {'default': {'command': 'bpy.ops.wm.obj_import'}, 'legacy': {'command': 'bpy.ops.import_scene.obj'}}}),
+    ('image', {'name': 'image', 'ext': ['.png', '.jpg', '.JPEG'], 'operator': {'default': {'command': 'bpy.ops.image.open'}}}),
+    ('other', {'name': 'other', 'ext': ['.png', '.xyz'], 'operator': {'default': {'command': 'bpy.ops.import_scene.xyz'}}}),
+    ('__doc__', 'not a format'),
+]
+
+
+@pytest.fixture
+def resolver():
+    return FormatResolver(FORMATS)
+
+
+def test_resolves_extensions_case_insensitively(resolver):
+    assert resolver.format_from_extension('.obj')['name'] == 'obj'
+    assert resolver.format_from_extension('.OBJ')['name'] == 'obj'
+    assert resolver.format_from_extension('.jpeg')['name'] == 'image'
+    assert resolver.format_from_extension('.fbx') is None
+    assert resolver.operators_from_extension('.fbx') is None
+
+
+def test_first_format_declaring_an_extension_wins(resolver):
+    assert resolver.format_from_extension('.png')['name'] == 'image'
+    assert resolver.format_from_extension('.xyz')['name'] == 'other'
+
+
+def test_extensions(resolver):
+    assert resolver.extensions == ('.obj', '.png', '.jpg', '.JPEG', '.png', '.xyz')
+    assert resolver.extension_set == frozenset({'.obj', '.png', '.jpg', '.jpeg', '.xyz'})
+    assert resolver.is_supported('.Png')
+    assert not resolver.is_supported('.txt')
+
+
+def test_module_table_is_read_only(resolver):
+    operators = resolver.operators_from_extension('.obj')
+    assert list(operators.keys()) == ['default', 'legacy']
+    with pytest.raises(TypeError):
+        operators['new'] = {}
+    with pytest.raises(TypeError):
+        resolver._index['.fbx'] = None
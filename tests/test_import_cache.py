@@ -0,0 +1,129 @@
+import os
+from os import path
+
+import pytest
+
+from core import ImportCache, clear_import_cache, hash_settings, stat_file
+
+
+def write(filepath, content):
+    with open(filepath, 'wb') as f:
+        f.write(content)
+
+
+def store(cache, key, size):
+    write(cache.prepare(key), b'0' * size)
+    cache.add(key)
+
+
+@pytest.fixture
+def source(tmp_path):
+    filepath = str(tmp_path / 'model.obj')
+    write(filepath, b'v 0 0 0\n')
+    return filepath
+
+
+@pytest.mark.parametrize('hash_content', [False, True])
+def test_key_depends_on_format_module_and_settings(tmp_path, source, hash_content):
+    cache = ImportCache(str(tmp_path / 'cache'), 10, hash_content=hash_content)
+    record = stat_file(source)
+    key = cache.key(record, 'obj', 'default', hash_settings({'scale': 1.0}))
+    assert key == cache.key(record, 'obj', 'default', hash_settings({'scale': 1.0}))
+    assert key != cache.key(record, 'obj', 'legacy', hash_settings({'scale': 1.0}))
+    assert key != cache.key(record, 'obj', 'default', hash_settings({'scale': 2.0}))
+
+
+def test_key_follows_files_rewritten_in_place(tmp_path, source):
+    cache = ImportCache(str(tmp_path / 'cache'), 10)
+    # The record keeps the size and mtime of the scan, as records read from the scan index do
+    record = stat_file(source)
+    key = cache.key(record, 'obj', 'default', '')
+    write(source, b'v 0 0 0\nv 1 1 1\n')
+    assert cache.key(record, 'obj', 'default', '') != key
+
+
+def test_content_key_ignores_the_file_location(tmp_path, source):
+    cache = ImportCache(str(tmp_path / 'cache'), 10, hash_content=True)
+    copy = str(tmp_path / 'copy.obj')
+    write(copy, open(source, 'rb').read())
+    assert cache.key(stat_file(source), 'obj', 'default', '') == cache.key(stat_file(copy), 'obj', 'default', '')
+
+
+def test_hash_settings_ignores_key_order():
+    assert hash_settings({'a': 1, 'b': 2}) == hash_settings({'b': 2, 'a': 1})
+    assert hash_settings({'a': 1}) != hash_settings({'a': 2})
+
+
+def test_lookup_hit_and_miss(tmp_path):
+    cache = ImportCache(str(tmp_path / 'cache'), 10)
+    assert cache.lookup('ab' * 20) is None
+    store(cache, 'ab' * 20, 10)
+    assert cache.lookup('ab' * 20) == cache.entry_path('ab' * 20)
+    assert (cache.hits, cache.misses, cache.stored, cache.stored_size) == (1, 1, 1, 10)
+
+
+def test_lookup_drops_entries_without_file(tmp_path):
+    cache = ImportCache(str(tmp_path / 'cache'), 10)
+    store(cache, 'cd' * 20, 10)
+    os.remove(cache.entry_path('cd' * 20))
+    assert cache.lookup('cd' * 20) is None
+    assert 'cd' * 20 not in cache.entries
+
+
+def test_evicts_least_recently_used(tmp_path):
+    # 100 bytes
+    cache = ImportCache(str(tmp_path / 'cache'), 100 / (1024 * 1024))
+    for i, key in enumerate(('a1' * 20, 'b2' * 20)):
+        store(cache, key, 40)
+        cache.entries[key].last_used = i
+
+    # The oldest entry is used again : the other one goes first
+    cache.entries['a1' * 20].last_used = 10
+    store(cache, 'c3' * 20, 40)
+
+    assert set(cache.entries) == {'a1' * 20, 'c3' * 20}
+    assert not path.exists(cache.entry_path('b2' * 20))
+    assert cache.total_size <= cache.max_size
+
+
+def test_index_save_and_load(tmp_path):
+    cache_folder = str(tmp_path / 'cache')
+    cache = ImportCache(cache_folder, 10)
+    store(cache, 'ef' * 20, 12)
+    cache.save()
+
+    loaded = ImportCache(cache_folder, 10)
+    assert loaded.entries['ef' * 20].size == 12
+    assert loaded.lookup('ef' * 20) is not None
+
+
+def test_clear_import_cache(tmp_path):
+    cache_folder = str(tmp_path / 'cache')
+    cache = ImportCache(cache_folder, 10)
+    store(cache, 'ef' * 20, 12)
+    assert clear_import_cache(cache_folder)
+    assert not clear_import_cache(cache_folder)
+
+
+@pytest.mark.parametrize('content', [
+    '[1, 2]',
+    '{"version": 1, "entries": [1, 2]}',
+    '{"version": 1, "entries": {"ab": 3}}',
+    '{"version": 1, "entries": {"ab": {"unknown": 1}}}',
+    '{"version": 0, "entries": {}}',
+    '{"version": 1, "entr',
+])
+def test_malformed_index_starts_empty(tmp_path, content):
+    cache_folder = tmp_path / 'cache'
+    cache_folder.mkdir()
+    (cache_folder / 'index.json').write_text(content)
+    cache = ImportCache(str(cache_folder), 10)
+    assert cache.entries == {}
+    assert cache.lookup('ab') is None
+
+
+def test_malformed_entries_are_skipped(tmp_path):
+    cache_folder = tmp_path / 'cache'
+    cache_folder.mkdir()
+    (cache_folder / 'index.json').write_text('{"version": 1, "entries": {"a": {"size": 1, "last_used": 2.0}, "b": {"bad": 1}, "c": null}}')
+    assert set(ImportCache(str(cache_folder), 10).entries) == {'a'}
@@ -0,0 +1,36 @@
+import csv, json
+from types import SimpleNamespace
+
+from core import import_profiler
+from core.import_profiler import ImportProfiler
+
+
+def record(name='a.fbx', size_mb=2.0):
+    return SimpleNamespace(path=f'/files/{name}', name=name, format_name='fbx', module_name='default', size_mb=size_mb)
+
+
+def test_unmeasured_memory_is_left_empty(tmp_path, monkeypatch):
+    monkeypatch.setattr(import_profiler, 'current_rss_mb', lambda: None)
+    profiler = ImportProfiler()
+    profile = profiler.start_file(record())
+    profiler.end_file(profile, record(), True, 1.5)
+
+    profiler.write_csv(str(tmp_path / 'profile.csv'))
+    with open(tmp_path / 'profile.csv', encoding='utf-8', newline='') as f:
+        row = next(csv.DictReader(f))
+    assert row['rss_before_mb'] == '' and row['rss_after_mb'] == ''
+    assert row['total_seconds'] == '1.5'
+
+    profiler.write_jsonl(str(tmp_path / 'profile.jsonl'))
+    data = json.loads((tmp_path / 'profile.jsonl').read_text().splitlines()[0])
+    assert data['rss_before_mb'] is None and data['rss_after_mb'] is None
+    assert profiler.summary_lines()[0].startswith('fbx/default : 1 file(s)')
+
+
+def test_measured_memory_is_written(tmp_path, monkeypatch):
+    monkeypatch.setattr(import_profiler, 'current_rss_mb', lambda: 128.0)
+    profiler = ImportProfiler()
+    profile = profiler.start_file(record())
+    profiler.end_file(profile, record(), True, 1.0)
+    assert profile.to_dict()['rss_before_mb'] == 128.0
+    assert profile.to_dict()['rss_after_mb'] == 128.0
@@ -0,0 +1,97 @@
+import json
+
+import pytest
+
+from core import ImportStats, Throughput, clear_import_stats
+from core.import_stats import DEFAULT_SECONDS_PER_FILE, DEFAULT_SECONDS_PER_MB
+
+
+def test_throughput_fits_a_linear_model():
+    throughput = Throughput()
+    for size_mb in (1, 2, 4, 8):
+        throughput.add(size_mb, 0.1 + 0.5 * size_mb)
+    seconds_per_file, seconds_per_mb = throughput.coefficients
+    assert seconds_per_file == pytest.approx(0.1)
+    assert seconds_per_mb == pytest.approx(0.5)
+    assert throughput.predict(10) == pytest.approx(5.1)
+
+
+def test_throughput_without_size_spread_is_proportional():
+    throughput = Throughput()
+    throughput.add(2, 1.0)
+    throughput.add(2, 3.0)
+    assert throughput.coefficients == (0.0, pytest.approx(1.0))
+
+
+def test_decay_favours_recent_samples():
+    decayed = Throughput()
+    for _ in range(50):
+        decayed.add(1, 1.0, decay=0.5)
+    for _ in range(5):
+        decayed.add(1, 3.0, decay=0.5)
+    # After a few slow imports, the model is close to the new speed
+    assert decayed.predict(1) > 2.9
+
+    kept = Throughput()
+    for _ in range(50):
+        kept.add(1, 1.0)
+    for _ in range(5):
+        kept.add(1, 3.0)
+    assert kept.predict(1) < 1.5
+
+
+def test_predict_falls_back_on_known_formats_then_defaults(tmp_path):
+    stats = ImportStats(str(tmp_path / 'stats.json'))
+    assert stats.predict('obj', 'default', 2) == pytest.approx(DEFAULT_SECONDS_PER_FILE + DEFAULT_SECONDS_PER_MB * 2)
+
+    stats.record('fbx', 'default', 4, 2.0)
+    assert stats.predict('obj', 'default', 2) == pytest.approx(DEFAULT_SECONDS_PER_FILE + 1.0)
+    assert stats.predict('fbx', 'default', 4) == pytest.approx(2.0)
+
+
+def test_save_and_load(tmp_path):
+    stats_path = str(tmp_path / 'folder' / 'stats.json')
+    stats = ImportStats(stats_path, decay=0.9)
+    stats.record('obj', 'default', 1, 0.5)
+    stats.record('obj', 'default', 3, 1.5)
+    stats.save_changes()
+
+    loaded = ImportStats(stats_path)
+    assert loaded.throughputs.keys() == stats.throughputs.keys()
+    assert loaded.throughputs['obj/default'].to_dict() == stats.throughputs['obj/default'].to_dict()
+    assert not loaded.changed
+
+
+def test_save_changes_only_writes_recorded_imports(tmp_path):
+    stats_path = tmp_path / 'stats.json'
+    stats = ImportStats(str(stats_path))
+    stats.save_changes()
+    assert not stats_path.exists()
+
+    stats.record('obj', 'default', 1, 0.5)
+    stats.save_changes()
+    assert stats_path.exists()
+    assert not stats.changed
+
+
+@pytest.mark.parametrize('content', [
+    '{"version": 1, "throughputs": {"obj/default": {"unknown": 1}}}',
+    '{"version": 1, "throughputs": {"obj/default": 3}}',
+    '{"version": 1, "throughputs": [1, 2]}',
+    '{"version": 0, "throughputs": {}}',
+    '[1, 2]',
+    '{"version": 1, "throughp',
+])
+def test_malformed_stats_file_starts_empty(tmp_path, content):
+    stats_path = tmp_path / 'stats.json'
+    stats_path.write_text(content)
+    stats = ImportStats(str(stats_path))
+    assert stats.throughputs == {}
+    assert stats.predict('obj', 'default', 1) > 0
+
+
+def test_clear_import_stats(tmp_path):
+    stats_path = tmp_path / 'stats.json'
+    stats_path.write_text(json.dumps({'version': 1, 'throughputs': {}}))
+    assert clear_import_stats(str(stats_path))
+    assert not clear_import_stats(str(stats_path))
@@ -0,0 +1,40 @@
+from core import MessageLevel, MessageStore, insert_str, split_str
+
+
+def test_keeps_the_last_lines_only():
+    store = MessageStore(capacity=3)
+    for i in range(5):
+        store.append(f'line {i}')
+    assert [m.message for m in store] == ['line 2', 'line 3', 'line 4']
+    assert store.count == 5
+    assert store.capacity == 3
+
+
+def test_long_messages_are_split_in_lines():
+    store = MessageStore(capacity=10, line_length=4)
+    store.append('abcdefghij', level=MessageLevel.ERROR)
+    assert [m.message for m in store] == ['abcd', 'efgh', 'ij']
+    assert {m.level for m in store} == {MessageLevel.ERROR}
+    assert store.count == 1
+
+
+def test_empty_messages_are_not_displayed():
+    store = MessageStore()
+    store.append('')
+    assert len(store) == 0
+    assert store.count == 1
+
+
+def test_indexing_and_reverse_order():
+    store = MessageStore()
+    for i in range(3):
+        store.append(str(i))
+    assert store[-1].message == '2'
+    assert [m.message for m in reversed(store)] == ['2', '1', '0']
+    assert store[0].level == MessageLevel.INFO
+
+
+def test_split_helpers():
+    assert split_str('abcde', 2) == ['ab', 'cd', 'e']
+    assert split_str('', 2) == []
+    assert insert_str('abcde', each=2) == 'ab\ncd\ne'
@@ -0,0 +1,34 @@
+import json
+
+from core import from_json_value, hash_settings, to_json_value
+from core.worker_pool import decode_event, encode_event
+
+
+def round_trip(kwargs):
+    # Import plan arguments as sent to the background workers
+    data = json.loads(json.dumps({k: to_json_value(v) for k, v in kwargs.items()}))
+    return {k: from_json_value(v) for k, v in data.items()}
+
+
+def test_plan_arguments_survive_json():
+    kwargs = {'global_scale': 1.5, 'use_smooth': True, 'axis_forward': '-Z', 'bake_space_transform': False,
+              'object_types': {'MESH', 'EMPTY'}, 'files': [{'name': 'a.png'}]}
+    assert round_trip(kwargs) == kwargs
+
+
+def test_vectors_become_lists():
+    assert round_trip({'offset': (1.0, 2.0, 3.0)}) == {'offset': [1.0, 2.0, 3.0]}
+
+
+def test_settings_hash_is_stable_for_enum_flags():
+    # Sets have no order : the hash of the plan must not depend on it
+    first = {k: to_json_value(v) for k, v in {'object_types': {'MESH', 'EMPTY', 'ARMATURE'}}.items()}
+    second = {k: to_json_value(v) for k, v in {'object_types': {'ARMATURE', 'MESH', 'EMPTY'}}.items()}
+    assert hash_settings(first) == hash_settings(second)
+
+
+def test_worker_events():
+    line = encode_event('imported', file='a.obj', success=True)
+    assert decode_event(line) == {'event': 'imported', 'file': 'a.obj', 'success': True}
+    assert decode_event('Blender log line') is None
+    assert decode_event(line[:-3]) is None
@@ -0,0 +1,163 @@
+import os
+from os import path
+
+import pytest
+
+from core import FolderScanner, ScanIndex, clear_scan_index
+
+EXTENSIONS = {'.obj', '.fbx'}
+
+
+def write(filepath, size=1):
+    os.makedirs(path.dirname(filepath), exist_ok=True)
+    with open(filepath, 'wb') as f:
+        f.write(b'0' * size)
+
+
+def touch_folder(folder):
+    # Folder mtimes can have a coarse resolution : move them forward explicitly
+    stats = os.stat(folder)
+    os.utime(folder, ns=(stats.st_atime_ns, stats.st_mtime_ns + 10 ** 9))
+
+
+def scan(root, index=None, thread_count=1, recursion_depth=2):
+    return [r.path for r in FolderScanner(thread_count=thread_count, index=index).scan(root, EXTENSIONS, recursion_depth=recursion_depth)]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = str(tmp_path / 'root')
+    write(path.join(root, 'a.obj'))
+    write(path.join(root, 'b.txt'))
+    write(path.join(root, 'c.FBX'))
+    write(path.join(root, 'sub', 'd.obj'))
+    write(path.join(root, 'sub', 'deep', 'e.fbx'))
+    return root
+
+
+def test_scanner_filters_extensions_and_depth(tree):
+    found = scan(tree, recursion_depth=0)
+    assert sorted(path.basename(p) for p in found) == ['a.obj', 'c.FBX']
+    assert len(scan(tree, recursion_depth=1)) == 3
+    assert len(scan(tree, recursion_depth=2)) == 4
+
+
+def test_parallel_scan_keeps_the_sequential_order(tree):
+    assert scan(tree, thread_count=4) == scan(tree)
+
+
+def test_scanner_reports_unreadable_folder(tmp_path):
+    errors = []
+    records = list(FolderScanner().scan(str(tmp_path / 'missing'), EXTENSIONS, on_error=errors.append))
+    assert records == []
+    assert len(errors) == 1
+
+
+def test_index_reuses_unchanged_folders(tree, tmp_path):
+    index_path = str(tmp_path / 'index.db')
+    with ScanIndex(index_path) as index:
+        first = scan(tree, index)
+        assert index.scanned_folders == 3
+        assert index.reused_folders == 0
+
+    with ScanIndex(index_path) as index:
+        assert scan(tree, index) == first
+        assert index.scanned_folders == 0
+        assert index.reused_folders == 3
+
+
+def test_index_rescans_changed_folder(tree, tmp_path):
+    index_path = str(tmp_path / 'index.db')
+    with ScanIndex(index_path) as index:
+        scan(tree, index)
+
+    write(path.join(tree, 'sub', 'new.obj'))
+    touch_folder(path.join(tree, 'sub'))
+
+    with ScanIndex(index_path) as index:
+        found = scan(tree, index)
+        assert index.scanned_folders == 1
+        assert index.reused_folders == 2
+    assert path.join(tree, 'sub', 'new.obj') in found
+    assert found == scan(tree)
+
+
+def test_index_forgets_removed_subfolders(tree, tmp_path):
+    index_path = str(tmp_path / 'index.db')
+    with ScanIndex(index_path) as index:
+        scan(tree, index)
+
+    deep = path.join(tree, 'sub', 'deep')
+    os.remove(path.join(deep, 'e.fbx'))
+    os.rmdir(deep)
+    touch_folder(path.join(tree, 'sub'))
+
+    with ScanIndex(index_path) as index:
+        found = scan(tree, index)
+        remaining = index._connection.execute('SELECT COUNT(*) FROM folders WHERE path = ?', (deep,)).fetchone()[0]
+    assert remaining == 0
+    assert path.join(deep, 'e.fbx') not in found
+
+
+def test_index_records_keep_sizes(tree, tmp_path):
+    with ScanIndex(str(tmp_path / 'index.db')) as index:
+        scan(tree, index)
+        records = list(FolderScanner(index=index).scan(tree, EXTENSIONS))
+    assert {r.name: r.size for r in records} == {'a.obj': 1, 'c.FBX': 1}
+
+
+def test_clear_scan_index(tmp_path):
+    index_path = str(tmp_path / 'index.db')
+    ScanIndex(index_path).close()
+    assert clear_scan_index(index_path)
+    assert not clear_scan_index(index_path)
+
+
+@pytest.mark.parametrize('thread_count', [1, 4])
+def test_scanner_yields_a_marker_after_each_folder(tmp_path, thread_count):
+    root = str(tmp_path / 'root')
+    for i in range(3):
+        os.makedirs(path.join(root, f'empty_{i}'))
+    write(path.join(root, 'a.obj'))
+    found = list(FolderScanner(thread_count=thread_count).scan(root, EXTENSIONS, recursion_depth=1, yield_folders=True))
+    assert found.count(None) == 4
+    assert [path.basename(r.path) for r in found if r is not None] == ['a.obj']
+    assert None not in scan(root, thread_count=thread_count)
+
+
+def test_index_does_not_store_failed_listings(tree, tmp_path, monkeypatch):
+    index_path = str(tmp_path / 'index.db')
+    scandir = ScanIndex._scandir
+
+    def failing_scandir(self, folder_path):
+        if folder_path == tree:
+            return [], [PermissionError(13, 'Permission denied', folder_path)]
+        return scandir(self, folder_path)
+
+    monkeypatch.setattr(ScanIndex, '_scandir', failing_scandir)
+    with ScanIndex(index_path) as index:
+        assert scan(tree, index) == []
+
+    # Permissions fixed : the folder mtime didn't change, but the folder is listed again
+    monkeypatch.setattr(ScanIndex, '_scandir', scandir)
+    with ScanIndex(index_path) as index:
+        assert scan(tree, index) == scan(tree)
+
+
+def test_index_forgets_removed_subfolders_with_backslash_separator(tmp_path, monkeypatch):
+    import ntpath
+    from core import scan_index
+    monkeypatch.setattr(scan_index, 'path', ntpath)
+    monkeypatch.setattr(scan_index.os, 'sep', '\\')
+
+    with ScanIndex(str(tmp_path / 'index.db')) as index:
+        index._store('C:\\data', 1, [('sub_1', 1, None, None)])
+        index._store('C:\\data\\sub_1', 1, [('deep', 1, None, None)])
+        index._store('C:\\data\\sub_1\\deep', 1, [('a.obj', 0, 1, 0.0)])
+        index._store('C:\\data\\sub_10', 1, [])
+        index._store('C:\\data', 2, [])
+        folders = {r[0] for r in index._connection.execute('SELECT path FROM folders')}
+        entries = index._connection.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    assert folders == {'C:\\data', 'C:\\data\\sub_10'}
+    assert entries == 0
@@ -0,0 +1,100 @@
+import random
+
+from core import NameRegistry, unique_name, unique_name_clean_func
+
+
+def baseline_unique_name(key, name, name_dict, name_max=-1, clean_func=None, sep=".", register=True):
+    # unique_name as it was before the used names set and the counters, scanning name_dict on each call
+    name_new = name_dict.get(key)
+    if name_new is None:
+        count = 1
+        has_number = False
+        name_dict_values = list(name_dict.values())
+
+        if clean_func is None:
+            name_new = name_new_orig = name
+        else:
+            name_new, has_number = clean_func(name)
+            name_new_orig = name_new
+        if has_number or name_new in name_dict_values:
+            if name_max == -1:
+                while name_new in name_dict_values:
+                    name_new = "%s%s%03d" % (name_new_orig, sep, count)
+                    count += 1
+            else:
+                name_new = name_new[:name_max]
+                while name_new in name_dict_values:
+                    count_str = "%03d" % count
+                    name_new = "%.*s%s%s" % (name_max - (len(count_str) + 1), name_new_orig, sep, count_str)
+                    count += 1
+
+        if register:
+            name_dict[key] = name_new
+
+    return name_new
+
+
+def test_clean_func_strips_number_suffix():
+    assert unique_name_clean_func('Cube.004') == ('Cube', True)
+    assert unique_name_clean_func('Cube.04') == ('Cube.04', False)
+    assert unique_name_clean_func('Cube') == ('Cube', False)
+
+
+def test_unique_name_numbers_duplicates():
+    names = {}
+    assert [unique_name(i, 'Cube', names) for i in range(3)] == ['Cube', 'Cube.001', 'Cube.002']
+    assert unique_name(0, 'Other', names) == 'Cube'
+
+
+def test_unique_name_without_register():
+    registry = NameRegistry()
+    registry.unique_name('a', 'Cube')
+    assert registry.unique_name('b', 'Cube', register=False) == 'Cube.001'
+    assert registry.unique_name('c', 'Cube', register=False) == 'Cube.001'
+    assert 'b' not in registry.names
+
+
+def test_name_max_truncates_before_the_number():
+    names = {}
+    # As in bpy_extras.io_utils, names are only truncated once they collide
+    assert unique_name(0, 'LongName', names, name_max=6) == 'LongName'
+    assert unique_name(1, 'LongName', names, name_max=6) == 'LongNa'
+    assert unique_name(2, 'LongName', names, name_max=6) == 'Lo.001'
+
+
+def test_register_overwrite_frees_the_previous_name():
+    registry = NameRegistry()
+    for i in range(3):
+        registry.unique_name(i, 'Cube')
+    registry.register(1, 'Sphere')
+    assert 'Cube.001' not in registry.used_names
+    assert registry.unique_name(9, 'Cube') == 'Cube.001'
+
+
+def test_register_keeps_names_still_used_by_another_key():
+    registry = NameRegistry()
+    registry.register('a', 'Cube')
+    registry.register('b', 'Cube')
+    registry.register('a', 'Sphere')
+    assert registry.unique_name('c', 'Cube') == 'Cube.001'
+
+
+def test_parity_with_baseline():
+    rng = random.Random(0)
+    bases = ['Cube', 'Cube.001', 'Cube.002', 'Sphere', 'Sphere.010', 'Mesh', 'Armature.123']
+    for _ in range(20):
+        registry = NameRegistry()
+        baseline = {}
+        for _ in range(300):
+            key = rng.randrange(150)
+            name = rng.choice(bases)
+            if rng.random() < 0.05:
+                registry.register(key, name)
+                baseline[key] = name
+                continue
+            options = {'clean_func': unique_name_clean_func if rng.random() < 0.5 else None,
+                       'register': rng.random() < 0.9,
+                       'name_max': rng.choice([-1, -1, 8])}
+            assert registry.unique_name(key, name, **options) == baseline_unique_name(key, name, baseline, **options)
+        assert registry.names == baseline
+        assert registry.used_names == set(baseline.values())
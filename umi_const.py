@@ -4,6 +4,7 @@ import bpy
 ADDON_FOLDER_PATH = os.path.dirname(__file__)
 ADDON_PACKAGE = __package__
 AUTOSAVE_PATH = os.path.join(pathlib.Path(bpy.utils.script_path_user()).parent.absolute(), 'autosave')
+CACHE_PATH = os.path.join(pathlib.Path(bpy.utils.script_path_user()).parent.absolute(), 'cache', 'umi')
 
 if not os.path.exists(AUTOSAVE_PATH):
     print(f'UMI : Creating Autosave Folder : {AUTOSAVE_PATH}')
@@ -15,6 +16,9 @@ def get_prefs():
 def get_umi_settings():
     return get_prefs().umi_settings
 
+def get_umi_performance():
+    return get_prefs().umi_performance
+
 def get_umi_colors():
     try:
         prefs = get_prefs()